@@ -0,0 +1,454 @@
+"""
+hex3DhexGLYph Animation Container - Delta-Encoded Binary Frames
+===============================================================
+
+Compact binary storage for sequences of HexGlyphGeometry frames.
+
+Layout (little endian):
+
+    header      magic 'HXGA', version, precision, frame count, keyframe
+                interval, channel count, path points, block index offset
+    blocks      one zlib-compressed block per keyframe interval: template
+                count, the block's deduplicated channel path sets
+                (channels, points, 3), a keyframe record and delta records
+    index       per block: file offset, compressed size, first frame
+
+Path templates are local to their block, so blocks decode independently and
+the writer never holds more than one block of templates. Within a block each
+template is stored as the XOR of its bit pattern with the previous template,
+byte planes grouped, so smoothly varying paths compress to their changing
+low-order bytes.
+
+Every record starts with a 16-bit change mask followed by the changed
+fields only (a keyframe has all bits set): path template id, active channel,
+diameter, curvature density, smoothness, total volume, scale factor, split
+flag and center point. Random seek decompresses a single block and replays at
+most keyframe_interval - 1 deltas.
+
+precision='exact' stores float64 values and is lossless. precision='compact'
+stores float32 values, smoothness as 16-bit fixed point and float32 paths.
+Both are lossless with respect to their own precision.
+
+NON-CANONICAL EXTENSION: storage utility only, does not modify hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Iterator
+import struct
+import zlib
+import numpy as np
+
+from hex3DhexGLYph import CHANNEL_COUNT, Point3D, ChannelGeometry, HexGlyphGeometry
+
+MAGIC = b'HXGA'
+FORMAT_VERSION = 2
+HEADER = struct.Struct('<4sHBBIIHHQ')
+INDEX_ENTRY = struct.Struct('<QII')
+
+PRECISION_EXACT = 0
+PRECISION_COMPACT = 1
+PRECISIONS = {'exact': PRECISION_EXACT, 'compact': PRECISION_COMPACT}
+
+SMOOTHNESS_SCALE = 65535.0
+
+# Change mask bits, in record field order
+FIELD_TEMPLATE = 1 << 0
+FIELD_ACTIVE = 1 << 1
+FIELD_DIAMETER = 1 << 2
+FIELD_CURVATURE = 1 << 3
+FIELD_SMOOTHNESS = 1 << 4
+FIELD_VOLUME = 1 << 5
+FIELD_SCALE = 1 << 6
+FIELD_SPLIT = 1 << 7
+FIELD_CENTER = 1 << 8
+ALL_FIELDS = (1 << 9) - 1
+
+MASK = struct.Struct('<H')
+TEMPLATE_COUNT = struct.Struct('<I')
+
+@dataclass(frozen=True)
+class FrameRecord:
+    """Per-frame glyph attributes as stored in the container"""
+    template_id: int
+    active_channel: int
+    diameter: float
+    curvature_density: float
+    smoothness: float
+    total_volume: float
+    scale_factor: float
+    split: bool
+    center: Tuple[float, float, float]
+
+_FIELDS = (
+    (FIELD_TEMPLATE, 'template_id'),
+    (FIELD_ACTIVE, 'active_channel'),
+    (FIELD_DIAMETER, 'diameter'),
+    (FIELD_CURVATURE, 'curvature_density'),
+    (FIELD_SMOOTHNESS, 'smoothness'),
+    (FIELD_VOLUME, 'total_volume'),
+    (FIELD_SCALE, 'scale_factor'),
+    (FIELD_SPLIT, 'split'),
+    (FIELD_CENTER, 'center'),
+)
+
+def _field_codecs(precision: int) -> Dict[int, struct.Struct]:
+    """Binary format per field for a precision mode"""
+    real = 'd' if precision == PRECISION_EXACT else 'f'
+    return {
+        FIELD_TEMPLATE: struct.Struct('<I'),
+        FIELD_ACTIVE: struct.Struct('<b'),
+        FIELD_DIAMETER: struct.Struct('<' + real),
+        FIELD_CURVATURE: struct.Struct('<' + real),
+        FIELD_SMOOTHNESS: struct.Struct('<d' if precision == PRECISION_EXACT else '<H'),
+        FIELD_VOLUME: struct.Struct('<' + real),
+        FIELD_SCALE: struct.Struct('<' + real),
+        FIELD_SPLIT: struct.Struct('<B'),
+        FIELD_CENTER: struct.Struct('<3' + real),
+    }
+
+def _quantize(record: FrameRecord, precision: int) -> FrameRecord:
+    """Round a record to the values the container will reproduce"""
+    if precision == PRECISION_EXACT:
+        return record
+    f32 = lambda value: float(np.float32(value))
+    return replace(
+        record,
+        diameter=f32(record.diameter),
+        curvature_density=f32(record.curvature_density),
+        smoothness=round(min(max(record.smoothness, 0.0), 1.0) * SMOOTHNESS_SCALE) / SMOOTHNESS_SCALE,
+        total_volume=f32(record.total_volume),
+        scale_factor=f32(record.scale_factor),
+        center=tuple(f32(v) for v in record.center)
+    )
+
+def _encode(record: FrameRecord, previous: Optional[FrameRecord], codecs) -> bytes:
+    """Encode a record as mask + changed fields"""
+    mask = 0
+    payload = []
+    for bit, name in _FIELDS:
+        value = getattr(record, name)
+        if previous is not None and getattr(previous, name) == value:
+            continue
+        mask |= bit
+        if bit == FIELD_SMOOTHNESS and codecs[bit].format == '<H':
+            payload.append(codecs[bit].pack(int(round(value * SMOOTHNESS_SCALE))))
+        elif bit == FIELD_CENTER:
+            payload.append(codecs[bit].pack(*value))
+        else:
+            payload.append(codecs[bit].pack(value))
+    return MASK.pack(mask) + b''.join(payload)
+
+def _decode(buffer: bytes, offset: int, previous: Optional[FrameRecord],
+            codecs) -> Tuple[FrameRecord, int]:
+    """Decode one record at offset; returns (record, next offset)"""
+    (mask,) = MASK.unpack_from(buffer, offset)
+    offset += MASK.size
+    if previous is None and mask != ALL_FIELDS:
+        raise ValueError("Corrupt animation block: delta record without keyframe")
+
+    values = {}
+    for bit, name in _FIELDS:
+        if not mask & bit:
+            continue
+        codec = codecs[bit]
+        unpacked = codec.unpack_from(buffer, offset)
+        offset += codec.size
+        if bit == FIELD_CENTER:
+            values[name] = tuple(unpacked)
+        elif bit == FIELD_SMOOTHNESS and codec.format == '<H':
+            values[name] = unpacked[0] / SMOOTHNESS_SCALE
+        elif bit == FIELD_SPLIT:
+            values[name] = bool(unpacked[0])
+        else:
+            values[name] = unpacked[0]
+
+    record = FrameRecord(**values) if previous is None else replace(previous, **values)
+    return record, offset
+
+def _path_dtype(precision: int):
+    return np.float64 if precision == PRECISION_EXACT else np.float32
+
+def _pack_templates(templates: List[np.ndarray]) -> bytes:
+    """XOR-delta consecutive templates and group bytes by significance"""
+    if not templates:
+        return b''
+    stacked = np.stack(templates)
+    bits = stacked.view(np.uint64 if stacked.dtype == np.float64 else np.uint32)
+    delta = bits.copy()
+    delta[1:] ^= bits[:-1]
+    return delta.view(np.uint8).reshape(-1, stacked.itemsize).T.tobytes()
+
+def _unpack_templates(buffer: bytes, offset: int, count: int, shape: Tuple[int, int],
+                      precision: int) -> Tuple[np.ndarray, int]:
+    """Inverse of _pack_templates; returns (templates, next offset)"""
+    dtype = np.dtype(_path_dtype(precision))
+    size = count * shape[0] * shape[1] * 3 * dtype.itemsize
+    planes = np.frombuffer(buffer, dtype=np.uint8, count=size, offset=offset)
+    delta = planes.reshape(dtype.itemsize, -1).T.copy().view(
+        np.uint64 if dtype == np.float64 else np.uint32)
+    bits = np.bitwise_xor.accumulate(delta.reshape(count, shape[0], shape[1], 3), axis=0)
+    return bits.view(dtype), offset + size
+
+class GlyphAnimationWriter:
+    """Streaming writer: frames are buffered only up to one keyframe block"""
+
+    def __init__(self, path, keyframe_interval: int = 64, precision: str = 'compact',
+                 compression_level: int = 6):
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {sorted(PRECISIONS)}")
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be ≥ 1")
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.precision = PRECISIONS[precision]
+        self.compression_level = compression_level
+        self._codecs = _field_codecs(self.precision)
+
+        self._file = open(path, 'wb')
+        self._file.write(b'\0' * HEADER.size)
+        self._frame_count = 0
+        self._num_points = None
+        self._block_templates: List[np.ndarray] = []
+        self._template_ids: Dict[bytes, int] = {}
+        self._path_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._index: List[Tuple[int, int, int]] = []
+        self._block: List[bytes] = []
+        self._block_first = 0
+        self._previous: Optional[FrameRecord] = None
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    def __enter__(self) -> 'GlyphAnimationWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _template_id(self, channels: Tuple[ChannelGeometry, ...]) -> int:
+        """Block-local id of the channel path set; shared path objects skip conversion"""
+        identity = tuple(id(ch.center_path) for ch in channels)
+        cached = self._path_cache.get(identity)
+        if cached is not None and all(a is b.center_path for a, b in zip(cached[0], channels)):
+            self._path_cache.move_to_end(identity)
+            paths, key = cached[1], cached[2]
+        else:
+            paths = np.array([[(p.x, p.y, p.z) for p in ch.center_path] for ch in channels],
+                             dtype=_path_dtype(self.precision))
+            if self._num_points is None:
+                self._num_points = paths.shape[1]
+            elif paths.shape[1] != self._num_points:
+                raise ValueError("All frames must use the same number of path points")
+            key = paths.tobytes()
+            self._path_cache[identity] = (tuple(ch.center_path for ch in channels), paths, key)
+            if len(self._path_cache) > 256:
+                self._path_cache.popitem(last=False)
+
+        template_id = self._template_ids.get(key)
+        if template_id is None:
+            template_id = len(self._block_templates)
+            self._template_ids[key] = template_id
+            self._block_templates.append(paths)
+        return template_id
+
+    def add_frame(self, geometry):
+        """Append a HexGlyphGeometry (or split tuple) frame"""
+        split = isinstance(geometry, tuple)
+        if split:
+            geometry = geometry[0]
+
+        channels = geometry.channels
+        if len(channels) != CHANNEL_COUNT:
+            raise ValueError(f"Expected {CHANNEL_COUNT} channels, got {len(channels)}")
+        first = channels[0]
+        for channel in channels[1:]:
+            if (channel.diameter != first.diameter or
+                    channel.curvature_density != first.curvature_density or
+                    channel.smoothness != first.smoothness):
+                raise ValueError("Channels must share diameter, curvature and smoothness")
+
+        if len(self._block) == self.keyframe_interval:
+            self._flush_block()
+
+        active = [ch.channel_id for ch in channels if ch.is_active]
+        center = geometry.center_point
+        record = _quantize(FrameRecord(
+            template_id=self._template_id(channels),
+            active_channel=active[0] if len(active) == 1 else -1,
+            diameter=first.diameter,
+            curvature_density=first.curvature_density,
+            smoothness=first.smoothness,
+            total_volume=geometry.total_volume,
+            scale_factor=geometry.scale_factor,
+            split=split,
+            center=(center.x, center.y, center.z)
+        ), self.precision)
+
+        keyframe = not self._block
+        self._block.append(_encode(record, None if keyframe else self._previous, self._codecs))
+        self._previous = record
+        self._frame_count += 1
+
+    def _flush_block(self):
+        if not self._block:
+            return
+        payload = (TEMPLATE_COUNT.pack(len(self._block_templates)) +
+                   _pack_templates(self._block_templates) + b''.join(self._block))
+        data = zlib.compress(payload, self.compression_level)
+        self._index.append((self._file.tell(), len(data), self._block_first))
+        self._file.write(data)
+        self._block_first += len(self._block)
+        self._block = []
+        self._block_templates = []
+        self._template_ids = {}
+
+    def close(self):
+        """Write the last block, block index and header"""
+        if self._file.closed:
+            return
+        self._flush_block()
+
+        index_offset = self._file.tell()
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+
+        self._file.seek(0)
+        self._file.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.precision, 0, self._frame_count,
+            self.keyframe_interval, CHANNEL_COUNT, self._num_points or 0, index_offset
+        ))
+        self._file.close()
+
+class _Block:
+    """Decoded block: records plus lazily materialized template paths"""
+
+    def __init__(self, records: List[FrameRecord], templates: np.ndarray):
+        self.records = records
+        self.templates = templates
+        self._paths: Dict[int, List[List[Point3D]]] = {}
+
+    def paths(self, template_id: int) -> List[List[Point3D]]:
+        """Materialized center paths, shared by all frames using the template"""
+        paths = self._paths.get(template_id)
+        if paths is None:
+            paths = [[Point3D(float(x), float(y), float(z)) for x, y, z in channel]
+                     for channel in self.templates[template_id].tolist()]
+            self._paths[template_id] = paths
+        return paths
+
+class GlyphAnimationReader:
+    """Random-access reader for glyph animation containers"""
+
+    def __init__(self, path, block_cache: int = 4):
+        self._file = open(path, 'rb')
+        (magic, version, precision, _, frame_count, keyframe_interval, channel_count,
+         num_points, index_offset) = HEADER.unpack(
+            self._file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Not a hex3DhexGLYph animation container")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported container version {version}")
+
+        self.precision = precision
+        self.frame_count = frame_count
+        self.keyframe_interval = keyframe_interval
+        self.channel_count = channel_count
+        self.num_points = num_points
+        self._codecs = _field_codecs(precision)
+
+        block_count = -(-frame_count // keyframe_interval) if frame_count else 0
+        self._file.seek(index_offset)
+        raw = self._file.read(block_count * INDEX_ENTRY.size)
+        self._index = [INDEX_ENTRY.unpack_from(raw, i * INDEX_ENTRY.size) for i in range(block_count)]
+
+        self._block_cache_size = block_cache
+        self._blocks: 'OrderedDict[int, _Block]' = OrderedDict()
+
+    def __enter__(self) -> 'GlyphAnimationReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def _block(self, block: int) -> '_Block':
+        cached = self._blocks.get(block)
+        if cached is not None:
+            self._blocks.move_to_end(block)
+            return cached
+
+        offset, size, first = self._index[block]
+        self._file.seek(offset)
+        data = zlib.decompress(self._file.read(size))
+        (template_count,) = TEMPLATE_COUNT.unpack_from(data, 0)
+        templates, position = _unpack_templates(
+            data, TEMPLATE_COUNT.size, template_count,
+            (self.channel_count, self.num_points), self.precision)
+        count = min(self.keyframe_interval, self.frame_count - first)
+        records = []
+        previous = None
+        for _ in range(count):
+            previous, position = _decode(data, position, previous, self._codecs)
+            records.append(previous)
+
+        cached = _Block(records, templates)
+        self._blocks[block] = cached
+        if len(self._blocks) > self._block_cache_size:
+            self._blocks.popitem(last=False)
+        return cached
+
+    def record(self, index: int) -> FrameRecord:
+        """Raw stored attributes of one frame"""
+        if index < 0:
+            index += self.frame_count
+        if not 0 <= index < self.frame_count:
+            raise IndexError(f"Frame {index} out of range")
+        return self._block(index // self.keyframe_interval).records[index % self.keyframe_interval]
+
+    def geometry(self, index: int):
+        """Reconstruct frame index as HexGlyphGeometry (tuple if split)"""
+        record = self.record(index)
+        paths = self._block(index // self.keyframe_interval).paths(record.template_id)
+        channels = tuple(
+            ChannelGeometry(
+                channel_id=channel_id,
+                center_path=paths[channel_id],
+                diameter=record.diameter,
+                curvature_density=record.curvature_density,
+                smoothness=record.smoothness,
+                is_active=(channel_id == record.active_channel)
+            )
+            for channel_id in range(self.channel_count)
+        )
+        geometry = HexGlyphGeometry(
+            channels=channels,
+            total_volume=record.total_volume,
+            traversal_markers=0,
+            center_point=Point3D(*record.center),
+            scale_factor=record.scale_factor
+        )
+        return (geometry, geometry) if record.split else geometry
+
+    def __getitem__(self, index: int):
+        return self.geometry(index)
+
+    def __iter__(self) -> Iterator:
+        for index in range(self.frame_count):
+            yield self.geometry(index)
+
+def write_animation(path, geometries, keyframe_interval: int = 64, precision: str = 'compact') -> int:
+    """Write an iterable of geometries; returns the number of frames written"""
+    with GlyphAnimationWriter(path, keyframe_interval, precision) as writer:
+        for geometry in geometries:
+            writer.add_frame(geometry)
+        return writer.frame_count
@@ -0,0 +1,237 @@
+"""
+hex3DhexGLYph Incremental Updates - Structural Sharing Extension
+================================================================
+
+Incremental re-mapping of consecutive kernel field states Ψ → Ψ' onto an
+existing HexGlyphGeometry. Unchanged ChannelGeometry objects and center paths
+are reused by identity; only the components that actually moved are rebuilt.
+
+NON-CANONICAL EXTENSION: this module does not modify hex3DhexGLYph.py.
+For every (prev_psi, psi) pair the resulting geometry is equal to
+Hex3DGlyph.map_field_state(psi).
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Tuple, List, Union
+import numpy as np
+
+from hex3DhexGLYph import (
+    CHANNEL_COUNT,
+    ChannelGeometry,
+    HexGlyphGeometry,
+    GeometricMapper,
+    ChannelPathGenerator,
+    SplittingGeometry,
+    Hex3DGlyph,
+)
+from hex3DhexGLYph_validation import GeometryStack
+
+GlyphResult = Union[HexGlyphGeometry, Tuple[HexGlyphGeometry, HexGlyphGeometry]]
+
+@dataclass(frozen=True)
+class ChannelDelta:
+    """Changed fields of a single channel"""
+    channel_id: int
+    fields: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class GeometryDiff:
+    """Exact difference between two consecutive glyph geometries"""
+    channel_deltas: Tuple[ChannelDelta, ...]
+    total_volume_changed: bool
+    previous_active_channel: int
+    active_channel: int
+    split_changed: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the geometry is structurally unchanged"""
+        return (not self.channel_deltas and not self.total_volume_changed
+                and not self.split_changed)
+
+    @property
+    def changed_channels(self) -> Tuple[int, ...]:
+        """IDs of channels that were rebuilt"""
+        return tuple(delta.channel_id for delta in self.channel_deltas)
+
+    def to_dict(self) -> dict:
+        """Export diff as dictionary for viewers"""
+        return {
+            'channels': {delta.channel_id: list(delta.fields) for delta in self.channel_deltas},
+            'total_volume_changed': self.total_volume_changed,
+            'previous_active_channel': self.previous_active_channel,
+            'active_channel': self.active_channel,
+            'split_changed': self.split_changed
+        }
+
+def _base_geometry(geometry: GlyphResult) -> HexGlyphGeometry:
+    """Unwrap split geometries; both branches share the same channels"""
+    if isinstance(geometry, tuple):
+        return geometry[0]
+    return geometry
+
+def _active_channel_of(geometry: HexGlyphGeometry) -> int:
+    """Active channel ID of a geometry (-1 if none)"""
+    for channel in geometry.channels:
+        if channel.is_active:
+            return channel.channel_id
+    return -1
+
+class IncrementalHex3DGlyph(Hex3DGlyph):
+    """Hex3DGlyph with incremental, structurally shared state updates"""
+
+    def update_geometry(self, prev_geometry: GlyphResult, prev_psi, psi) -> Tuple[GlyphResult, GeometryDiff]:
+        """Map psi reusing unchanged parts of prev_geometry
+
+        prev_geometry must be the result of mapping prev_psi with this glyph.
+        Returns the new geometry and a diff describing exactly what changed.
+        """
+        prev = _base_geometry(prev_geometry)
+        if len(prev.channels) != CHANNEL_COUNT or prev.scale_factor != self.base_scale:
+            raise ValueError("prev_geometry was not produced by this glyph configuration")
+
+        prev_channel = prev.channels[0]
+
+        # Re-evaluate only mappings whose source component changed
+        if psi.dPhi == prev_psi.dPhi:
+            diameter = prev_channel.diameter
+        else:
+            diameter = GeometricMapper.map_dphi_to_diameter(psi.dPhi)
+
+        if psi.kappa == prev_psi.kappa:
+            curvature_density = prev_channel.curvature_density
+        else:
+            curvature_density = GeometricMapper.map_kappa_to_curvature(psi.kappa)
+
+        if psi.C == prev_psi.C:
+            smoothness = prev_channel.smoothness
+        else:
+            smoothness = GeometricMapper.map_coherence_to_smoothness(psi.C)
+
+        if psi.N == prev_psi.N:
+            total_volume = prev.total_volume
+        else:
+            total_volume = GeometricMapper.map_context_to_volume(psi.N)
+
+        active_channel = GeometricMapper.map_theta_to_channel(psi.theta)
+        previous_active = _active_channel_of(prev)
+
+        # Minimal paths do not depend on curvature; full paths only on curvature
+        paths_changed = (not self.minimal and
+                         curvature_density != prev_channel.curvature_density)
+
+        channels: List[ChannelGeometry] = []
+        deltas: List[ChannelDelta] = []
+        for old in prev.channels:
+            changed = []
+            if diameter != old.diameter:
+                changed.append('diameter')
+            if curvature_density != old.curvature_density:
+                changed.append('curvature_density')
+            if smoothness != old.smoothness:
+                changed.append('smoothness')
+            is_active = (old.channel_id == active_channel)
+            if is_active != old.is_active:
+                changed.append('is_active')
+            if paths_changed:
+                changed.append('center_path')
+
+            if not changed:
+                channels.append(old)
+                continue
+
+            if paths_changed:
+                center_path = ChannelPathGenerator.generate_channel_path(
+                    old.channel_id, curvature_density, minimal=self.minimal
+                )
+            else:
+                center_path = old.center_path
+
+            channels.append(ChannelGeometry(
+                channel_id=old.channel_id,
+                center_path=center_path,
+                diameter=diameter,
+                curvature_density=curvature_density,
+                smoothness=smoothness,
+                is_active=is_active
+            ))
+            deltas.append(ChannelDelta(old.channel_id, tuple(changed)))
+
+        volume_changed = total_volume != prev.total_volume
+        if deltas or volume_changed:
+            geometry = HexGlyphGeometry(
+                channels=tuple(channels),
+                total_volume=total_volume,
+                traversal_markers=0,
+                center_point=self.center,
+                scale_factor=self.base_scale
+            )
+        else:
+            geometry = prev
+
+        was_split = isinstance(prev_geometry, tuple)
+        is_split = self.research_mode and SplittingGeometry.detect_splitting_condition(psi)
+
+        diff = GeometryDiff(
+            channel_deltas=tuple(deltas),
+            total_volume_changed=volume_changed,
+            previous_active_channel=previous_active,
+            active_channel=active_channel,
+            split_changed=(was_split != is_split)
+        )
+
+        if is_split:
+            if was_split and geometry is prev:
+                return prev_geometry, diff
+            return SplittingGeometry.generate_split_geometry(geometry, active_channel), diff
+        return geometry, diff
+
+    def map_trajectory(self, trajectory: List) -> Tuple[List[GlyphResult], List[GeometryDiff]]:
+        """Map a state sequence, sharing structure between consecutive frames"""
+        if not trajectory:
+            return [], []
+
+        geometries = [self.map_field_state(trajectory[0])]
+        diffs: List[GeometryDiff] = []
+        for prev_psi, psi in zip(trajectory, trajectory[1:]):
+            geometry, diff = self.update_geometry(geometries[-1], prev_psi, psi)
+            geometries.append(geometry)
+            diffs.append(diff)
+
+        return geometries, diffs
+
+    @staticmethod
+    def trajectory_stack(geometries: List[GlyphResult], diffs: List[GeometryDiff]) -> GeometryStack:
+        """Stacked view of a map_trajectory result for BatchIsomorphismValidator
+
+        Reads one channel per frame and the active channel from the diffs
+        instead of re-stacking every ChannelGeometry.
+        """
+        if len(diffs) != max(len(geometries) - 1, 0):
+            raise ValueError("diffs must be the map_trajectory diffs of geometries")
+        frames = [_base_geometry(g) for g in geometries]
+        first_channels = [frame.channels[0] for frame in frames]
+        count = len(frames)
+
+        def gather(name, items):
+            return np.fromiter(map(attrgetter(name), items), dtype=np.float64, count=count)
+
+        active_channel = np.empty(count, dtype=np.int64)
+        if count:
+            active_channel[0] = _active_channel_of(frames[0])
+            active_channel[1:] = np.fromiter(map(attrgetter('active_channel'), diffs),
+                                             dtype=np.int64, count=count - 1)
+        return GeometryStack.from_uniform_channels(
+            total_volume=gather('total_volume', frames),
+            active_channel=active_channel,
+            curvature_density=gather('curvature_density', first_channels),
+            smoothness=gather('smoothness', first_channels)
+        )
+
+def create_incremental_glyph(minimal: bool = True, research_mode: bool = False) -> IncrementalHex3DGlyph:
+    """Create incremental hex3D glyph instance"""
+    return IncrementalHex3DGlyph(base_scale=1.0, minimal=minimal, research_mode=research_mode)
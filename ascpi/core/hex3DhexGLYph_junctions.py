@@ -0,0 +1,145 @@
+"""
+hex3DhexGLYph Smooth Junctions - Batched Hermite Channel Connections
+====================================================================
+
+Smooth replacement for ChannelPathGenerator.create_torus_connection, which
+joins adjacent channels with linearly interpolated points and therefore has
+a tangent discontinuity at every junction.
+
+Each junction k joins the end of channel k to the start of channel k+1
+(ChannelConnectivity order) with a Hermite spline whose end derivatives match
+the finite-difference derivatives of both paths:
+
+- continuity=1: cubic Hermite, matches position and velocity (C1)
+- continuity=2: quintic Hermite, additionally matches acceleration (C2)
+
+Derivatives are taken per path sample step and the junction is parameterized
+to span |p1 - p0| / mean step length steps, so the joined curve is C1/C2 in
+that sample-step parameterization; coincident endpoints (minimal mode) give
+a degenerate junction instead of a loop. The basis matrix is precomputed once
+per sample count, and all six junctions of all frames are evaluated in one
+tensor contraction.
+
+NON-CANONICAL EXTENSION: this module does not modify hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from functools import lru_cache
+from typing import List, Sequence
+import numpy as np
+
+from hex3DhexGLYph import CHANNEL_COUNT, Point3D
+
+# Hermite coefficient matrices: rows are basis functions, columns powers u^0..u^n
+CUBIC_HERMITE = np.array([
+    [1.0, 0.0, -3.0, 2.0],    # p0
+    [0.0, 1.0, -2.0, 1.0],    # v0
+    [0.0, 0.0, -1.0, 1.0],    # v1
+    [0.0, 0.0, 3.0, -2.0],    # p1
+])
+
+QUINTIC_HERMITE = np.array([
+    [1.0, 0.0, 0.0, -10.0, 15.0, -6.0],    # p0
+    [0.0, 1.0, 0.0, -6.0, 8.0, -3.0],      # v0
+    [0.0, 0.0, 0.5, -1.5, 1.5, -0.5],      # a0
+    [0.0, 0.0, 0.0, 0.5, -1.0, 0.5],       # a1
+    [0.0, 0.0, 0.0, -4.0, 7.0, -3.0],      # v1
+    [0.0, 0.0, 0.0, 10.0, -15.0, 6.0],     # p1
+])
+
+@lru_cache(maxsize=None)
+def hermite_basis(samples: int, continuity: int = 1) -> np.ndarray:
+    """Precomputed (samples, controls) basis matrix for u in [0, 1]"""
+    if continuity not in (1, 2):
+        raise ValueError("continuity must be 1 (cubic) or 2 (quintic)")
+    coefficients = CUBIC_HERMITE if continuity == 1 else QUINTIC_HERMITE
+    u = np.linspace(0.0, 1.0, samples)
+    powers = u[:, None] ** np.arange(coefficients.shape[1])[None, :]
+    basis = powers @ coefficients.T
+    basis.setflags(write=False)
+    return basis
+
+def stack_paths(geometries: Sequence) -> np.ndarray:
+    """(frames, channels, points, 3) array of channel center paths"""
+    frames = [g[0] if isinstance(g, tuple) else g for g in geometries]
+    return np.array([[[(p.x, p.y, p.z) for p in ch.center_path] for ch in g.channels]
+                     for g in frames], dtype=np.float64)
+
+class SmoothJunctionGenerator:
+    """Batched C1/C2 junctions between adjacent hexagonal channels"""
+
+    def __init__(self, samples: int = 5, continuity: int = 1):
+        if samples < 2:
+            raise ValueError("A junction needs at least 2 samples")
+        self.samples = samples
+        self.continuity = continuity
+        self.basis = hermite_basis(samples, continuity)
+
+    def junctions(self, paths: np.ndarray) -> np.ndarray:
+        """Evaluate every junction of every frame
+
+        paths: (..., CHANNEL_COUNT, points, 3). Returns (..., CHANNEL_COUNT, samples, 3)
+        where junction k runs from the end of channel k to the start of channel k+1.
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        if paths.shape[-3] != CHANNEL_COUNT:
+            raise ValueError(f"Expected {CHANNEL_COUNT} channels, got {paths.shape[-3]}")
+        if paths.shape[-2] < self.continuity + 1:
+            raise ValueError(f"C{self.continuity} junctions need at least {self.continuity + 1} path points")
+
+        following = np.roll(paths, -1, axis=-3)
+        p0 = paths[..., -1, :]
+        p1 = following[..., 0, :]
+        v0 = paths[..., -1, :] - paths[..., -2, :]
+        v1 = following[..., 1, :] - following[..., 0, :]
+
+        # Junction length in path sample steps
+        step = 0.5 * (np.linalg.norm(v0, axis=-1) + np.linalg.norm(v1, axis=-1))
+        chord = np.linalg.norm(p1 - p0, axis=-1)
+        span = np.where(step > 0.0, chord / np.where(step > 0.0, step, 1.0), 0.0)[..., None]
+
+        if self.continuity == 1:
+            controls = np.stack([p0, v0 * span, v1 * span, p1], axis=-2)
+        else:
+            a0 = paths[..., -1, :] - 2.0 * paths[..., -2, :] + paths[..., -3, :]
+            a1 = following[..., 2, :] - 2.0 * following[..., 1, :] + following[..., 0, :]
+            span_sq = span * span
+            controls = np.stack([p0, v0 * span, a0 * span_sq, a1 * span_sq, v1 * span, p1], axis=-2)
+
+        return np.einsum('sk,...kd->...sd', self.basis, controls)
+
+    def closed_loop(self, paths: np.ndarray) -> np.ndarray:
+        """Full closed torus centerline per frame: channel 0, junction 0, channel 1, ...
+
+        Junction endpoints coinciding with path endpoints are not duplicated.
+        Returns (..., CHANNEL_COUNT · (points + samples - 2), 3).
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        joints = self.junctions(paths)[..., 1:-1, :]
+        loop = np.concatenate([paths, joints], axis=-2)
+        return loop.reshape(*paths.shape[:-3], -1, 3)
+
+def create_smooth_connection(path1: List[Point3D], path2: List[Point3D],
+                             samples: int = 5, continuity: int = 1) -> List[Point3D]:
+    """Smooth single-pair counterpart of ChannelPathGenerator.create_torus_connection"""
+    if len(path1) < continuity + 1 or len(path2) < continuity + 1:
+        return []
+
+    a = np.array([(p.x, p.y, p.z) for p in path1])
+    b = np.array([(p.x, p.y, p.z) for p in path2])
+    p0, p1 = a[-1], b[0]
+    v0, v1 = a[-1] - a[-2], b[1] - b[0]
+    step = 0.5 * (np.linalg.norm(v0) + np.linalg.norm(v1))
+    span = np.linalg.norm(p1 - p0) / step if step > 0.0 else 0.0
+
+    if continuity == 1:
+        controls = np.stack([p0, v0 * span, v1 * span, p1])
+    else:
+        a0 = a[-1] - 2.0 * a[-2] + a[-3]
+        a1 = b[2] - 2.0 * b[1] + b[0]
+        controls = np.stack([p0, v0 * span, a0 * span ** 2, a1 * span ** 2, v1 * span, p1])
+
+    points = hermite_basis(samples, continuity) @ controls
+    return [Point3D(float(x), float(y), float(z)) for x, y, z in points]
@@ -0,0 +1,269 @@
+"""
+hex3DhexGLYph Lattice - Instanced Glyphs on Axial Hex Coordinates
+=================================================================
+
+Places one hexagonal glyph at every node of a hexagonal field-state document
+(axial q, r coordinates as in hexSYStemOPErates/FIRstBUIld/sample_field.json).
+
+Channel center paths are stored once as shared templates; each node only
+carries its instance transform (offset, scale) and its mapped state
+attributes (diameter, curvature density, smoothness, active channel,
+volume) in flat NumPy arrays. The field state → geometry mapping is the
+vectorized equivalent of Hex3DGlyph.map_field_state.
+
+NON-CANONICAL EXTENSION: this module does not modify hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, List, Sequence, Tuple
+import json
+import math
+import numpy as np
+
+from hex3DhexGLYph import (
+    TAU,
+    CHANNEL_COUNT,
+    Point3D,
+    ChannelGeometry,
+    HexGlyphGeometry,
+)
+from hex3DhexGLYph_validation import BatchIsomorphismValidator, GeometryStack
+
+SQRT3 = math.sqrt(3.0)
+
+# Center distance between adjacent glyphs (minimal glyph radius is 1)
+DEFAULT_SPACING = 2.5
+
+def axial_to_cartesian(q: np.ndarray, r: np.ndarray, spacing: float = DEFAULT_SPACING) -> np.ndarray:
+    """Pointy-top axial hex coordinates → (n, 3) centers in the z = 0 plane"""
+    size = spacing / SQRT3
+    offsets = np.zeros((len(q), 3))
+    offsets[:, 0] = size * (SQRT3 * q + 0.5 * SQRT3 * r)
+    offsets[:, 1] = size * (1.5 * r)
+    return offsets
+
+def generate_channel_templates(curvature_density: np.ndarray, num_points: int = 20,
+                               minimal: bool = True) -> np.ndarray:
+    """Vectorized ChannelPathGenerator.generate_channel_path for all channels
+
+    Returns (k, CHANNEL_COUNT, num_points, 3) paths for k curvature values.
+    In minimal mode paths do not depend on curvature and k is always 1.
+    """
+    t = np.arange(num_points) / (num_points - 1)
+    base_angle = np.arange(CHANNEL_COUNT) * TAU / CHANNEL_COUNT
+    angle = base_angle[:, None] + t[None, :] * TAU / CHANNEL_COUNT     # (6, P)
+
+    if minimal:
+        templates = np.zeros((1, CHANNEL_COUNT, num_points, 3))
+        templates[0, :, :, 0] = np.cos(angle)
+        templates[0, :, :, 1] = np.sin(angle)
+        return templates
+
+    kappa = np.asarray(curvature_density, dtype=np.float64)[:, None]   # (k, 1)
+    radius_variation = 1.0 + 0.1 * kappa * np.sin(t[None, :] * TAU * kappa)
+    height_variation = 0.2 * kappa * np.cos(t[None, :] * TAU * kappa * 2)
+
+    templates = np.empty((len(kappa), CHANNEL_COUNT, num_points, 3))
+    templates[..., 0] = radius_variation[:, None, :] * np.cos(angle)[None]
+    templates[..., 1] = radius_variation[:, None, :] * np.sin(angle)[None]
+    templates[..., 2] = height_variation[:, None, :]
+    return templates
+
+@dataclass
+class GlyphLattice:
+    """Instanced glyphs on a hexagonal lattice (struct of arrays)"""
+    q: np.ndarray                  # (n,) int32 axial coordinate
+    r: np.ndarray                  # (n,) int32 axial coordinate
+    offsets: np.ndarray            # (n, 3) instance translation
+    scale: np.ndarray              # (n,) instance scale factor
+    node_ids: Optional[List[str]] = None
+    relations: Optional[np.ndarray] = None   # (m, 2) node index pairs
+    minimal: bool = True
+    num_points: int = 20
+    max_cached_templates: int = 4096
+
+    # Mapped per-node state (filled by map_states)
+    diameter: Optional[np.ndarray] = None
+    curvature_density: Optional[np.ndarray] = None
+    smoothness: Optional[np.ndarray] = None
+    active_channel: Optional[np.ndarray] = None
+    total_volume: Optional[np.ndarray] = None
+
+    # Shared channel path templates and per-node template reference
+    template_curvature: Optional[np.ndarray] = None  # (k,) curvature per template
+    template_index: Optional[np.ndarray] = None      # (n,) int32
+    templates: Optional[np.ndarray] = None           # (k, CHANNEL_COUNT, P, 3) if cached
+
+    @classmethod
+    def from_axial(cls, q: Sequence[int], r: Sequence[int], spacing: float = DEFAULT_SPACING,
+                   base_scale: float = 1.0, minimal: bool = True, **kwargs) -> 'GlyphLattice':
+        """Create lattice from axial coordinate arrays"""
+        q = np.asarray(q, dtype=np.int32)
+        r = np.asarray(r, dtype=np.int32)
+        return cls(
+            q=q,
+            r=r,
+            offsets=axial_to_cartesian(q, r, spacing),
+            scale=np.full(len(q), base_scale),
+            minimal=minimal,
+            **kwargs
+        )
+
+    @classmethod
+    def hexagon(cls, radius: int, **kwargs) -> 'GlyphLattice':
+        """Create a hexagon-shaped lattice with 3·radius·(radius+1)+1 nodes"""
+        axis = np.arange(-radius, radius + 1)
+        q, r = np.meshgrid(axis, axis, indexing='ij')
+        q, r = q.ravel(), r.ravel()
+        inside = np.abs(-q - r) <= radius
+        return cls.from_axial(q[inside], r[inside], **kwargs)
+
+    @classmethod
+    def from_field_document(cls, document: dict, **kwargs) -> 'GlyphLattice':
+        """Create lattice from a hexagonal field-state document
+
+        Accepts nodes with top-level q/r (sample_field.json) or a nested
+        position object (field_state.schema.json).
+        """
+        if document.get('topology') != 'hexagonal':
+            raise ValueError("Field document topology must be 'hexagonal'")
+
+        nodes = document.get('nodes', [])
+        node_ids = [node['id'] for node in nodes]
+        positions = [node.get('position', node) for node in nodes]
+        q = [position['q'] for position in positions]
+        r = [position['r'] for position in positions]
+
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        relations = np.array(
+            [(index[rel['a']], index[rel['b']]) for rel in document.get('relations', [])],
+            dtype=np.int32
+        ).reshape(-1, 2)
+
+        return cls.from_axial(q, r, node_ids=node_ids, relations=relations, **kwargs)
+
+    @classmethod
+    def load(cls, path, **kwargs) -> 'GlyphLattice':
+        """Load lattice from a field-state JSON file"""
+        with open(Path(path)) as f:
+            return cls.from_field_document(json.load(f), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.q)
+
+    def map_states(self, dPhi, kappa, theta, C, N) -> 'GlyphLattice':
+        """Map per-node field state components (arrays or scalars) onto the lattice"""
+        n = len(self)
+        dPhi, kappa, theta, C, N = (np.broadcast_to(np.asarray(v, dtype=np.float64), (n,))
+                                    for v in (dPhi, kappa, theta, C, N))
+
+        with np.errstate(over='ignore'):
+            self.diameter = np.exp(0.5 * dPhi)
+        self.curvature_density = np.maximum(0.0, kappa)
+        self.active_channel = BatchIsomorphismValidator.map_theta_to_channel(theta).astype(np.int8)
+        self.smoothness = np.clip(C, 0.0, 1.0)
+        self.total_volume = np.abs(N)
+
+        if self.minimal:
+            # Minimal paths are independent of curvature: one template for all nodes
+            self.template_curvature = np.zeros(1)
+            self.template_index = np.zeros(n, dtype=np.int32)
+        else:
+            unique_kappa, inverse = np.unique(self.curvature_density, return_inverse=True)
+            self.template_curvature = unique_kappa
+            self.template_index = inverse.astype(np.int32).ravel()
+
+        # Templates beyond the cache budget are generated on demand in world_paths
+        if len(self.template_curvature) <= self.max_cached_templates:
+            self.templates = generate_channel_templates(self.template_curvature,
+                                                        self.num_points, self.minimal)
+        else:
+            self.templates = None
+
+        return self
+
+    def map_psi(self, states: Sequence) -> 'GlyphLattice':
+        """Map one Psi object per node"""
+        n = len(self)
+        if len(states) != n:
+            raise ValueError(f"Expected {n} states, got {len(states)}")
+        return self.map_states(*(np.fromiter((getattr(psi, name) for psi in states),
+                                             dtype=np.float64, count=n)
+                                 for name in ('dPhi', 'kappa', 'theta', 'C', 'N')))
+
+    def _require_mapped(self):
+        if self.template_index is None:
+            raise ValueError("Lattice has no mapped state; call map_states first")
+
+    def world_paths(self, indices) -> np.ndarray:
+        """Instance channel paths in world coordinates: (k, CHANNEL_COUNT, P, 3)
+
+        indices is required: the whole lattice would need
+        nodes × CHANNEL_COUNT × P × 3 floats (~2.9 GB at 10^6 nodes).
+        Use iter_world_paths to walk every node in bounded chunks.
+        """
+        self._require_mapped()
+        indices = np.asarray(indices)
+        template_ids = self.template_index[indices]
+        if self.templates is not None:
+            local = self.templates[template_ids]
+        else:
+            used, inverse = np.unique(template_ids, return_inverse=True)
+            local = generate_channel_templates(self.template_curvature[used],
+                                               self.num_points, self.minimal)[inverse.ravel()]
+        return (local * self.scale[indices, None, None, None] +
+                self.offsets[indices, None, None, :])
+
+    def iter_world_paths(self, chunk_size: int = 4096) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (first node index, world_paths of the next chunk_size nodes)"""
+        self._require_mapped()
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be ≥ 1")
+        for start in range(0, len(self), chunk_size):
+            yield start, self.world_paths(np.arange(start, min(start + chunk_size, len(self))))
+
+    def geometry_stack(self) -> GeometryStack:
+        """Stacked geometry view for BatchIsomorphismValidator (no per-node objects)"""
+        self._require_mapped()
+        return GeometryStack.from_uniform_channels(
+            total_volume=self.total_volume,
+            active_channel=self.active_channel,
+            curvature_density=self.curvature_density,
+            smoothness=self.smoothness
+        )
+
+    def instance_geometry(self, index: int) -> HexGlyphGeometry:
+        """Materialize one node as a HexGlyphGeometry with world-space paths"""
+        self._require_mapped()
+        paths = self.world_paths([index])[0]
+        channels = tuple(
+            ChannelGeometry(
+                channel_id=channel_id,
+                center_path=[Point3D(float(x), float(y), float(z)) for x, y, z in paths[channel_id]],
+                diameter=float(self.diameter[index]),
+                curvature_density=float(self.curvature_density[index]),
+                smoothness=float(self.smoothness[index]),
+                is_active=(channel_id == int(self.active_channel[index]))
+            )
+            for channel_id in range(CHANNEL_COUNT)
+        )
+        center = self.offsets[index]
+        return HexGlyphGeometry(
+            channels=channels,
+            total_volume=float(self.total_volume[index]),
+            traversal_markers=0,
+            center_point=Point3D(float(center[0]), float(center[1]), float(center[2])),
+            scale_factor=float(self.scale[index])
+        )
+
+    def nbytes(self) -> int:
+        """Array memory footprint in bytes (excluding node_ids)"""
+        arrays = [self.q, self.r, self.offsets, self.scale, self.relations,
+                  self.diameter, self.curvature_density, self.smoothness,
+                  self.active_channel, self.total_volume, self.template_curvature,
+                  self.template_index, self.templates]
+        return sum(a.nbytes for a in arrays if a is not None)
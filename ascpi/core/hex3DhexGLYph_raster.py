@@ -0,0 +1,255 @@
+"""
+hex3DhexGLYph Raster Renderer - Headless CPU Projection
+=======================================================
+
+Pure-NumPy rasterizer for HexGlyphGeometry. Channel center paths are
+projected to 2D and drawn as anti-aliased tubes whose width follows the
+channel diameter; frames are written as PNG without GPU, browser or imaging
+library. Trajectories are rendered across a process pool; each worker maps its frames
+incrementally so unchanged channel paths are shared and projected only once.
+
+NON-CANONICAL EXTENSION: visualization layer only. The geometric mapping is
+taken unchanged from hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Tuple, List, Sequence, Optional
+import math
+import os
+import struct
+import zlib
+import numpy as np
+
+from hex3DhexGLYph import CHANNEL_COUNT
+from hex3DhexGLYph_incremental import IncrementalHex3DGlyph
+
+# Channel hues (ℤ₆ positions on the colour wheel)
+CHANNEL_PALETTE = np.array([
+    [0.95, 0.30, 0.30],
+    [0.95, 0.75, 0.25],
+    [0.45, 0.90, 0.35],
+    [0.25, 0.85, 0.90],
+    [0.35, 0.45, 0.95],
+    [0.85, 0.35, 0.90],
+], dtype=np.float32)
+
+@dataclass(frozen=True)
+class Camera:
+    """View transform: rotation about z (yaw), then x (pitch), then perspective"""
+    yaw: float = 0.0
+    pitch: float = 0.6
+    distance: float = 6.0
+    extent: float = 1.6
+
+    def rotation(self) -> np.ndarray:
+        """3x3 world → view rotation"""
+        cy, sy = math.cos(self.yaw), math.sin(self.yaw)
+        cp, sp = math.cos(self.pitch), math.sin(self.pitch)
+        rz = np.array([[cy, -sy, 0.0], [sy, cy, 0.0], [0.0, 0.0, 1.0]])
+        rx = np.array([[1.0, 0.0, 0.0], [0.0, cp, -sp], [0.0, sp, cp]])
+        return rx @ rz
+
+@dataclass(frozen=True)
+class RenderSettings:
+    """Raster output configuration"""
+    width: int = 256
+    height: int = 256
+    background: Tuple[float, float, float] = (0.04, 0.04, 0.06)
+    tube_scale: float = 0.08
+    max_radius_px: float = 24.0
+    inactive_brightness: float = 0.45
+
+def write_png(path, rgb: np.ndarray):
+    """Write an (H, W, 3) uint8 array as an 8-bit RGB PNG"""
+    height, width, _ = rgb.shape
+    rows = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 0  # filter type: None
+    rows[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack('>I', len(data)) + tag + data +
+                struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', header))
+        f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+class ProjectedTemplateCache:
+    """Bounded cache of projected channel paths
+
+    Keyed by the identity of the center_path list; the list itself is held by
+    the cache so its id cannot be reused while the entry is alive. Paths
+    shared between frames (minimal mode, incremental updates) are projected once.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[int, tuple]' = OrderedDict()
+
+    def get(self, center_path: list, projector) -> Tuple[np.ndarray, np.ndarray]:
+        key = id(center_path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is center_path:
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+        points = np.array([(p.x, p.y, p.z) for p in center_path], dtype=np.float64).reshape(-1, 3)
+        xy, depth = projector(points)
+        self._entries[key] = (center_path, xy, depth)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return xy, depth
+
+class GlyphRasterizer:
+    """Anti-aliased tube rasterizer for hexagonal glyph geometries"""
+
+    def __init__(self, settings: RenderSettings = RenderSettings(),
+                 camera: Camera = Camera(), cache: Optional[ProjectedTemplateCache] = None):
+        self.settings = settings
+        self.camera = camera
+        self.cache = cache or ProjectedTemplateCache()
+        self._rotation = camera.rotation()
+        self._pixel_scale = min(settings.width, settings.height) / (2.0 * camera.extent)
+        self._background = np.array(settings.background, dtype=np.float32)
+
+    def project(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project (n, 3) world points to (n, 2) pixel coordinates and (n,) depth"""
+        view = points @ self._rotation.T
+        depth = view[:, 2]
+        perspective = self.camera.distance / np.maximum(self.camera.distance - depth, 1e-6)
+        xy = np.empty((len(points), 2))
+        xy[:, 0] = self.settings.width * 0.5 + view[:, 0] * perspective * self._pixel_scale
+        xy[:, 1] = self.settings.height * 0.5 - view[:, 1] * perspective * self._pixel_scale
+        return xy, depth
+
+    def _radii(self, depth: np.ndarray, diameter: float, scale: float) -> np.ndarray:
+        """Projected tube radius in pixels per path point"""
+        perspective = self.camera.distance / np.maximum(self.camera.distance - depth, 1e-6)
+        world_radius = 0.5 * diameter * self.settings.tube_scale * scale
+        radii = world_radius * perspective * self._pixel_scale
+        return np.clip(radii, 0.5, self.settings.max_radius_px)
+
+    def _draw_tube(self, image: np.ndarray, xy: np.ndarray, radii: np.ndarray,
+                   color: np.ndarray, softness: float):
+        """Composite one projected tube over the image"""
+        if len(xy) < 2:
+            return
+        height, width, _ = image.shape
+        pad = radii.max() + softness + 1.0
+        x0 = max(int(math.floor(xy[:, 0].min() - pad)), 0)
+        x1 = min(int(math.ceil(xy[:, 0].max() + pad)), width)
+        y0 = max(int(math.floor(xy[:, 1].min() - pad)), 0)
+        y1 = min(int(math.ceil(xy[:, 1].max() + pad)), height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        px, py = np.meshgrid(np.arange(x0, x1) + 0.5, np.arange(y0, y1) + 0.5)
+        pixels = np.stack([px.ravel(), py.ravel()], axis=1)
+
+        a, b = xy[:-1], xy[1:]
+        ab = b - a
+        length_sq = np.maximum(np.einsum('ij,ij->i', ab, ab), 1e-12)
+        ap = pixels[:, None, :] - a[None, :, :]
+        t = np.clip(np.einsum('kij,ij->ki', ap, ab) / length_sq, 0.0, 1.0)
+        offset = ap - t[..., None] * ab[None, :, :]
+        dist = np.sqrt(np.einsum('kij,kij->ki', offset, offset))
+        radius = radii[:-1][None, :] + t * (radii[1:] - radii[:-1])[None, :]
+
+        signed = dist - radius
+        nearest = np.argmin(signed, axis=1)
+        rows = np.arange(len(pixels))
+        signed_min = signed[rows, nearest]
+        profile = np.clip(1.0 - (dist[rows, nearest] / radius[rows, nearest]) ** 2, 0.0, 1.0)
+
+        alpha = np.clip(0.5 - signed_min / softness, 0.0, 1.0).astype(np.float32)
+        shade = (0.55 + 0.45 * np.sqrt(profile)).astype(np.float32)
+
+        region = image[y0:y1, x0:x1].reshape(-1, 3)
+        region *= (1.0 - alpha)[:, None]
+        region += (alpha * shade)[:, None] * color[None, :]
+        image[y0:y1, x0:x1] = region.reshape(y1 - y0, x1 - x0, 3)
+
+    def render(self, geometry) -> np.ndarray:
+        """Render a geometry (or the first branch of a split) to (H, W, 3) uint8"""
+        if isinstance(geometry, tuple):
+            geometry = geometry[0]
+
+        image = np.empty((self.settings.height, self.settings.width, 3), dtype=np.float32)
+        image[:] = self._background
+
+        projected = []
+        for channel in geometry.channels:
+            xy, depth = self.cache.get(channel.center_path, self.project)
+            projected.append((float(depth.mean()) if len(depth) else 0.0, channel, xy, depth))
+
+        # Painter's order: far channels first
+        projected.sort(key=lambda item: item[0])
+        for _, channel, xy, depth in projected:
+            color = CHANNEL_PALETTE[channel.channel_id % CHANNEL_COUNT]
+            if not channel.is_active:
+                color = color * self.settings.inactive_brightness
+            radii = self._radii(depth, channel.diameter, geometry.scale_factor)
+            softness = 0.75 + 1.5 * channel.smoothness
+            self._draw_tube(image, xy, radii, color, softness)
+
+        return (np.clip(image, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+# Per-process renderer state (initialised once per pool worker)
+_worker_glyph: Optional[IncrementalHex3DGlyph] = None
+_worker_rasterizer: Optional[GlyphRasterizer] = None
+_worker_pattern: str = ''
+_worker_previous: Optional[tuple] = None
+
+def _init_worker(settings: RenderSettings, camera: Camera, minimal: bool,
+                 research_mode: bool, pattern: str):
+    global _worker_glyph, _worker_rasterizer, _worker_pattern, _worker_previous
+    _worker_glyph = IncrementalHex3DGlyph(base_scale=1.0, minimal=minimal, research_mode=research_mode)
+    _worker_rasterizer = GlyphRasterizer(settings, camera)
+    _worker_pattern = pattern
+    _worker_previous = None
+
+def _render_frame(job: Tuple[int, object]) -> str:
+    global _worker_previous
+    index, psi = job
+    if _worker_previous is None:
+        geometry = _worker_glyph.map_field_state(psi)
+    else:
+        geometry, _ = _worker_glyph.update_geometry(_worker_previous[1], _worker_previous[0], psi)
+    _worker_previous = (psi, geometry)
+    path = _worker_pattern.format(index)
+    write_png(path, _worker_rasterizer.render(geometry))
+    return path
+
+def render_trajectory(states: Sequence, output_dir, settings: RenderSettings = RenderSettings(),
+                      camera: Camera = Camera(), minimal: bool = True, research_mode: bool = False,
+                      processes: Optional[int] = None, chunksize: int = 64,
+                      filename: str = 'frame_{:06d}.png') -> List[str]:
+    """Render a Psi trajectory to a numbered PNG frame sequence
+
+    processes=None uses all cores; processes=1 renders in the calling process.
+    Returns the written file paths in frame order.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pattern = str(output_dir / filename)
+    jobs = list(enumerate(states))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes <= 1 or len(jobs) <= 1:
+        _init_worker(settings, camera, minimal, research_mode, pattern)
+        return [_render_frame(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(settings, camera, minimal, research_mode, pattern)) as pool:
+        return list(pool.map(_render_frame, jobs, chunksize=chunksize))
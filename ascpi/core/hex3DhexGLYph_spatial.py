@@ -0,0 +1,382 @@
+"""
+hex3DhexGLYph Spatial Index - Segment Bounding-Volume Hierarchy
+===============================================================
+
+Bounding-volume hierarchy over channel path segments (optionally swept by a
+tube radius) for proximity queries within one glyph or across a lattice.
+
+The hierarchy is an implicit binary tree over Morton-ordered leaf buckets:
+node bounds are stored per level in flat arrays, so refitting after a state
+change is a handful of vectorized reductions. All queries traverse the tree
+breadth-first with whole frontiers of (query, node) pairs at once:
+
+- segment_pairs:  segment-segment proximity (self-join within a distance)
+- query_radius:   segments within a radius of query points
+- pick:           nearest segment hit by rays (tube picking)
+
+NON-CANONICAL EXTENSION: analysis utility only, does not modify hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from typing import Tuple, List, Optional, Sequence
+import numpy as np
+
+from hex3DhexGLYph import HexGlyphGeometry
+
+LEAF_SIZE = 8
+LEAF_PAIR_BATCH = 16384
+MORTON_BITS = 10
+EPSILON = 1e-12
+
+@dataclass(frozen=True)
+class SegmentSet:
+    """Flat segment arrays with ownership (glyph, channel, segment) ids"""
+    start: np.ndarray     # (n, 3)
+    end: np.ndarray       # (n, 3)
+    radius: np.ndarray    # (n,)
+    glyph: np.ndarray     # (n,) int32
+    channel: np.ndarray   # (n,) int32
+    index: np.ndarray     # (n,) int32 segment index within its channel path
+
+    @classmethod
+    def from_paths(cls, paths: np.ndarray, radii=0.0) -> 'SegmentSet':
+        """Build from (glyphs, channels, points, 3) world-space path arrays
+
+        radii broadcasts against (glyphs, channels).
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        glyphs, channels, points, _ = paths.shape
+        per_path = points - 1
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (glyphs, channels))
+
+        return cls(
+            start=paths[:, :, :-1, :].reshape(-1, 3),
+            end=paths[:, :, 1:, :].reshape(-1, 3),
+            radius=np.repeat(radii.ravel(), per_path),
+            glyph=np.repeat(np.arange(glyphs, dtype=np.int32), channels * per_path),
+            channel=np.tile(np.repeat(np.arange(channels, dtype=np.int32), per_path), glyphs),
+            index=np.tile(np.arange(per_path, dtype=np.int32), glyphs * channels)
+        )
+
+    @classmethod
+    def from_geometries(cls, geometries: Sequence[HexGlyphGeometry],
+                        tube_scale: float = 0.0) -> 'SegmentSet':
+        """Build from glyph geometries; tube radius = 0.5 · diameter · tube_scale"""
+        frames = [g[0] if isinstance(g, tuple) else g for g in geometries]
+        paths = np.array([[[(p.x, p.y, p.z) for p in ch.center_path] for ch in g.channels]
+                          for g in frames], dtype=np.float64)
+        diameters = np.array([[ch.diameter for ch in g.channels] for g in frames])
+        return cls.from_paths(paths, 0.5 * diameters * tube_scale *
+                              np.array([g.scale_factor for g in frames])[:, None])
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+def segment_distance(p1: np.ndarray, q1: np.ndarray, p2: np.ndarray,
+                     q2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized closest distance between segments p1q1 and p2q2
+
+    Returns (distance, s, t) with closest points p1 + s·(q1-p1) and p2 + t·(q2-p2).
+    """
+    d1 = q1 - p1
+    d2 = q2 - p2
+    r = p1 - p2
+    a = np.einsum('ij,ij->i', d1, d1)
+    e = np.einsum('ij,ij->i', d2, d2)
+    f = np.einsum('ij,ij->i', d2, r)
+    c = np.einsum('ij,ij->i', d1, r)
+    b = np.einsum('ij,ij->i', d1, d2)
+
+    a_ok = a > EPSILON
+    e_ok = e > EPSILON
+    a_safe = np.where(a_ok, a, 1.0)
+    e_safe = np.where(e_ok, e, 1.0)
+    denom = a * e - b * b
+    general = denom > EPSILON * np.maximum(a * e, EPSILON)
+
+    s = np.where(general, np.clip((b * f - c * e) / np.where(general, denom, 1.0), 0.0, 1.0), 0.0)
+    t = (b * s + f) / e_safe
+    s = np.where(t < 0.0, np.clip(-c / a_safe, 0.0, 1.0),
+                 np.where(t > 1.0, np.clip((b - c) / a_safe, 0.0, 1.0), s))
+    t = np.clip(t, 0.0, 1.0)
+
+    # Degenerate segments (points)
+    s = np.where(a_ok, s, 0.0)
+    t = np.where(e_ok, np.where(a_ok, t, np.clip(f / e_safe, 0.0, 1.0)), 0.0)
+    s = np.where(a_ok & ~e_ok, np.clip(-c / a_safe, 0.0, 1.0), s)
+
+    closest = (p1 + d1 * s[:, None]) - (p2 + d2 * t[:, None])
+    return np.sqrt(np.einsum('ij,ij->i', closest, closest)), s, t
+
+def _morton_codes(points: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """30-bit Morton codes of points inside [lo, hi]"""
+    extent = np.maximum(hi - lo, EPSILON)
+    cells = (1 << MORTON_BITS) - 1
+    grid = np.clip(((points - lo) / extent * cells).astype(np.int64), 0, cells)
+    codes = np.zeros(len(points), dtype=np.int64)
+    for bit in range(MORTON_BITS):
+        for axis in range(3):
+            codes |= ((grid[:, axis] >> bit) & 1) << (3 * bit + axis)
+    return codes
+
+class SegmentBVH:
+    """Implicit, refittable BVH over a SegmentSet"""
+
+    def __init__(self, segments: SegmentSet, leaf_size: int = LEAF_SIZE):
+        if len(segments) == 0:
+            raise ValueError("SegmentBVH requires at least one segment")
+        self.leaf_size = leaf_size
+        self.segments = segments
+        self._build_order()
+        self.refit()
+
+    def _build_order(self):
+        """Morton-sort segments and size the implicit tree"""
+        centroids = 0.5 * (self.segments.start + self.segments.end)
+        codes = _morton_codes(centroids, centroids.min(axis=0), centroids.max(axis=0))
+        self.order = np.argsort(codes, kind='stable')
+
+        leaves = -(-len(self.segments) // self.leaf_size)
+        self.depth = max(int(np.ceil(np.log2(leaves))), 0) if leaves > 1 else 0
+        self.leaf_count = 1 << self.depth
+
+    def refit(self, segments: Optional[SegmentSet] = None):
+        """Recompute all node bounds, keeping the tree topology
+
+        segments must have the same count and ordering as at build time;
+        positions and radii may change freely (e.g. after a new state mapping).
+        """
+        if segments is not None:
+            if len(segments) != len(self.segments):
+                raise ValueError("refit requires the same number of segments; use rebuild")
+            self.segments = segments
+
+        seg = self.segments
+        n = len(seg)
+        slots = self.leaf_count * self.leaf_size
+
+        self._start = seg.start[self.order]
+        self._end = seg.end[self.order]
+        self._radius = seg.radius[self.order]
+
+        lo = np.full((slots, 3), np.inf)
+        hi = np.full((slots, 3), -np.inf)
+        lo[:n] = np.minimum(self._start, self._end) - self._radius[:, None]
+        hi[:n] = np.maximum(self._start, self._end) + self._radius[:, None]
+
+        lo = lo.reshape(self.leaf_count, self.leaf_size, 3).min(axis=1)
+        hi = hi.reshape(self.leaf_count, self.leaf_size, 3).max(axis=1)
+
+        self.lower: List[np.ndarray] = [lo]
+        self.upper: List[np.ndarray] = [hi]
+        while len(self.lower[0]) > 1:
+            lo = self.lower[0].reshape(-1, 2, 3).min(axis=1)
+            hi = self.upper[0].reshape(-1, 2, 3).max(axis=1)
+            self.lower.insert(0, lo)
+            self.upper.insert(0, hi)
+        self.valid = [np.all(l <= u, axis=1) for l, u in zip(self.lower, self.upper)]
+
+        # Glyph id range per node, to prune same-glyph pairs during traversal
+        glyph = np.full(slots, -1, dtype=np.int64)
+        glyph[:n] = seg.glyph[self.order]
+        glyph = glyph.reshape(self.leaf_count, self.leaf_size)
+        first = np.where(glyph >= 0, glyph, np.iinfo(np.int64).max).min(axis=1)
+        last = glyph.max(axis=1)
+        self.glyph_first: List[np.ndarray] = [first]
+        self.glyph_last: List[np.ndarray] = [last]
+        while len(self.glyph_first[0]) > 1:
+            self.glyph_first.insert(0, self.glyph_first[0].reshape(-1, 2).min(axis=1))
+            self.glyph_last.insert(0, self.glyph_last[0].reshape(-1, 2).max(axis=1))
+
+    def rebuild(self, segments: Optional[SegmentSet] = None):
+        """Re-sort and refit (use after large motions or a segment count change)"""
+        if segments is not None:
+            self.segments = segments
+        self._build_order()
+        self.refit()
+
+    def _leaf_segments(self, query: np.ndarray, leaf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Expand (query, leaf) pairs to (query, sorted segment slot) pairs"""
+        slots = leaf[:, None] * self.leaf_size + np.arange(self.leaf_size)[None, :]
+        query = np.repeat(query, self.leaf_size)
+        slots = slots.ravel()
+        keep = slots < len(self.segments)
+        return query[keep], slots[keep]
+
+    def query_radius(self, points: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Segments within radius of each point
+
+        Returns (query_index, segment_index, distance) arrays; distance is to
+        the tube surface (center distance minus segment radius, floored at 0).
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        query = np.arange(len(points))
+        node = np.zeros(len(points), dtype=np.int64)
+
+        for level in range(self.depth + 1):
+            lo, hi = self.lower[level][node], self.upper[level][node]
+            p = points[query]
+            gap = np.maximum(np.maximum(lo - p, p - hi), 0.0)
+            keep = self.valid[level][node] & (np.einsum('ij,ij->i', gap, gap) <= radius * radius)
+            query, node = query[keep], node[keep]
+            if level < self.depth:
+                query = np.repeat(query, 2)
+                node = (node[:, None] * 2 + np.array([0, 1])[None, :]).ravel()
+
+        query, slot = self._leaf_segments(query, node)
+        p = points[query]
+        distance, _, _ = segment_distance(self._start[slot], self._end[slot], p, p)
+        distance = np.maximum(distance - self._radius[slot], 0.0)
+        keep = distance <= radius
+        return query[keep], self.order[slot[keep]], distance[keep]
+
+    def pick(self, origins: np.ndarray, directions: np.ndarray,
+             pick_radius: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Nearest segment hit by each ray
+
+        A ray hits a segment if it passes within segment radius + pick_radius.
+        Returns (segment_index, ray_parameter); -1 / inf where nothing is hit.
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype=np.float64))
+        directions = np.atleast_2d(np.asarray(directions, dtype=np.float64))
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+        count = len(origins)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse = 1.0 / directions
+
+        query = np.arange(count)
+        node = np.zeros(count, dtype=np.int64)
+        for level in range(self.depth + 1):
+            lo = self.lower[level][node] - pick_radius
+            hi = self.upper[level][node] + pick_radius
+            o, inv = origins[query], inverse[query]
+            with np.errstate(invalid='ignore'):
+                t1 = (lo - o) * inv
+                t2 = (hi - o) * inv
+            near = np.nanmax(np.fmin(t1, t2), axis=1)
+            far = np.nanmin(np.fmax(t1, t2), axis=1)
+            keep = self.valid[level][node] & (far >= np.maximum(near, 0.0))
+            query, node = query[keep], node[keep]
+            if level < self.depth:
+                query = np.repeat(query, 2)
+                node = (node[:, None] * 2 + np.array([0, 1])[None, :]).ravel()
+
+        hit_segment = np.full(count, -1, dtype=np.int64)
+        hit_t = np.full(count, np.inf)
+
+        query, slot = self._leaf_segments(query, node)
+        if len(query) == 0:
+            return hit_segment, hit_t
+
+        # Rays as long segments reaching past the scene bounds
+        scene_lo, scene_hi = self.lower[0][0], self.upper[0][0]
+        o = origins[query]
+        reach = (np.linalg.norm(o - 0.5 * (scene_lo + scene_hi), axis=1) +
+                 np.linalg.norm(scene_hi - scene_lo) + pick_radius + 1.0)
+        distance, s, _ = segment_distance(o, o + directions[query] * reach[:, None],
+                                          self._start[slot], self._end[slot])
+        t = s * reach
+        keep = distance <= self._radius[slot] + pick_radius
+        query, slot, t = query[keep], slot[keep], t[keep]
+
+        # Nearest hit per ray
+        ranking = np.lexsort((t, query))
+        query, slot, t = query[ranking], slot[ranking], t[ranking]
+        first = np.ones(len(query), dtype=bool)
+        first[1:] = query[1:] != query[:-1]
+        hit_segment[query[first]] = self.order[slot[first]]
+        hit_t[query[first]] = t[first]
+        return hit_segment, hit_t
+
+    def segment_pairs(self, distance: float, exclude_connected: bool = True,
+                      exclude_same_glyph: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """All segment pairs whose tubes pass within distance of each other
+
+        exclude_connected drops pairs sharing an endpoint (path neighbours and
+        channel junctions); exclude_same_glyph keeps only cross-glyph pairs.
+        Returns (segment_a, segment_b, clearance) with segment_a < segment_b.
+        """
+        node_a = np.zeros(1, dtype=np.int64)
+        node_b = np.zeros(1, dtype=np.int64)
+        limit = distance * distance
+
+        for level in range(self.depth + 1):
+            lo, hi, valid = self.lower[level], self.upper[level], self.valid[level]
+            gap = np.maximum(np.maximum(lo[node_a] - hi[node_b], lo[node_b] - hi[node_a]), 0.0)
+            keep = valid[node_a] & valid[node_b] & (np.einsum('ij,ij->i', gap, gap) <= limit)
+            if exclude_same_glyph:
+                first, last = self.glyph_first[level], self.glyph_last[level]
+                single = ((first[node_a] == last[node_a]) & (first[node_b] == last[node_b]) &
+                          (first[node_a] == first[node_b]))
+                keep &= ~single
+            node_a, node_b = node_a[keep], node_b[keep]
+            if level < self.depth:
+                same = node_a == node_b
+                # Same node: (L, L), (L, R), (R, R); distinct nodes: all four child pairs
+                sa, sb = node_a[same], node_b[~same]
+                da = node_a[~same]
+                node_a = np.concatenate([
+                    (sa[:, None] * 2 + np.array([0, 0, 1])[None, :]).ravel(),
+                    (da[:, None] * 2 + np.array([0, 0, 1, 1])[None, :]).ravel()
+                ])
+                node_b = np.concatenate([
+                    (sa[:, None] * 2 + np.array([0, 1, 1])[None, :]).ravel(),
+                    (sb[:, None] * 2 + np.array([0, 1, 0, 1])[None, :]).ravel()
+                ])
+
+        seg_a, seg_b, clearance = [], [], []
+        for first in range(0, len(node_a), LEAF_PAIR_BATCH):
+            chunk = slice(first, first + LEAF_PAIR_BATCH)
+            found = self._leaf_pairs(node_a[chunk], node_b[chunk], distance,
+                                     exclude_connected, exclude_same_glyph)
+            seg_a.append(found[0])
+            seg_b.append(found[1])
+            clearance.append(found[2])
+
+        seg_a = np.concatenate(seg_a) if seg_a else np.zeros(0, dtype=np.int64)
+        seg_b = np.concatenate(seg_b) if seg_b else np.zeros(0, dtype=np.int64)
+        clearance = np.concatenate(clearance) if clearance else np.zeros(0)
+        ranking = np.lexsort((seg_b, seg_a))
+        return seg_a[ranking], seg_b[ranking], clearance[ranking]
+
+    def _leaf_pairs(self, node_a: np.ndarray, node_b: np.ndarray, distance: float,
+                    exclude_connected: bool, exclude_same_glyph: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Exact segment tests for a batch of candidate leaf pairs"""
+        size = self.leaf_size
+        lane_a, lane_b = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
+        slot_a = (node_a[:, None] * size + lane_a.ravel()[None, :]).ravel()
+        slot_b = (node_b[:, None] * size + lane_b.ravel()[None, :]).ravel()
+        n = len(self.segments)
+        keep = (slot_a < n) & (slot_b < n) & (slot_a < slot_b)
+        slot_a, slot_b = slot_a[keep], slot_b[keep]
+
+        seg_a, seg_b = self.order[slot_a], self.order[slot_b]
+        if exclude_same_glyph:
+            keep = self.segments.glyph[seg_a] != self.segments.glyph[seg_b]
+            slot_a, slot_b, seg_a, seg_b = slot_a[keep], slot_b[keep], seg_a[keep], seg_b[keep]
+
+        centre, _, _ = segment_distance(self._start[slot_a], self._end[slot_a],
+                                        self._start[slot_b], self._end[slot_b])
+        clearance = np.maximum(centre - self._radius[slot_a] - self._radius[slot_b], 0.0)
+        keep = clearance <= distance
+        if exclude_connected:
+            keep &= ~self._connected(slot_a, slot_b)
+
+        seg_a, seg_b, clearance = seg_a[keep], seg_b[keep], clearance[keep]
+        swap = seg_a > seg_b
+        return np.where(swap, seg_b, seg_a), np.where(swap, seg_a, seg_b), clearance
+
+    def _connected(self, slot_a: np.ndarray, slot_b: np.ndarray) -> np.ndarray:
+        """True where two segments share an endpoint"""
+        ends_a = (self._start[slot_a], self._end[slot_a])
+        ends_b = (self._start[slot_b], self._end[slot_b])
+        connected = np.zeros(len(slot_a), dtype=bool)
+        for point_a in ends_a:
+            for point_b in ends_b:
+                delta = point_a - point_b
+                connected |= np.einsum('ij,ij->i', delta, delta) <= EPSILON
+        return connected
@@ -0,0 +1,267 @@
+"""
+hex3DhexGLYph SVG Export - Streaming Projections and Sprite Sheets
+==================================================================
+
+Projects HexGlyphGeometry channels to 2D SVG paths for the SVG-native and
+HTML projector tooling. Channel center paths become <path> definitions in
+<defs>; frames reference them with <use> elements carrying the per-frame
+state (stroke width from diameter, active channel, data-* attributes for
+curvature, smoothness and volume).
+
+Path data for all channels of a frame is projected in one array operation
+and formatted with a precompiled per-length template. Paths shared between
+frames (minimal mode, incremental updates) are projected and formatted once,
+and identical path data is emitted as a single <defs> entry per document.
+
+Frames are streamed: sprite sheets are written row by row and closed after
+frames_per_sheet frames, so memory stays bounded for any trajectory length.
+
+NON-CANONICAL EXTENSION: visualization layer only, does not modify hex3DhexGLYph.py.
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Iterable
+import numpy as np
+
+from hex3DhexGLYph import CHANNEL_COUNT
+from hex3DhexGLYph_raster import Camera
+
+CHANNEL_COLORS = ('#f24d4d', '#f2bf40', '#73e659', '#40d9e6', '#5973f2', '#d959e6')
+
+SVG_OPEN = ('<svg xmlns="http://www.w3.org/2000/svg" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            'width="{width}" height="{height}" viewBox="{viewbox}">\n')
+SVG_STYLE = ('<style>.ch{{fill:none;stroke-linecap:round;stroke-linejoin:round}}'
+             '.ch.inactive{{stroke-opacity:{inactive}}}</style>\n')
+
+@lru_cache(maxsize=None)
+def _path_template(points: int, decimals: int) -> str:
+    """Precompiled '%' template for path data with a fixed point count"""
+    pair = f'%.{decimals}f,%.{decimals}f'
+    return 'M' + pair + ''.join(' L' + pair for _ in range(points - 1))
+
+def format_path_data(xy: np.ndarray, decimals: int = 3) -> List[str]:
+    """Format (k, points, 2) coordinates as k SVG path data strings"""
+    xy = np.asarray(xy, dtype=np.float64)
+    if xy.shape[1] == 0:
+        return ['' for _ in range(len(xy))]
+    template = _path_template(xy.shape[1], decimals)
+    rows = np.round(xy, decimals).reshape(len(xy), -1) + 0.0  # normalize -0.0
+    return [template % tuple(row) for row in rows.tolist()]
+
+@dataclass(frozen=True)
+class SVGSettings:
+    """SVG output configuration"""
+    cell_size: int = 128
+    tube_scale: float = 0.08
+    inactive_opacity: float = 0.35
+    decimals: int = 3
+
+class SVGGlyphProjector:
+    """Projects glyph channels to SVG path data in glyph-local view units"""
+
+    def __init__(self, camera: Camera = Camera(), settings: SVGSettings = SVGSettings(),
+                 cache_entries: int = 4096):
+        self.camera = camera
+        self.settings = settings
+        self._rotation = camera.rotation()
+        self._cache: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._cache_entries = cache_entries
+
+    @property
+    def viewbox(self) -> Tuple[float, float, float, float]:
+        extent = self.camera.extent
+        return (-extent, -extent, 2.0 * extent, 2.0 * extent)
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        """Project (..., 3) points to (..., 2) view coordinates (y down)"""
+        view = points @ self._rotation.T
+        perspective = self.camera.distance / np.maximum(self.camera.distance - view[..., 2], 1e-6)
+        xy = view[..., :2] * perspective[..., None]
+        xy[..., 1] *= -1.0
+        return xy
+
+    def channel_path_data(self, channels) -> List[str]:
+        """Path data for each channel; shared path objects are formatted once"""
+        result: List[Optional[str]] = [None] * len(channels)
+        missing = []
+        for i, channel in enumerate(channels):
+            entry = self._cache.get(id(channel.center_path))
+            if entry is not None and entry[0] is channel.center_path:
+                self._cache.move_to_end(id(channel.center_path))
+                result[i] = entry[1]
+            else:
+                missing.append(i)
+
+        if missing:
+            paths = [channels[i].center_path for i in missing]
+            lengths = {len(path) for path in paths}
+            for length in lengths:
+                group = [i for i, path in zip(missing, paths) if len(path) == length]
+                points = np.array([[(p.x, p.y, p.z) for p in channels[i].center_path] for i in group],
+                                  dtype=np.float64).reshape(len(group), length, 3)
+                for i, data in zip(group, format_path_data(self.project(points), self.settings.decimals)):
+                    result[i] = data
+                    self._cache[id(channels[i].center_path)] = (channels[i].center_path, data)
+            while len(self._cache) > self._cache_entries:
+                self._cache.popitem(last=False)
+
+        return result
+
+class _DefsRegistry:
+    """Per-document deduplication of path data into <defs> ids"""
+
+    def __init__(self, prefix: str = 'p'):
+        self.prefix = prefix
+        self.ids: Dict[str, str] = {}
+
+    def resolve(self, path_data: List[str]) -> Tuple[List[str], str]:
+        """Return def ids for path data plus the <defs> markup for new entries"""
+        ids = []
+        new = []
+        for data in path_data:
+            def_id = self.ids.get(data)
+            if def_id is None:
+                def_id = f'{self.prefix}{len(self.ids)}'
+                self.ids[data] = def_id
+                new.append(f'<path id="{def_id}" d="{data}"/>')
+            ids.append(def_id)
+        defs = f'<defs>{"".join(new)}</defs>\n' if new else ''
+        return ids, defs
+
+def _frame_markup(geometry, def_ids: List[str], settings: SVGSettings, frame: int,
+                  transform: str = '') -> str:
+    """<g> element for one frame referencing channel path defs"""
+    channels = geometry.channels
+    attributes = f' transform="{transform}"' if transform else ''
+    parts = [f'<g id="f{frame}" data-frame="{frame}" data-volume="{geometry.total_volume:.6g}"{attributes}>']
+    for channel, def_id in zip(channels, def_ids):
+        width = channel.diameter * settings.tube_scale * geometry.scale_factor
+        state = 'active' if channel.is_active else 'inactive'
+        color = CHANNEL_COLORS[channel.channel_id % CHANNEL_COUNT]
+        parts.append(
+            f'<use href="#{def_id}" xlink:href="#{def_id}" class="ch {state}" stroke="{color}" '
+            f'stroke-width="{width:.6g}" data-channel="{channel.channel_id}" '
+            f'data-curvature="{channel.curvature_density:.6g}" '
+            f'data-smoothness="{channel.smoothness:.6g}"/>'
+        )
+    parts.append('</g>\n')
+    return ''.join(parts)
+
+def _unwrap(geometry):
+    return geometry[0] if isinstance(geometry, tuple) else geometry
+
+class SVGSpriteSheetWriter:
+    """Streams frames into grid sprite sheets of bounded size"""
+
+    def __init__(self, directory, projector: Optional[SVGGlyphProjector] = None,
+                 columns: int = 16, frames_per_sheet: int = 256,
+                 filename: str = 'sheet_{:04d}.svg'):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.projector = projector or SVGGlyphProjector()
+        self.columns = columns
+        self.frames_per_sheet = frames_per_sheet
+        self.filename = filename
+        self.files: List[str] = []
+        self._file = None
+        self._defs: Optional[_DefsRegistry] = None
+        self._in_sheet = 0
+        self._frame = 0
+
+    def __enter__(self) -> 'SVGSpriteSheetWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open_sheet(self):
+        settings = self.projector.settings
+        rows = -(-self.frames_per_sheet // self.columns)
+        cell = settings.cell_size
+        x, y, w, h = self.projector.viewbox
+        path = self.directory / self.filename.format(len(self.files))
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._file.write(SVG_OPEN.format(
+            width=self.columns * cell, height=rows * cell,
+            viewbox=f'{x:g} {y:g} {self.columns * w:g} {rows * h:g}'))
+        self._file.write(SVG_STYLE.format(inactive=settings.inactive_opacity))
+        self._defs = _DefsRegistry()
+        self._in_sheet = 0
+        self.files.append(str(path))
+
+    def _close_sheet(self):
+        if self._file is not None:
+            self._file.write('</svg>\n')
+            self._file.close()
+            self._file = None
+
+    def add_frame(self, geometry):
+        """Append one frame (split geometries use their first branch)"""
+        if self._file is None:
+            self._open_sheet()
+        geometry = _unwrap(geometry)
+
+        def_ids, defs = self._defs.resolve(self.projector.channel_path_data(geometry.channels))
+        _, _, w, h = self.projector.viewbox
+        column = self._in_sheet % self.columns
+        row = self._in_sheet // self.columns
+        transform = f'translate({column * w:g},{row * h:g})'
+
+        self._file.write(defs)
+        self._file.write(_frame_markup(geometry, def_ids, self.projector.settings,
+                                       self._frame, transform))
+        self._frame += 1
+        self._in_sheet += 1
+        if self._in_sheet == self.frames_per_sheet:
+            self._close_sheet()
+
+    def close(self) -> List[str]:
+        self._close_sheet()
+        return self.files
+
+def write_frame_svg(path, geometry, projector: Optional[SVGGlyphProjector] = None,
+                    frame: int = 0):
+    """Write one geometry as a standalone SVG document"""
+    projector = projector or SVGGlyphProjector()
+    settings = projector.settings
+    geometry = _unwrap(geometry)
+    def_ids, defs = _DefsRegistry().resolve(projector.channel_path_data(geometry.channels))
+    x, y, w, h = projector.viewbox
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(SVG_OPEN.format(width=settings.cell_size, height=settings.cell_size,
+                                viewbox=f'{x:g} {y:g} {w:g} {h:g}'))
+        f.write(SVG_STYLE.format(inactive=settings.inactive_opacity))
+        f.write(defs)
+        f.write(_frame_markup(geometry, def_ids, settings, frame))
+        f.write('</svg>\n')
+
+def export_frames(geometries: Iterable, directory, projector: Optional[SVGGlyphProjector] = None,
+                  filename: str = 'frame_{:06d}.svg') -> List[str]:
+    """Stream geometries to one SVG file per frame"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    projector = projector or SVGGlyphProjector()
+    files = []
+    for index, geometry in enumerate(geometries):
+        path = directory / filename.format(index)
+        write_frame_svg(path, geometry, projector, index)
+        files.append(str(path))
+    return files
+
+def export_sprite_sheets(geometries: Iterable, directory, projector: Optional[SVGGlyphProjector] = None,
+                         columns: int = 16, frames_per_sheet: int = 256) -> List[str]:
+    """Stream geometries into grid sprite sheets"""
+    with SVGSpriteSheetWriter(directory, projector, columns, frames_per_sheet) as writer:
+        for geometry in geometries:
+            writer.add_frame(geometry)
+        return writer.files
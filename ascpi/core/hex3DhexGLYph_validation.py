@@ -0,0 +1,172 @@
+"""
+hex3DhexGLYph Batch Validation - Vectorized Isomorphism Checks
+==============================================================
+
+Array-based counterpart of Hex3DGlyph.validate_isomorphism for whole
+trajectories. Field states and geometries are stacked into NumPy arrays
+once; every isomorphism condition is then evaluated for all frames at once.
+
+NON-CANONICAL EXTENSION: this module does not modify hex3DhexGLYph.py.
+For every frame the verdict equals Hex3DGlyph.validate_isomorphism(psi, geometry).
+
+Compatible with: hex3DhexGLYph v1.0.0
+License: Academic Research Use
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Sequence
+import numpy as np
+
+from hex3DhexGLYph import TAU, CHANNEL_COUNT
+
+VOLUME_TOLERANCE = 1e-6
+
+@dataclass(frozen=True)
+class PsiStack:
+    """Stacked field state components required for validation"""
+    theta: np.ndarray   # (n,)
+    N: np.ndarray       # (n,)
+
+    @classmethod
+    def from_states(cls, states: Sequence) -> 'PsiStack':
+        """Stack a sequence of Psi objects"""
+        count = len(states)
+        return cls(
+            theta=np.fromiter((psi.theta for psi in states), dtype=np.float64, count=count),
+            N=np.fromiter((psi.N for psi in states), dtype=np.float64, count=count)
+        )
+
+    def __len__(self) -> int:
+        return len(self.theta)
+
+@dataclass(frozen=True)
+class GeometryStack:
+    """Stacked glyph geometries, one row per frame and one column per channel"""
+    total_volume: np.ndarray       # (n,)
+    traversal_markers: np.ndarray  # (n,)
+    channel_ids: np.ndarray        # (n, channels)
+    is_active: np.ndarray          # (n, channels) bool
+    curvature_density: np.ndarray  # (n, channels)
+    smoothness: np.ndarray         # (n, channels)
+
+    @classmethod
+    def from_geometries(cls, geometries: Sequence) -> 'GeometryStack':
+        """Stack a sequence of HexGlyphGeometry objects
+
+        Split geometries (tuples) are represented by their first branch;
+        both branches share the same channels.
+        """
+        frames = [g[0] if isinstance(g, tuple) else g for g in geometries]
+        count = len(frames)
+        width = len(frames[0].channels) if frames else CHANNEL_COUNT
+        if any(len(g.channels) != width for g in frames):
+            raise ValueError("All geometries must have the same channel count")
+
+        channels = [ch for g in frames for ch in g.channels]
+        size = count * width
+        shape = (count, width)
+
+        return cls(
+            total_volume=np.fromiter((g.total_volume for g in frames), dtype=np.float64, count=count),
+            traversal_markers=np.fromiter((g.traversal_markers for g in frames), dtype=np.int64, count=count),
+            channel_ids=np.fromiter((ch.channel_id for ch in channels), dtype=np.int64, count=size).reshape(shape),
+            is_active=np.fromiter((ch.is_active for ch in channels), dtype=bool, count=size).reshape(shape),
+            curvature_density=np.fromiter((ch.curvature_density for ch in channels), dtype=np.float64, count=size).reshape(shape),
+            smoothness=np.fromiter((ch.smoothness for ch in channels), dtype=np.float64, count=size).reshape(shape)
+        )
+
+    @classmethod
+    def from_uniform_channels(cls, total_volume: np.ndarray, active_channel: np.ndarray,
+                              curvature_density: np.ndarray, smoothness: np.ndarray,
+                              channel_count: int = CHANNEL_COUNT) -> 'GeometryStack':
+        """Stack from per-frame arrays for glyphs whose channels share curvature
+        and smoothness, with channel ids 0..channel_count-1 (as Hex3DGlyph maps them)"""
+        n = len(total_volume)
+        shape = (n, channel_count)
+        channel_ids = np.broadcast_to(np.arange(channel_count), shape)
+        return cls(
+            total_volume=np.asarray(total_volume, dtype=np.float64),
+            traversal_markers=np.zeros(n, dtype=np.int64),
+            channel_ids=channel_ids,
+            is_active=channel_ids == np.asarray(active_channel)[:, None],
+            curvature_density=np.broadcast_to(np.asarray(curvature_density, dtype=np.float64)[:, None], shape),
+            smoothness=np.broadcast_to(np.asarray(smoothness, dtype=np.float64)[:, None], shape)
+        )
+
+    def __len__(self) -> int:
+        return len(self.total_volume)
+
+@dataclass(frozen=True)
+class BatchValidationResult:
+    """Per-frame validation verdicts"""
+    valid: np.ndarray            # (n,) bool, all checks passed
+    checks: Dict[str, np.ndarray]
+
+    @property
+    def all_valid(self) -> bool:
+        return bool(np.all(self.valid))
+
+    @property
+    def failing_indices(self) -> np.ndarray:
+        """Indices of frames that fail at least one check"""
+        return np.flatnonzero(~self.valid)
+
+    def failing_checks(self, index: int) -> list:
+        """Names of the checks failed by a single frame"""
+        return [name for name, passed in self.checks.items() if not passed[index]]
+
+class BatchIsomorphismValidator:
+    """Vectorized isomorphism validation over stacked trajectories"""
+
+    @staticmethod
+    def map_theta_to_channel(theta: np.ndarray) -> np.ndarray:
+        """Vectorized GeometricMapper.map_theta_to_channel"""
+        normalized_theta = np.mod(theta, TAU)
+        channel_id = ((normalized_theta / TAU) * CHANNEL_COUNT).astype(np.int64)
+        return channel_id % CHANNEL_COUNT
+
+    @staticmethod
+    def validate(psi: PsiStack, geometry: GeometryStack) -> BatchValidationResult:
+        """Validate all frames of a stacked trajectory"""
+        if len(psi) != len(geometry):
+            raise ValueError(f"Length mismatch: {len(psi)} states, {len(geometry)} geometries")
+
+        volume = ~(np.abs(geometry.total_volume - np.abs(psi.N)) > VOLUME_TOLERANCE)
+        traversal = geometry.traversal_markers == 0
+
+        expected_channel = BatchIsomorphismValidator.map_theta_to_channel(psi.theta)
+        active_count = geometry.is_active.sum(axis=1)
+        if geometry.is_active.shape[1]:
+            first_active = np.argmax(geometry.is_active, axis=1)
+            active_id = np.take_along_axis(geometry.channel_ids, first_active[:, None], axis=1)[:, 0]
+        else:
+            active_id = np.full(len(geometry), -1, dtype=np.int64)
+        active = (active_count == 1) & (active_id == expected_channel)
+
+        curvature = ~np.any(geometry.curvature_density < 0, axis=1)
+        smoothness = np.all((geometry.smoothness >= 0) & (geometry.smoothness <= 1), axis=1)
+
+        checks = {
+            'total_volume': volume,
+            'traversal_markers': traversal,
+            'active_channel': active,
+            'curvature_density': curvature,
+            'smoothness': smoothness
+        }
+        valid = volume & traversal & active & curvature & smoothness
+
+        return BatchValidationResult(valid=valid, checks=checks)
+
+    @staticmethod
+    def validate_trajectory(states: Sequence, geometries: Sequence) -> BatchValidationResult:
+        """Stack and validate Psi objects against their mapped geometries
+
+        Already stacked inputs are used as is; prefer the exporters' stacks
+        (IncrementalHex3DGlyph.trajectory_stack, GlyphLattice.geometry_stack)
+        over re-stacking geometry objects.
+        """
+        if not isinstance(states, PsiStack):
+            states = PsiStack.from_states(states)
+        if not isinstance(geometries, GeometryStack):
+            geometries = GeometryStack.from_geometries(geometries)
+        return BatchIsomorphismValidator.validate(states, geometries)
@@ -20,21 +20,39 @@ License: Academic Research Use
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import json
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
+import concurrent.futures   # process pool module loads on first use
 import hashlib
+import inspect
 import logging
+import os
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured by main(), not on import
 logger = logging.getLogger(__name__)
 
-@dataclass
+class ReflectionCounter:
+    """
+    Process-wide count of executed reflections
+    
+    Batched operators count per call; scalar reflections are counted once
+    per loop by their callers, keeping the per-step path free of bookkeeping.
+    """
+    count = 0
+    
+    @classmethod
+    def add(cls, reflections: int):
+        cls.count += int(reflections)
+
+@dataclass(slots=True)
 class MotorState:
     """Core motor state Ψ = (ΔΦ, κ, θ)"""
     delta_phi: float    # ΔΦ - voltage differential  
@@ -48,11 +66,124 @@ class MotorState:
         self.theta = self.theta % 6
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {'delta_phi': self.delta_phi, 'kappa': self.kappa, 'theta': self.theta}
     
     def __str__(self) -> str:
         return f"Ψ(ΔΦ={self.delta_phi:.6f}, κ={self.kappa:.6f}, θ={self.theta})"
 
+@dataclass
+class MotorStateBatch:
+    """Ensemble of motor states Ψ = (ΔΦ, κ, θ) stored as parallel arrays"""
+    delta_phi: np.ndarray   # float64
+    kappa: np.ndarray       # float64 (≥ 0)
+    theta: np.ndarray       # int64 (0-5)
+    
+    def __post_init__(self):
+        """Enforce invariants"""
+        self.delta_phi = np.asarray(self.delta_phi, dtype=np.float64)
+        self.kappa = np.asarray(self.kappa, dtype=np.float64)
+        self.theta = np.asarray(self.theta, dtype=np.int64) % 6
+        if np.any(self.kappa < 0):
+            raise ValueError("κ must be ≥ 0")
+    
+    @classmethod
+    def from_states(cls, states: List[MotorState]) -> 'MotorStateBatch':
+        return cls(np.array([s.delta_phi for s in states], dtype=np.float64),
+                   np.array([s.kappa for s in states], dtype=np.float64),
+                   np.array([s.theta for s in states], dtype=np.int64))
+    
+    def __len__(self) -> int:
+        return len(self.delta_phi)
+    
+    def __getitem__(self, index: int) -> MotorState:
+        return MotorState(float(self.delta_phi[index]), float(self.kappa[index]),
+                          int(self.theta[index]))
+    
+    def to_states(self) -> List[MotorState]:
+        return [self[i] for i in range(len(self))]
+
+# Packed Ψ record for trajectories (24 bytes per state)
+MOTOR_STATE_DTYPE = np.dtype([('delta_phi', np.float64), ('kappa', np.float64), ('theta', np.int64)])
+
+class Trajectory(Sequence):
+    """
+    Single trajectory stored as a structured array of MOTOR_STATE_DTYPE
+    
+    Indexing yields MotorState objects (slices yield Trajectory views);
+    delta_phi, kappa and theta are column views for vectorized analysis.
+    """
+    __slots__ = ('records',)
+    
+    def __init__(self, records: np.ndarray):
+        if records.dtype != MOTOR_STATE_DTYPE:
+            raise ValueError(f"Trajectory records must have dtype {MOTOR_STATE_DTYPE}")
+        self.records = records
+    
+    @classmethod
+    def from_arrays(cls, delta_phi, kappa, theta) -> 'Trajectory':
+        records = np.empty(len(delta_phi), dtype=MOTOR_STATE_DTYPE)
+        records['delta_phi'] = delta_phi
+        records['kappa'] = kappa
+        records['theta'] = theta
+        return cls(records)
+    
+    @classmethod
+    def from_states(cls, states: List[MotorState]) -> 'Trajectory':
+        return cls(np.array([(s.delta_phi, s.kappa, s.theta) for s in states],
+                            dtype=MOTOR_STATE_DTYPE))
+    
+    @property
+    def delta_phi(self) -> np.ndarray:
+        return self.records['delta_phi']
+    
+    @property
+    def kappa(self) -> np.ndarray:
+        return self.records['kappa']
+    
+    @property
+    def theta(self) -> np.ndarray:
+        return self.records['theta']
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Trajectory(self.records[index])
+        return MotorState(*self.records[index].item())
+    
+    def __iter__(self) -> Iterator[MotorState]:
+        for delta_phi, kappa, theta in self.records.tolist():
+            yield MotorState(delta_phi, kappa, theta)
+    
+    def to_states(self) -> List[MotorState]:
+        return list(self)
+
+@dataclass
+class TrajectoryBatch:
+    """Lockstep trajectories of an ensemble, arrays shaped (steps + 1, n)"""
+    delta_phi: np.ndarray
+    kappa: np.ndarray
+    theta: np.ndarray
+    
+    def __len__(self) -> int:
+        return self.delta_phi.shape[0]
+    
+    def step(self, index: int) -> MotorStateBatch:
+        """Ensemble state after `index` steps"""
+        return MotorStateBatch(self.delta_phi[index], self.kappa[index], self.theta[index])
+    
+    def states(self, member: int) -> List[MotorState]:
+        """Trajectory of one ensemble member as MotorState objects"""
+        return [MotorState(dp, k, th) for dp, k, th in zip(self.delta_phi[:, member].tolist(),
+                                                            self.kappa[:, member].tolist(),
+                                                            self.theta[:, member].tolist())]
+    
+    def member(self, member: int) -> Trajectory:
+        """Trajectory of one ensemble member as a packed Trajectory"""
+        return Trajectory.from_arrays(self.delta_phi[:, member], self.kappa[:, member],
+                                      self.theta[:, member])
+
 class ReflectionOperator:
     """Core reflection operator R(Ψ, I) → Ψ'"""
     
@@ -79,6 +210,20 @@ class ReflectionOperator:
         new_theta = (state.theta + sign_phi) % 6
         
         return MotorState(new_delta_phi, new_kappa, new_theta)
+    
+    @staticmethod
+    def reflect_batch(batch: MotorStateBatch, injection: np.ndarray) -> MotorStateBatch:
+        """Vectorized R(Ψ, I) → Ψ' for a whole ensemble"""
+        if not np.all(np.abs(injection) == 1):
+            raise ValueError("Injection must be ±1")
+        
+        with np.errstate(over='ignore', invalid='ignore'):
+            new_delta_phi = batch.delta_phi + injection * batch.kappa
+        new_kappa = np.abs(new_delta_phi)
+        new_theta = (batch.theta + np.sign(new_delta_phi).astype(np.int64)) % 6
+        
+        ReflectionCounter.add(len(batch))
+        return MotorStateBatch(new_delta_phi, new_kappa, new_theta)
 
 class IntrospectionEngine:
     """Introspective injection rule: I = sign(ΔΦ)"""
@@ -93,6 +238,39 @@ class IntrospectionEngine:
         if state.delta_phi == 0:
             return 1  # Minimal asymmetry to break degeneracy
         return 1 if state.delta_phi > 0 else -1
+    
+    @staticmethod
+    def get_injection_batch(batch: MotorStateBatch) -> np.ndarray:
+        """Vectorized I = sign(ΔΦ) with ΔΦ = 0 → +1"""
+        return np.where(batch.delta_phi < 0, -1, 1)
+
+class BatchEvolution:
+    """Lockstep evolution of motor state ensembles"""
+    
+    @staticmethod
+    def step(batch: MotorStateBatch) -> MotorStateBatch:
+        """One introspective reflection step for every ensemble member"""
+        return ReflectionOperator.reflect_batch(batch, IntrospectionEngine.get_injection_batch(batch))
+    
+    @staticmethod
+    def evolve(batch: MotorStateBatch, steps: int) -> TrajectoryBatch:
+        """Evolve an ensemble for `steps` reflections, keeping every step"""
+        n = len(batch)
+        delta_phi = np.empty((steps + 1, n), dtype=np.float64)
+        kappa = np.empty((steps + 1, n), dtype=np.float64)
+        theta = np.empty((steps + 1, n), dtype=np.int64)
+        delta_phi[0], kappa[0], theta[0] = batch.delta_phi, batch.kappa, batch.theta
+        
+        with np.errstate(over='ignore', invalid='ignore'):
+            for step in range(steps):
+                injection = np.where(delta_phi[step] < 0, -1.0, 1.0)
+                np.add(delta_phi[step], injection * kappa[step], out=delta_phi[step + 1])
+                np.abs(delta_phi[step + 1], out=kappa[step + 1])
+                np.remainder(theta[step] + np.sign(delta_phi[step + 1]).astype(np.int64), 6,
+                             out=theta[step + 1])
+        
+        ReflectionCounter.add(steps * n)
+        return TrajectoryBatch(delta_phi, kappa, theta)
 
 class MetricSpace:
     """Topological metric for Ψ-space"""
@@ -111,6 +289,13 @@ class MetricSpace:
         theta_dist = min(theta_diff, 6 - theta_diff)
         
         return phi_dist + kappa_dist + theta_dist
+    
+    @staticmethod
+    def distance_batch(delta_phi1, kappa1, theta1, delta_phi2, kappa2, theta2) -> np.ndarray:
+        """Vectorized Δ(Ψₐ, Ψᵦ) over broadcastable component arrays"""
+        theta_diff = np.abs(np.asarray(theta1) - np.asarray(theta2))
+        theta_dist = np.minimum(theta_diff, 6 - theta_diff)
+        return np.abs(delta_phi1 - delta_phi2) + np.abs(kappa1 - kappa2) + theta_dist
 
 class ProjectionEngine:
     """Projection functions V = P(Ψ)"""
@@ -138,36 +323,311 @@ class ProjectionEngine:
 class MemoryDensityField:
     """Memory as metric proximity (no storage)"""
     
-    def __init__(self, sigma: float = 1.0):
+    MODES = ('exact', 'grid')
+    
+    def __init__(self, sigma: float = 1.0, cutoff_tolerance: Optional[float] = None,
+                 mode: str = 'exact', delta_phi_range: Tuple[float, float] = (-10.0, 10.0),
+                 kappa_range: Tuple[float, float] = (0.0, 20.0),
+                 bins: Tuple[int, int] = (256, 256)):
+        """
+        cutoff_tolerance: ignore coherent states whose kernel weight
+        exp(-Δ/σ) is below this value (radius σ·ln(1/tol)); None is exact
+        mode: 'exact' keeps every state; 'grid' deposits states into a
+        GridDensityField over the given ranges and bins (O(1) inserts,
+        approximate densities, no individual states kept)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Mode must be one of {self.MODES}")
+        if mode == 'grid' and cutoff_tolerance is not None:
+            raise ValueError("cutoff_tolerance only applies to mode='exact'")
         self.sigma = sigma
-        self.coherent_states: List[MotorState] = []
+        self.cutoff_tolerance = cutoff_tolerance
+        self.mode = mode
+        self.grid = (GridDensityField(delta_phi_range, kappa_range, bins, sigma)
+                     if mode == 'grid' else None)
+        self._count = 0
+        self._delta_phi = np.empty(64, dtype=np.float64)
+        self._kappa = np.empty(64, dtype=np.float64)
+        self._theta = np.empty(64, dtype=np.int64)
+        self._index: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None
+    
+    @property
+    def cutoff_radius(self) -> float:
+        """Metric radius beyond which states are ignored (inf if exact)"""
+        if self.cutoff_tolerance is None:
+            return np.inf
+        return self.sigma * np.log(1.0 / self.cutoff_tolerance)
+    
+    @property
+    def coherent_states(self) -> List[MotorState]:
+        """Stored coherent states as MotorState objects"""
+        if self.grid is not None:
+            raise ValueError("A grid memory field keeps no individual states")
+        return MotorStateBatch(self._delta_phi[:self._count], self._kappa[:self._count],
+                               self._theta[:self._count]).to_states()
+    
+    def __len__(self) -> int:
+        return self.grid.count if self.grid is not None else self._count
+    
+    def _reserve(self, extra: int):
+        """Grow storage geometrically"""
+        needed = self._count + extra
+        if needed <= len(self._delta_phi):
+            return
+        capacity = max(needed, 2 * len(self._delta_phi))
+        for name in ('_delta_phi', '_kappa', '_theta'):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._count] = old[:self._count]
+            setattr(self, name, grown)
     
     def add_coherent_state(self, state: MotorState):
         """Add a coherent state to the density field"""
-        self.coherent_states.append(state)
+        if self.grid is not None:
+            self.grid.add_coherent_state(state)
+            return
+        self._reserve(1)
+        self._delta_phi[self._count] = state.delta_phi
+        self._kappa[self._count] = state.kappa
+        self._theta[self._count] = state.theta
+        self._count += 1
+        self._index = None
+    
+    def add_coherent_states(self, batch: MotorStateBatch):
+        """Add an ensemble of coherent states at once"""
+        if self.grid is not None:
+            self.grid.add_coherent_states(batch)
+            return
+        n = len(batch)
+        self._reserve(n)
+        self._delta_phi[self._count:self._count + n] = batch.delta_phi
+        self._kappa[self._count:self._count + n] = batch.kappa
+        self._theta[self._count:self._count + n] = batch.theta
+        self._count += n
+        self._index = None
+    
+    def _build_index(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Per-phase buckets of state indices sorted by ΔΦ"""
+        if self._index is None:
+            delta_phi = self._delta_phi[:self._count]
+            theta = self._theta[:self._count]
+            self._index = []
+            for phase in range(6):
+                members = np.flatnonzero(theta == phase)
+                order = members[np.argsort(delta_phi[members], kind='stable')]
+                self._index.append((order, delta_phi[order]))
+        return self._index
     
     def density(self, state: MotorState) -> float:
         """
         Memory density: ρ(Ψ) = Σᵢ exp(-Δ(Ψ, Ψᵢ)/σ)
         """
-        if not self.coherent_states:
+        if len(self) == 0:
             return 0.0
+        return float(self.density_batch(MotorStateBatch(
+            np.array([state.delta_phi]), np.array([state.kappa]), np.array([state.theta])))[0])
+    
+    def density_batch(self, batch: MotorStateBatch, chunk_bytes: int = 64 << 20) -> np.ndarray:
+        """
+        Memory density for every state of an ensemble
         
-        total_density = 0.0
-        for coherent_state in self.coherent_states:
-            distance = MetricSpace.distance(state, coherent_state)
-            total_density += np.exp(-distance / self.sigma)
+        Queries are processed in chunks whose (query × stored state)
+        temporaries take at most `chunk_bytes` each.
+        """
+        if self.grid is not None:
+            return self.grid.density_batch(batch)
+        result = np.zeros(len(batch))
+        if self._count == 0:
+            return result
+        
+        chunk_size = max(1, chunk_bytes // (8 * self._count))
+        for first in range(0, len(batch), chunk_size):
+            chunk = slice(first, first + chunk_size)
+            query = (batch.delta_phi[chunk], batch.kappa[chunk], batch.theta[chunk])
+            if self.cutoff_tolerance is None:
+                result[chunk] = self._dense_density(*query)
+            else:
+                result[chunk] = self._indexed_density(*query)
+        return result
+    
+    def _dense_density(self, delta_phi, kappa, theta) -> np.ndarray:
+        """Exact density against all stored states"""
+        distance = MetricSpace.distance_batch(
+            delta_phi[:, None], kappa[:, None], theta[:, None],
+            self._delta_phi[None, :self._count], self._kappa[None, :self._count],
+            self._theta[None, :self._count]
+        )
+        return np.exp(-distance / self.sigma).sum(axis=1)
+    
+    def _indexed_density(self, delta_phi, kappa, theta) -> np.ndarray:
+        """Density over states within the cutoff radius only"""
+        radius = self.cutoff_radius
+        total = np.zeros(len(delta_phi))
+        
+        for phase, (order, sorted_phi) in enumerate(self._build_index()):
+            if len(order) == 0:
+                continue
+            theta_diff = np.abs(theta - phase)
+            theta_dist = np.minimum(theta_diff, 6 - theta_diff)
+            remaining = radius - theta_dist
+            
+            lo = np.searchsorted(sorted_phi, delta_phi - remaining, side='left')
+            hi = np.searchsorted(sorted_phi, delta_phi + remaining, side='right')
+            counts = np.where(remaining >= 0, hi - lo, 0)
+            if not counts.any():
+                continue
+            
+            # Expand (query, candidate) pairs from the ΔΦ ranges
+            query = np.repeat(np.arange(len(delta_phi)), counts)
+            starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            candidate = order[np.arange(len(query)) + starts]
+            
+            distance = (np.abs(delta_phi[query] - self._delta_phi[candidate]) +
+                        np.abs(kappa[query] - self._kappa[candidate]) + theta_dist[query])
+            weight = np.where(distance <= radius, np.exp(-distance / self.sigma), 0.0)
+            total += np.bincount(query, weights=weight, minlength=len(delta_phi))
         
-        return total_density
+        return total
+
+class GridDensityField:
+    """
+    Approximate memory density on a regular (θ, ΔΦ, κ) grid
+    
+    Inserts are deposited into a histogram with cloud-in-cell weights (O(1));
+    the density field is the histogram convolved with exp(-Δ/σ) by FFT,
+    zero-padded in ΔΦ and κ and periodic in θ (O(G log G)), refreshed lazily.
+    States outside the grid bounds are counted in `dropped` and ignored.
+    """
+    
+    def __init__(self, delta_phi_range: Tuple[float, float] = (-10.0, 10.0),
+                 kappa_range: Tuple[float, float] = (0.0, 20.0),
+                 bins: Tuple[int, int] = (256, 256), sigma: float = 1.0):
+        if bins[0] < 2 or bins[1] < 2:
+            raise ValueError("Grid needs at least 2 bins per axis")
+        self.sigma = sigma
+        self.delta_phi_axis = np.linspace(delta_phi_range[0], delta_phi_range[1], bins[0])
+        self.kappa_axis = np.linspace(kappa_range[0], kappa_range[1], bins[1])
+        self._origin = np.array([delta_phi_range[0], kappa_range[0]])
+        self._spacing = np.array([self.delta_phi_axis[1] - self.delta_phi_axis[0],
+                                  self.kappa_axis[1] - self.kappa_axis[0]])
+        self.histogram = np.zeros((6, bins[0], bins[1]))
+        self.count = 0
+        self.dropped = 0
+        self._field: Optional[np.ndarray] = None
+        self._kernel_spectrum: Optional[np.ndarray] = None
+    
+    def _cells(self, delta_phi, kappa):
+        """Lower cell indices, fractional offsets and in-bounds mask"""
+        u = (np.asarray(delta_phi, dtype=np.float64) - self._origin[0]) / self._spacing[0]
+        v = (np.asarray(kappa, dtype=np.float64) - self._origin[1]) / self._spacing[1]
+        n_phi, n_kappa = self.histogram.shape[1:]
+        inside = (u >= 0) & (u <= n_phi - 1) & (v >= 0) & (v <= n_kappa - 1)
+        i = np.clip(np.floor(np.where(inside, u, 0)).astype(np.int64), 0, n_phi - 2)
+        j = np.clip(np.floor(np.where(inside, v, 0)).astype(np.int64), 0, n_kappa - 2)
+        return i, j, u - i, v - j, inside
+    
+    def add_coherent_state(self, state: MotorState):
+        """Deposit one coherent state into the histogram"""
+        u = (state.delta_phi - self._origin[0]) / self._spacing[0]
+        v = (state.kappa - self._origin[1]) / self._spacing[1]
+        n_phi, n_kappa = self.histogram.shape[1:]
+        if not (0 <= u <= n_phi - 1 and 0 <= v <= n_kappa - 1):
+            self.dropped += 1
+            return
+        i = min(int(u), n_phi - 2)
+        j = min(int(v), n_kappa - 2)
+        fu, fv = u - i, v - j
+        plane = self.histogram[state.theta % 6]
+        plane[i, j] += (1 - fu) * (1 - fv)
+        plane[i + 1, j] += fu * (1 - fv)
+        plane[i, j + 1] += (1 - fu) * fv
+        plane[i + 1, j + 1] += fu * fv
+        self.count += 1
+        self._field = None
+    
+    def add_coherent_states(self, batch: MotorStateBatch):
+        """Deposit an ensemble of coherent states into the histogram"""
+        i, j, fu, fv, inside = self._cells(batch.delta_phi, batch.kappa)
+        t = batch.theta[inside] % 6
+        i, j, fu, fv = i[inside], j[inside], fu[inside], fv[inside]
+        for di, wu in ((0, 1.0 - fu), (1, fu)):
+            for dj, wv in ((0, 1.0 - fv), (1, fv)):
+                np.add.at(self.histogram, (t, i + di, j + dj), wu * wv)
+        self.count += int(inside.sum())
+        self.dropped += int(len(inside) - inside.sum())
+        self._field = None
+    
+    def _kernel(self) -> np.ndarray:
+        """Spectrum of exp(-Δ/σ) on the padded grid"""
+        if self._kernel_spectrum is None:
+            n_phi, n_kappa = self.histogram.shape[1:]
+            lag_phi = np.abs(np.fft.fftfreq(2 * n_phi, 1.0 / (2 * n_phi))) * self._spacing[0]
+            lag_kappa = np.abs(np.fft.fftfreq(2 * n_kappa, 1.0 / (2 * n_kappa))) * self._spacing[1]
+            lag_theta = np.minimum(np.arange(6), 6 - np.arange(6))
+            distance = (lag_theta[:, None, None] + lag_phi[None, :, None] + lag_kappa[None, None, :])
+            self._kernel_spectrum = np.fft.rfftn(np.exp(-distance / self.sigma))
+        return self._kernel_spectrum
+    
+    def field(self) -> np.ndarray:
+        """Density at every grid node, shaped (6, ΔΦ bins, κ bins)"""
+        if self._field is None:
+            n_phi, n_kappa = self.histogram.shape[1:]
+            shape = (6, 2 * n_phi, 2 * n_kappa)
+            spectrum = np.fft.rfftn(self.histogram, s=shape) * self._kernel()
+            field = np.fft.irfftn(spectrum, s=shape)[:, :n_phi, :n_kappa]
+            self._field = np.maximum(field, 0.0)
+        return self._field
+    
+    def density(self, state: MotorState) -> float:
+        """Approximate ρ(Ψ) by bilinear interpolation of the field"""
+        return float(self.density_batch(MotorStateBatch(
+            np.array([state.delta_phi]), np.array([state.kappa]), np.array([state.theta])))[0])
+    
+    def density_batch(self, batch: MotorStateBatch) -> np.ndarray:
+        """Approximate ρ(Ψ) for every state of an ensemble (0 outside the grid)"""
+        field = self.field()
+        i, j, fu, fv, inside = self._cells(batch.delta_phi, batch.kappa)
+        t = batch.theta % 6
+        result = ((1 - fu) * (1 - fv) * field[t, i, j] + fu * (1 - fv) * field[t, i + 1, j] +
+                  (1 - fu) * fv * field[t, i, j + 1] + fu * fv * field[t, i + 1, j + 1])
+        return np.where(inside, result, 0.0)
 
 class CurvatureAnalyzer:
     """Curvature matrix analysis for stability"""
     
     @staticmethod
-    def compute_jacobian(state: MotorState, epsilon: float = 1e-6) -> np.ndarray:
+    def jacobian_batch(batch: MotorStateBatch) -> np.ndarray:
+        """
+        Analytic Jacobians ∂R/∂Ψ of the introspective reflection, shape (n, 3, 3)
+        
+        With I = sign(ΔΦ) and s' = sign(ΔΦ') (both +1 at 0, as for a forward
+        difference), R is piecewise linear in (ΔΦ, κ):
+        ∂ΔΦ'/∂(ΔΦ, κ) = (1, I), ∂κ'/∂(ΔΦ, κ) = s'·(1, I), and θ' moves with
+        θ by a unit step. θ' is piecewise constant in (ΔΦ, κ).
+        """
+        injection = np.where(batch.delta_phi < 0, -1.0, 1.0)
+        with np.errstate(over='ignore', invalid='ignore'):
+            new_delta_phi = batch.delta_phi + injection * batch.kappa
+        new_sign = np.where(new_delta_phi < 0, -1.0, 1.0)
+        
+        jacobian = np.zeros((len(batch), 3, 3))
+        jacobian[:, 0, 0] = 1.0
+        jacobian[:, 0, 1] = injection
+        jacobian[:, 1, 0] = new_sign
+        jacobian[:, 1, 1] = new_sign * injection
+        jacobian[:, 2, 2] = 1.0
+        return jacobian
+    
+    @staticmethod
+    def compute_jacobian(state: MotorState) -> np.ndarray:
         """
         Compute Jacobian matrix ∂R/∂Ψ around given state
         """
+        return CurvatureAnalyzer.jacobian_batch(MotorStateBatch.from_states([state]))[0]
+    
+    @staticmethod
+    def finite_difference_jacobian(state: MotorState, epsilon: float = 1e-6) -> np.ndarray:
+        """Forward-difference ∂R/∂Ψ (unit step in θ), for cross-checking"""
         # Get injection for current state
         injection = IntrospectionEngine.get_injection(state)
         
@@ -175,78 +635,180 @@ class CurvatureAnalyzer:
         base_result = ReflectionOperator.reflect(state, injection)
         
         jacobian = np.zeros((3, 3))
+        perturbations = [
+            (MotorState(state.delta_phi + epsilon, state.kappa, state.theta), epsilon),
+            (MotorState(state.delta_phi, state.kappa + epsilon, state.theta), epsilon),
+            (MotorState(state.delta_phi, state.kappa, state.theta + 1), 1.0)
+        ]
         
-        # Partial derivatives with respect to ΔΦ, κ, θ
-        for i, param in enumerate(['delta_phi', 'kappa', 'theta']):
-            # Create perturbed state
-            perturbed_state = MotorState(state.delta_phi, state.kappa, state.theta)
-            
-            if param == 'delta_phi':
-                perturbed_state.delta_phi += epsilon
-            elif param == 'kappa':
-                perturbed_state.kappa += epsilon
-            else:  # theta
-                perturbed_state.theta = (perturbed_state.theta + 1) % 6
-                epsilon = 1.0  # Discrete difference for theta
-            
-            # Get injection for perturbed state
+        for i, (perturbed_state, step) in enumerate(perturbations):
             perturbed_injection = IntrospectionEngine.get_injection(perturbed_state)
             perturbed_result = ReflectionOperator.reflect(perturbed_state, perturbed_injection)
             
             # Compute derivatives
-            jacobian[0, i] = (perturbed_result.delta_phi - base_result.delta_phi) / epsilon
-            jacobian[1, i] = (perturbed_result.kappa - base_result.kappa) / epsilon
-            jacobian[2, i] = ((perturbed_result.theta - base_result.theta + 3) % 6 - 3) / epsilon
+            jacobian[0, i] = (perturbed_result.delta_phi - base_result.delta_phi) / step
+            jacobian[1, i] = (perturbed_result.kappa - base_result.kappa) / step
+            jacobian[2, i] = ((perturbed_result.theta - base_result.theta + 3) % 6 - 3) / step
         
+        ReflectionCounter.add(1 + len(perturbations))
         return jacobian
     
     @staticmethod
-    def max_eigenvalue(jacobian: np.ndarray) -> float:
-        """Compute maximum absolute eigenvalue"""
+    def max_eigenvalue(jacobian: np.ndarray):
+        """Maximum absolute eigenvalue of one (3, 3) matrix or of each in a (n, 3, 3) stack"""
         eigenvals = np.linalg.eigvals(jacobian)
-        return np.max(np.abs(eigenvals))
+        return np.max(np.abs(eigenvals), axis=-1)
+    
+    @staticmethod
+    def stability_map(batch: MotorStateBatch, chunk_size: int = 1 << 18) -> np.ndarray:
+        """Maximum absolute Jacobian eigenvalue for every state of an ensemble"""
+        result = np.empty(len(batch))
+        for first in range(0, len(batch), chunk_size):
+            chunk = slice(first, first + chunk_size)
+            jacobians = CurvatureAnalyzer.jacobian_batch(
+                MotorStateBatch(batch.delta_phi[chunk], batch.kappa[chunk], batch.theta[chunk]))
+            result[chunk] = CurvatureAnalyzer.max_eigenvalue(jacobians)
+        return result
 
 class SplittingAnalyzer:
     """Analyze splitting behavior and bifurcation"""
     
     @staticmethod
-    def find_splitting_points(states: List[MotorState], tolerance: float = 1e-10) -> List[int]:
+    def find_splitting_points(states: Sequence, tolerance: float = 1e-10) -> List[int]:
         """Find states where ΔΦ ≈ 0 (splitting points)"""
-        splitting_indices = []
-        for i, state in enumerate(states):
-            if abs(state.delta_phi) < tolerance:
-                splitting_indices.append(i)
-        return splitting_indices
+        if isinstance(states, Trajectory):
+            delta_phi = states.delta_phi
+        else:
+            delta_phi = np.fromiter((state.delta_phi for state in states), dtype=np.float64,
+                                    count=len(states))
+        return np.flatnonzero(np.abs(delta_phi) < tolerance).tolist()
     
     @staticmethod
     def analyze_bifurcation(initial_state: MotorState, steps: int = 100, 
-                          epsilon: float = 1e-6) -> Tuple[List[MotorState], List[MotorState]]:
+                          epsilon: float = 1e-6) -> Tuple[Trajectory, Trajectory]:
         """
         Analyze symmetric bifurcation from nearly identical initial conditions
         Returns two trajectory branches
         """
-        # Create two nearly identical states
-        state_plus = MotorState(initial_state.delta_phi + epsilon, 
-                               initial_state.kappa, initial_state.theta)
-        state_minus = MotorState(initial_state.delta_phi - epsilon, 
-                                initial_state.kappa, initial_state.theta)
-        
-        trajectory_plus = [state_plus]
-        trajectory_minus = [state_minus]
-        
-        # Evolve both trajectories
-        for _ in range(steps):
-            # Positive branch
-            injection_plus = IntrospectionEngine.get_injection(trajectory_plus[-1])
-            next_plus = ReflectionOperator.reflect(trajectory_plus[-1], injection_plus)
-            trajectory_plus.append(next_plus)
-            
-            # Negative branch  
-            injection_minus = IntrospectionEngine.get_injection(trajectory_minus[-1])
-            next_minus = ReflectionOperator.reflect(trajectory_minus[-1], injection_minus)
-            trajectory_minus.append(next_minus)
+        # Evolve both branches (ΔΦ ± ε) in lockstep
+        branches = MotorStateBatch(
+            np.array([initial_state.delta_phi + epsilon, initial_state.delta_phi - epsilon]),
+            np.full(2, initial_state.kappa),
+            np.full(2, initial_state.theta)
+        )
+        trajectories = BatchEvolution.evolve(branches, steps)
+        trajectory_plus = trajectories.member(0)
+        trajectory_minus = trajectories.member(1)
         
         return trajectory_plus, trajectory_minus
+    
+    @staticmethod
+    def bifurcation_ensemble(initial_state: MotorState, epsilons, directions=None,
+                             steps: int = 100, divergence_threshold: float = 1.0,
+                             tolerance: float = 1e-10) -> Dict:
+        """
+        Symmetric bifurcation for many perturbation magnitudes and directions
+        
+        Every (ε, direction d) pair evolves branches Ψ ± ε·d in one ensemble,
+        d a non-zero direction in the (ΔΦ, κ) plane normalised to unit length
+        (default: ΔΦ only, as in analyze_bifurcation); κ is clipped at 0.
+        Returns divergence curves, the first step each pair exceeds
+        divergence_threshold and the first splitting step (|ΔΦ| < tolerance)
+        of each branch, -1 where never, plus per-ε statistics over directions.
+        """
+        epsilons = np.atleast_1d(np.asarray(epsilons, dtype=np.float64))
+        directions = (np.array([[1.0, 0.0]]) if directions is None
+                      else np.asarray(directions, dtype=np.float64).reshape(-1, 2))
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        invalid = ~(np.isfinite(norms[:, 0]) & (norms[:, 0] > 0))
+        if invalid.any():
+            raise ValueError(f"Directions need a finite non-zero norm (rows {np.flatnonzero(invalid).tolist()})")
+        directions = directions / norms
+        offsets = (epsilons[:, None, None] * directions[None, :, :]).reshape(-1, 2)
+        pairs = len(offsets)
+        
+        base = np.array([initial_state.delta_phi, initial_state.kappa])
+        branches = np.concatenate([base + offsets, base - offsets])
+        batch = MotorStateBatch(branches[:, 0], np.maximum(branches[:, 1], 0.0),
+                                np.full(2 * pairs, initial_state.theta))
+        
+        divergence = np.empty((steps + 1, pairs))
+        first_split = np.full(2 * pairs, -1)
+        with np.errstate(over='ignore', invalid='ignore'):
+            for step in range(steps + 1):
+                if step:
+                    batch = BatchEvolution.step(batch)
+                divergence[step] = MetricSpace.distance_batch(
+                    batch.delta_phi[:pairs], batch.kappa[:pairs], batch.theta[:pairs],
+                    batch.delta_phi[pairs:], batch.kappa[pairs:], batch.theta[pairs:]
+                )
+                splitting = (np.abs(batch.delta_phi) < tolerance) & (first_split < 0)
+                first_split[splitting] = step
+        
+        diverged = divergence > divergence_threshold
+        first_divergence = np.where(diverged.any(axis=0), diverged.argmax(axis=0), -1)
+        shape = (len(epsilons), len(directions))
+        first_divergence = first_divergence.reshape(shape)
+        
+        # Statistics over directions for each ε (diverged pairs only)
+        reached = first_divergence >= 0
+        count = reached.sum(axis=1)
+        steps_reached = np.where(reached, first_divergence, 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_step = np.where(count > 0, steps_reached.sum(axis=1) / count, np.nan)
+        
+        return {
+            'epsilons': epsilons,
+            'directions': directions,
+            'divergence': divergence.reshape(steps + 1, *shape),
+            'first_divergence_step': first_divergence,
+            'first_splitting_step': first_split.reshape(2, *shape),
+            'statistics': {
+                'diverged_fraction': reached.mean(axis=1),
+                'mean_first_divergence_step': mean_step,
+                'min_first_divergence_step': np.where(
+                    count > 0, np.where(reached, first_divergence, steps + 1).min(axis=1), -1),
+                'max_first_divergence_step': first_divergence.max(axis=1),
+                'final_divergence_mean': divergence[-1].reshape(shape).mean(axis=1)
+            }
+        }
+
+class DisjointSet:
+    """Array-based union-find with vectorized find/union"""
+    
+    def __init__(self, size: int):
+        self.parent = np.arange(size)
+    
+    def find(self, items: np.ndarray) -> np.ndarray:
+        """Roots of `items` (pointer jumping with path compression)"""
+        roots = self.parent[items]
+        while True:
+            up = self.parent[roots]
+            if np.array_equal(up, roots):
+                break
+            roots = up
+        self.parent[items] = roots
+        return roots
+    
+    def union(self, a: np.ndarray, b: np.ndarray):
+        """Merge the sets of every pair (a[i], b[i])"""
+        while len(a):
+            root_a, root_b = self.find(a), self.find(b)
+            differ = root_a != root_b
+            if not differ.any():
+                break
+            # Conflicting writes to one root are retried on the next pass
+            self.parent[np.maximum(root_a[differ], root_b[differ])] = np.minimum(root_a[differ],
+                                                                                 root_b[differ])
+            a, b = a[differ], b[differ]
+    
+    def labels(self) -> np.ndarray:
+        """Dense set labels numbered in order of first occurrence"""
+        roots = self.find(np.arange(len(self.parent)))
+        _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first, kind='stable')] = np.arange(len(first))
+        return rank[inverse.ravel()]
 
 class EquivalenceClassAnalyzer:
     """Analyze equivalence classes and quotient space formation"""
@@ -263,7 +825,7 @@ class EquivalenceClassAnalyzer:
         # Evolve both states and check for convergence
         s1, s2 = state1, state2
         
-        for _ in range(max_steps):
+        for step in range(1, max_steps + 1):
             # Evolve state 1
             i1 = IntrospectionEngine.get_injection(s1)
             s1 = ReflectionOperator.reflect(s1, i1)
@@ -274,26 +836,179 @@ class EquivalenceClassAnalyzer:
             
             # Check if they're close enough
             if MetricSpace.distance(s1, s2) < self.tolerance:
+                ReflectionCounter.add(2 * step)
                 return True
         
+        ReflectionCounter.add(2 * max_steps)
         return False
     
-    def build_equivalence_classes(self, states: List[MotorState]) -> List[List[MotorState]]:
-        """Build equivalence classes from list of states"""
-        self.equivalence_classes = []
-        
-        for state in states:
-            # Find existing class for this state
-            placed = False
-            for eq_class in self.equivalence_classes:
-                if self.are_equivalent(state, eq_class[0]):
-                    eq_class.append(state)
-                    placed = True
-                    break
+    def _neighbour_offsets(self, cell: float) -> List[Tuple[int, int, int]]:
+        """Half of the (ΔΦ cell, κ cell, θ) offsets that can hold states within tolerance"""
+        reach = int(np.ceil(self.tolerance / cell))
+        offsets = []
+        for di in range(0, reach + 1):
+            for dk in range(-reach, reach + 1):
+                for dt in range(6):
+                    if (di, dk) == (0, 0) and not 0 < dt <= 3:
+                        continue
+                    if di == 0 and dk < 0:
+                        continue
+                    gap = (max(di - 1, 0) + max(abs(dk) - 1, 0)) * cell + min(dt, 6 - dt)
+                    if gap < self.tolerance:
+                        offsets.append((di, dk, dt))
+        return offsets
+    
+    def _merge_close(self, sets: DisjointSet, delta_phi: np.ndarray, kappa: np.ndarray,
+                     theta: np.ndarray, offsets, cell: float, pair_budget: int = 1 << 22) -> bool:
+        """
+        Union states closer than tolerance at one evolution step.
+        
+        Returns False when no two states of different classes share
+        neighbouring (ΔΦ, κ) cells, i.e. none can come within tolerance later.
+        """
+        members = np.flatnonzero(np.isfinite(delta_phi) & np.isfinite(kappa))
+        if len(members) < 2:
+            return False
+        
+        # Exact duplicates (converged orbits) merge by hashing
+        coords = np.stack([delta_phi[members], kappa[members], theta[members]], axis=1)
+        _, first, inverse = np.unique(coords, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+        sets.union(members, members[first[inverse]])
+        members = members[first]
+        
+        # Cells of size tolerance/2: one cell and phase are always within tolerance
+        ci = np.floor(delta_phi[members] / cell)
+        ck = np.floor(kappa[members] / cell)
+        near = (np.abs(ci) < 2.0 ** 52) & (np.abs(ck) < 2.0 ** 52)
+        members, ci, ck = members[near], ci[near].astype(np.int64), ck[near].astype(np.int64)
+        if len(members) < 2:
+            return False
+        th = theta[members]
+        
+        cells_i, rank_i = np.unique(ci, return_inverse=True)
+        cells_k, rank_k = np.unique(ck, return_inverse=True)
+        rank_i, rank_k = rank_i.ravel(), rank_k.ravel()
+        key = (rank_i * len(cells_k) + rank_k) * 6 + th
+        order = np.argsort(key, kind='stable')
+        members, key, ci, ck, th = members[order], key[order], ci[order], ck[order], th[order]
+        group_start = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        group_size = np.diff(np.r_[group_start, len(key)])
+        sets.union(members, members[np.repeat(group_start, group_size)])
+        
+        # Representative per (cell, phase) group
+        g_key, g_i, g_k, g_t = key[group_start], ci[group_start], ck[group_start], th[group_start]
+        g_root = sets.find(members[group_start])
+        
+        for di, dk, dt in offsets:
+            ni = np.searchsorted(cells_i, g_i + di).clip(max=len(cells_i) - 1)
+            nk = np.searchsorted(cells_k, g_k + dk).clip(max=len(cells_k) - 1)
+            exists = (cells_i[ni] == g_i + di) & (cells_k[nk] == g_k + dk)
+            target = (ni * len(cells_k) + nk) * 6 + (g_t + dt) % 6
+            partner = np.searchsorted(g_key, target).clip(max=len(g_key) - 1)
+            exists &= g_key[partner] == target
+            source = np.flatnonzero(exists)
+            partner = partner[source]
+            pending = g_root[source] != g_root[partner]
+            source_groups, partner_groups = source[pending], partner[pending]
+            if not len(source_groups):
+                continue
             
-            # Create new class if needed
-            if not placed:
-                self.equivalence_classes.append([state])
+            # Expand member pairs of neighbouring groups within a memory budget
+            pair_counts = group_size[source_groups] * group_size[partner_groups]
+            bounds = np.searchsorted(np.cumsum(pair_counts), np.arange(pair_budget, pair_counts.sum(),
+                                                                       pair_budget), side='right')
+            for chunk in np.split(np.arange(len(source_groups)), bounds):
+                a_groups, b_groups = source_groups[chunk], partner_groups[chunk]
+                pending = sets.find(members[group_start[a_groups]]) != \
+                    sets.find(members[group_start[b_groups]])
+                a_groups, b_groups = a_groups[pending], b_groups[pending]
+                if not len(a_groups):
+                    continue
+                if len(a_groups) == 1 and pair_counts[chunk[0]] > pair_budget:
+                    a_start, b_start = group_start[a_groups[0]], group_start[b_groups[0]]
+                    self._merge_large_pair(sets, members[a_start:a_start + group_size[a_groups[0]]],
+                                           members[b_start:b_start + group_size[b_groups[0]]],
+                                           delta_phi, kappa, theta, pair_budget)
+                    continue
+                counts = group_size[a_groups] * group_size[b_groups]
+                pair = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                b_size = np.repeat(group_size[b_groups], counts)
+                a = members[np.repeat(group_start[a_groups], counts) + pair // b_size]
+                b = members[np.repeat(group_start[b_groups], counts) + pair % b_size]
+                distance = MetricSpace.distance_batch(delta_phi[a], kappa[a], theta[a],
+                                                      delta_phi[b], kappa[b], theta[b])
+                close = distance < self.tolerance
+                sets.union(a[close], b[close])
+            g_root = sets.find(members[group_start])
+        
+        # Classes whose (ΔΦ, κ) cells touch may still meet at a later step
+        cell_id = g_key // 6
+        cell_ids, cell_index = np.unique(cell_id, return_inverse=True)
+        cell_index = cell_index.ravel()
+        low = np.full(len(cell_ids), np.iinfo(np.int64).max)
+        high = np.full(len(cell_ids), -1)
+        np.minimum.at(low, cell_index, g_root)
+        np.maximum.at(high, cell_index, g_root)
+        if np.any(low != high):
+            return True
+        c_i, c_k = cells_i[cell_ids // len(cells_k)], cells_k[cell_ids % len(cells_k)]
+        for di, dk in {(di, dk) for di, dk, _ in offsets if (di, dk) != (0, 0)}:
+            ni = np.searchsorted(cells_i, c_i + di).clip(max=len(cells_i) - 1)
+            nk = np.searchsorted(cells_k, c_k + dk).clip(max=len(cells_k) - 1)
+            target = ni * len(cells_k) + nk
+            partner = np.searchsorted(cell_ids, target).clip(max=len(cell_ids) - 1)
+            exists = ((cells_i[ni] == c_i + di) & (cells_k[nk] == c_k + dk) &
+                      (cell_ids[partner] == target))
+            if np.any(low[exists] != low[partner[exists]]):
+                return True
+        return False
+    
+    def _merge_large_pair(self, sets: DisjointSet, a: np.ndarray, b: np.ndarray,
+                          delta_phi: np.ndarray, kappa: np.ndarray, theta: np.ndarray,
+                          pair_budget: int):
+        """Merge two single-class groups if any cross pair is within tolerance"""
+        rows = max(1, pair_budget // len(b))
+        for first in range(0, len(a), rows):
+            block = a[first:first + rows, None]
+            distance = MetricSpace.distance_batch(delta_phi[block], kappa[block], theta[block],
+                                                  delta_phi[b], kappa[b], theta[b])
+            close = np.argwhere(distance < self.tolerance)
+            if len(close):
+                sets.union(block[close[:1, 0], 0], b[close[:1, 1]])
+                return
+    
+    def classify(self, batch: MotorStateBatch, max_steps: int = 1000) -> np.ndarray:
+        """
+        Equivalence class label per state (numbered by first occurrence).
+        
+        Every state is evolved once in lockstep; at each step states closer
+        than tolerance are merged by cell hashing and union-find, so classes
+        are the transitive closure of Rⁿ(Ψ₁) ≈ Rⁿ(Ψ₂). After the first
+        reflection κ = |ΔΦ| and each further step doubles ΔΦ and κ, so the
+        (ΔΦ, κ) gap between orbits never shrinks and evolution stops once no
+        two classes share neighbouring cells.
+        """
+        sets = DisjointSet(len(batch))
+        cell = self.tolerance / 2
+        offsets = self._neighbour_offsets(cell)
+        
+        with np.errstate(over='ignore', invalid='ignore'):
+            for _ in range(max_steps):
+                batch = BatchEvolution.step(batch)
+                if not self._merge_close(sets, batch.delta_phi, batch.kappa, batch.theta,
+                                         offsets, cell):
+                    break
+        
+        return sets.labels()
+    
+    def build_equivalence_classes(self, states: List[MotorState],
+                                  max_steps: int = 1000) -> List[List[MotorState]]:
+        """Build equivalence classes from list of states"""
+        labels = self.classify(MotorStateBatch.from_states(states), max_steps)
+        self.equivalence_classes = [[] for _ in range(labels.max() + 1 if len(labels) else 0)]
+        for state, label in zip(states, labels.tolist()):
+            self.equivalence_classes[label].append(state)
         
         return self.equivalence_classes
 
@@ -314,68 +1029,627 @@ class ImplosionAnalyzer:
         
         return MotorState(new_delta_phi, new_kappa, new_theta)
     
+    @staticmethod
+    def evolve_damped(delta_phi, kappa, theta, alpha,
+                      steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Final (ΔΦ, κ, θ) after `steps` damped reflections, broadcast over states and α"""
+        delta_phi, kappa, theta, alpha = np.broadcast_arrays(
+            np.asarray(delta_phi, dtype=np.float64), np.asarray(kappa, dtype=np.float64),
+            np.asarray(theta, dtype=np.int64), np.asarray(alpha, dtype=np.float64)
+        )
+        damping = 1 - alpha
+        
+        with np.errstate(over='ignore', invalid='ignore'):
+            for _ in range(steps):
+                injection = np.where(delta_phi < 0, -1.0, 1.0)
+                delta_phi = delta_phi + injection * kappa
+                kappa = np.abs(delta_phi) * damping
+                theta = (theta + np.sign(delta_phi).astype(np.int64)) % 6
+        
+        ReflectionCounter.add(steps * delta_phi.size)
+        return delta_phi, kappa, theta
+    
+    @staticmethod
+    def damped_orbit_tails(delta_phi, kappa, theta, alpha, transient: int, samples: int,
+                           renormalize: bool = True) -> Iterator[Tuple[np.ndarray, ...]]:
+        """
+        Yield (ΔΦ, κ, θ, growth) after each of `samples` damped reflections
+        that follow `transient` discarded ones, broadcast over states and α.
+        growth = ln|ΔΦ'/ΔΦ| of that step.
+        
+        The damped map is positively homogeneous in (ΔΦ, κ): renormalize
+        divides both by |ΔΦ| after every step, which leaves θ and growth
+        unchanged but keeps orbits from overflowing to inf/nan.
+        """
+        delta_phi, kappa, theta, alpha = np.broadcast_arrays(
+            np.asarray(delta_phi, dtype=np.float64), np.asarray(kappa, dtype=np.float64),
+            np.asarray(theta, dtype=np.int64), np.asarray(alpha, dtype=np.float64)
+        )
+        damping = 1 - alpha
+        
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            for step in range(transient + samples):
+                injection = np.where(delta_phi < 0, -1.0, 1.0)
+                new_delta_phi = delta_phi + injection * kappa
+                magnitude = np.abs(new_delta_phi)
+                kappa = magnitude * damping
+                theta = (theta + np.sign(new_delta_phi).astype(np.int64)) % 6
+                if step >= transient:
+                    growth = np.log(magnitude) - np.log(np.abs(delta_phi))
+                delta_phi = new_delta_phi
+                if renormalize:
+                    scale = np.where((magnitude > 0) & np.isfinite(magnitude), magnitude, 1.0)
+                    delta_phi = delta_phi / scale
+                    kappa = kappa / scale
+                ReflectionCounter.add(delta_phi.size)
+                if step >= transient:
+                    yield delta_phi, kappa, theta, growth
+    
+    @staticmethod
+    def find_critical_thresholds(batch: MotorStateBatch,
+                                 alpha_range: Tuple[float, float] = (0.0, 0.5),
+                                 alpha_steps: int = 100, evolution_steps: int = 80,
+                                 tolerance: float = 1e-9) -> Dict:
+        """
+        Critical threshold αc = argmin |κ(α)| for every initial state.
+        
+        All states and grid α values are evolved at once; the grid minimum is
+        then refined by lockstep golden-section search over its neighbouring
+        grid cells (|κ(α)| assumed unimodal there) until the bracket is
+        narrower than `tolerance`. αc lies within the returned bounds.
+        
+        Tolerances below the float spacing of the bracket are raised to it;
+        the tolerance actually used is returned as 'critical_alpha_tolerance'.
+        """
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+        
+        alpha_values = np.linspace(alpha_range[0], alpha_range[1], alpha_steps)
+        initial = (batch.delta_phi[:, None], batch.kappa[:, None], batch.theta[:, None])
+        _, final_kappa, _ = ImplosionAnalyzer.evolve_damped(*initial, alpha_values[None, :],
+                                                            evolution_steps)
+        best = np.argmin(np.abs(final_kappa), axis=1)
+        
+        def objective(alpha: np.ndarray) -> np.ndarray:
+            _, kappa, _ = ImplosionAnalyzer.evolve_damped(batch.delta_phi, batch.kappa, batch.theta,
+                                                          alpha, evolution_steps)
+            return np.abs(kappa)
+        
+        # Golden-section search, one objective evaluation per iteration
+        ratio = (np.sqrt(5.0) - 1.0) / 2.0
+        lower = alpha_values[np.maximum(best - 1, 0)]
+        upper = alpha_values[np.minimum(best + 1, alpha_steps - 1)]
+        inner_low = upper - ratio * (upper - lower)
+        inner_high = lower + ratio * (upper - lower)
+        f_low, f_high = objective(inner_low), objective(inner_high)
+        
+        # Bracket shrinks by `ratio` per iteration; cap iterations in case
+        # rounding stalls it just above the tolerance
+        tolerance = max(tolerance, float(np.max(np.spacing(np.abs(upper)))))
+        width = float(np.max(upper - lower))
+        iterations = 0
+        if width > tolerance:
+            iterations = int(np.ceil(np.log(tolerance / width) / np.log(ratio))) + 4
+        
+        for _ in range(iterations):
+            if np.max(upper - lower) <= tolerance:
+                break
+            keep_low = f_low <= f_high
+            upper = np.where(keep_low, inner_high, upper)
+            lower = np.where(keep_low, lower, inner_low)
+            probe = np.where(keep_low, upper - ratio * (upper - lower), lower + ratio * (upper - lower))
+            inner_high, inner_low = (np.where(keep_low, inner_low, probe),
+                                     np.where(keep_low, probe, inner_high))
+            f_probe = objective(probe)
+            f_high, f_low = np.where(keep_low, f_low, f_probe), np.where(keep_low, f_probe, f_high)
+        
+        # Minima at the bracket ends (e.g. the α range boundary) are never probed
+        candidates = np.stack([lower, inner_low, inner_high, upper])
+        values = np.stack([objective(lower), f_low, f_high, objective(upper)])
+        critical = candidates[np.argmin(values, axis=0), np.arange(len(batch))]
+        
+        return {
+            'alpha_values': alpha_values,
+            'final_kappa_values': final_kappa,
+            'grid_critical_alpha': alpha_values[best],
+            'critical_alpha': critical,
+            'critical_alpha_bounds': np.stack([lower, upper], axis=1),
+            'critical_alpha_error': np.maximum(critical - lower, upper - critical),
+            'critical_alpha_tolerance': tolerance
+        }
+    
     @staticmethod
     def find_critical_threshold(initial_state: MotorState, 
                               alpha_range: Tuple[float, float] = (0.0, 0.5),
-                              alpha_steps: int = 100, evolution_steps: int = 80) -> Dict:
+                              alpha_steps: int = 100, evolution_steps: int = 80,
+                              tolerance: float = 1e-9) -> Dict:
         """
         Find critical threshold αc where implosion behavior changes
         """
-        alpha_values = np.linspace(alpha_range[0], alpha_range[1], alpha_steps)
-        final_kappa_values = []
+        result = ImplosionAnalyzer.find_critical_thresholds(
+            MotorStateBatch.from_states([initial_state]), alpha_range, alpha_steps,
+            evolution_steps, tolerance
+        )
         
-        for alpha in alpha_values:
-            state = MotorState(initial_state.delta_phi, initial_state.kappa, initial_state.theta)
-            
-            # Evolve system with this alpha
-            for _ in range(evolution_steps):
-                state = ImplosionAnalyzer.implosion_step_with_damping(state, alpha)
-            
-            final_kappa_values.append(state.kappa)
+        return {
+            'alpha_values': result['alpha_values'].tolist(),
+            'final_kappa_values': result['final_kappa_values'][0].tolist(),
+            'grid_critical_alpha': float(result['grid_critical_alpha'][0]),
+            'critical_alpha': float(result['critical_alpha'][0]),
+            'critical_alpha_bounds': result['critical_alpha_bounds'][0].tolist(),
+            'critical_alpha_error': float(result['critical_alpha_error'][0]),
+            'critical_alpha_tolerance': result['critical_alpha_tolerance']
+        }
+
+def _bifurcation_chunk(task: Tuple) -> Tuple[int, np.ndarray, int, int]:
+    """Histogram one α chunk's orbit tails: (first column, counts, outside, non-finite)"""
+    (alpha, columns, delta_phi, kappa, theta, transient, samples, renormalize,
+     observable, value_range, value_bins, buffer_size) = task
+    first = int(columns.min())
+    base = (columns - first) * value_bins
+    counts = np.zeros((int(columns.max()) - first + 1) * value_bins, dtype=np.int64)
+    low, high = value_range
+    scale = value_bins / (high - low)
+    buffer = np.empty(max(buffer_size, len(alpha)), dtype=np.int64)
+    filled = outside = nonfinite = 0
+    
+    for tail in ImplosionAnalyzer.damped_orbit_tails(delta_phi, kappa, theta, alpha,
+                                                    transient, samples, renormalize):
+        values = tail[BifurcationDiagram.OBSERVABLES.index(observable)]
+        with np.errstate(invalid='ignore'):
+            rows = np.floor((values - low) * scale)
+        finite = np.isfinite(rows)
+        inside = finite & (rows >= 0) & (rows < value_bins)
+        index = base[inside] + rows[inside].astype(np.int64)
+        nonfinite += len(rows) - int(finite.sum())
+        outside += int(finite.sum()) - len(index)
+        
+        # Rasterize in large batches: one bincount per buffer instead of per step
+        if filled + len(index) > len(buffer):
+            counts += np.bincount(buffer[:filled], minlength=len(counts))
+            filled = 0
+        buffer[filled:filled + len(index)] = index
+        filled += len(index)
+    
+    counts += np.bincount(buffer[:filled], minlength=len(counts))
+    return first, counts, outside, nonfinite
+
+class BifurcationDiagram:
+    """
+    Bifurcation diagram of the damped implosion map as a 2D histogram
+    
+    A dense α grid (times any number of initial states) is evolved in
+    lockstep chunks. Transients are discarded and every tail iterate of the
+    chosen observable is binned into histogram[α bin, value bin] as it is
+    produced, so α × iterate samples are never held in memory. Repeated
+    accumulate() calls add orbits to the same histogram.
+    """
+    
+    # Per-iterate quantities yielded by ImplosionAnalyzer.damped_orbit_tails
+    OBSERVABLES = ('delta_phi', 'kappa', 'theta', 'growth')
+    
+    # Observables left meaningful once orbits are renormalized to |ΔΦ| = 1
+    # (ΔΦ is pinned to ±1 and κ to 1 - α)
+    RENORMALIZED_OBSERVABLES = ('theta', 'growth')
+    
+    def __init__(self, alpha_range: Tuple[float, float] = (0.0, 1.0), alpha_bins: int = 1024,
+                 value_bins: int = 512, observable: str = 'theta',
+                 value_range: Optional[Tuple[float, float]] = None, renormalize: bool = True):
+        """
+        alpha_range: must lie within [0, 1]; for α > 1 the damped map gives
+        κ' < 0, which implosion_step_with_damping rejects.
+        value_range: observable range of the value axis; None takes it from a
+        pilot run (θ always uses (-0.5, 5.5)).
+        renormalize: see damped_orbit_tails; only θ and growth are allowed
+        with it, use renormalize=False for ΔΦ or κ diagrams.
+        """
+        if observable not in self.OBSERVABLES:
+            raise ValueError(f"Observable must be one of {self.OBSERVABLES}")
+        if renormalize and observable not in self.RENORMALIZED_OBSERVABLES:
+            raise ValueError(f"Observable {observable!r} is constant under renormalization; "
+                             f"use one of {self.RENORMALIZED_OBSERVABLES} or renormalize=False")
+        low, high = alpha_range
+        if not 0.0 <= low < high <= 1.0:
+            raise ValueError("alpha_range must satisfy 0 ≤ low < high ≤ 1")
+        self.alpha_range = tuple(alpha_range)
+        self.observable = observable
+        self.renormalize = renormalize
+        if value_range is None and observable == 'theta':
+            value_range = (-0.5, 5.5)
+        self.value_range = None if value_range is None else tuple(value_range)
+        self.histogram = np.zeros((alpha_bins, value_bins), dtype=np.int64)
+        self.orbits = 0
+        self.outside = 0      # finite samples beyond value_range
+        self.nonfinite = 0    # overflowed or undefined samples
+    
+    @property
+    def alpha_edges(self) -> np.ndarray:
+        return np.linspace(*self.alpha_range, self.histogram.shape[0] + 1)
+    
+    @property
+    def value_edges(self) -> np.ndarray:
+        return np.linspace(*self.value_range, self.histogram.shape[1] + 1)
+    
+    def alpha_grid(self, alpha_points: Optional[int] = None) -> np.ndarray:
+        """Midpoints of `alpha_points` equal α cells (default: one per α bin)"""
+        alpha_points = alpha_points or self.histogram.shape[0]
+        low, high = self.alpha_range
+        return low + (np.arange(alpha_points) + 0.5) * (high - low) / alpha_points
+    
+    def _pilot_range(self, batch: MotorStateBatch, transient: int,
+                     samples: int) -> Tuple[float, float]:
+        """Finite observable range over a coarse α subset"""
+        alpha = self.alpha_grid(min(256, self.histogram.shape[0]))
+        index = self.OBSERVABLES.index(self.observable)
+        low, high = np.inf, -np.inf
+        for tail in ImplosionAnalyzer.damped_orbit_tails(
+                batch.delta_phi[None, :], batch.kappa[None, :], batch.theta[None, :],
+                alpha[:, None], transient, min(samples, 64), self.renormalize):
+            values = tail[index][np.isfinite(tail[index])]
+            if len(values):
+                low, high = min(low, values.min()), max(high, values.max())
+        if not np.isfinite(low):
+            raise ValueError(f"No finite {self.observable} samples; pass value_range explicitly")
+        pad = 0.05 * (high - low) if high > low else 0.5
+        return float(low - pad), float(high + pad)
+    
+    def accumulate(self, initial_states: Optional[MotorStateBatch] = None,
+                   alpha_points: Optional[int] = None, transient: int = 1000,
+                   samples: int = 1000, alpha_chunk: int = 8192, processes: Optional[int] = 1,
+                   buffer_size: int = 1 << 20) -> 'BifurcationDiagram':
+        """
+        Add the orbit tails of every (α, initial state) pair to the histogram
         
+        processes=None spreads α chunks over all cores; partial histograms
+        are summed as they arrive.
+        """
+        if initial_states is None:
+            initial_states = MotorStateBatch.from_states([MotorState(0.1, 1.0, 0)])
+        batch = initial_states
+        if self.value_range is None:
+            self.value_range = self._pilot_range(batch, transient, samples)
+        
+        # Flatten α × initial states into independent orbits
+        alpha = np.repeat(self.alpha_grid(alpha_points), len(batch))
+        states = [np.tile(component, len(alpha) // len(batch))
+                  for component in (batch.delta_phi, batch.kappa, batch.theta)]
+        low, high = self.alpha_range
+        alpha_bins, value_bins = self.histogram.shape
+        columns = np.minimum(((alpha - low) / (high - low) * alpha_bins).astype(np.int64),
+                             alpha_bins - 1)
+        
+        tasks = ((alpha[i:i + alpha_chunk], columns[i:i + alpha_chunk],
+                  *(component[i:i + alpha_chunk] for component in states),
+                  transient, samples, self.renormalize, self.observable, self.value_range,
+                  value_bins, buffer_size)
+                 for i in range(0, len(alpha), alpha_chunk))
+        
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes <= 1:
+            partials = map(_bifurcation_chunk, tasks)
+            self._merge(partials)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+                self._merge(pool.map(_bifurcation_chunk, tasks))
+        
+        self.orbits += len(alpha)
+        logger.info(f"Bifurcation diagram: {self.orbits} orbits, {int(self.histogram.sum())} samples")
+        return self
+    
+    def _merge(self, partials):
+        flat = self.histogram.reshape(-1)
+        for first, counts, outside, nonfinite in partials:
+            start = first * self.histogram.shape[1]
+            flat[start:start + len(counts)] += counts
+            self.outside += outside
+            self.nonfinite += nonfinite
+    
+    def density(self, log: bool = True) -> np.ndarray:
+        """Per-α-column normalized density (α bins × value bins), optionally log-scaled"""
+        totals = self.histogram.sum(axis=1, keepdims=True)
+        density = self.histogram / np.maximum(totals, 1)
+        if log:
+            density = np.log1p(density * self.histogram.shape[1])
+        return density
+    
+    def plot(self, ax=None, log: bool = True, cmap: str = 'magma'):
+        """Render the diagram with matplotlib (imported on demand)"""
+        import matplotlib.pyplot as plt
+        
+        if ax is None:
+            _, ax = plt.subplots(figsize=(8, 5), dpi=150)
+        ax.imshow(self.density(log).T, origin='lower', aspect='auto', cmap=cmap,
+                  interpolation='nearest',
+                  extent=(*self.alpha_range, *self.value_range))
+        ax.set_xlabel('α')
+        ax.set_ylabel({'delta_phi': 'ΔΦ', 'kappa': 'κ', 'theta': 'θ',
+                       'growth': 'ln|ΔΦ′/ΔΦ|'}[self.observable])
+        return ax
+    
+    def to_dict(self) -> Dict[str, Any]:
         return {
-            'alpha_values': alpha_values.tolist(),
-            'final_kappa_values': final_kappa_values,
-            'critical_alpha': alpha_values[np.argmin(np.abs(final_kappa_values))]
+            'alpha_range': list(self.alpha_range),
+            'value_range': list(self.value_range) if self.value_range else None,
+            'observable': self.observable,
+            'renormalize': self.renormalize,
+            'orbits': self.orbits,
+            'outside': self.outside,
+            'nonfinite': self.nonfinite,
+            'histogram': self.histogram
         }
 
+def _json_default(obj):
+    """json.dump hook for NumPy scalars and arrays"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class LazyResults(Mapping):
+    """Read-only view of a columnar results file; arrays load on first access"""
+    
+    def __init__(self, archive, skeleton: Dict):
+        self._archive = archive
+        self._skeleton = skeleton
+        self._arrays: Dict[str, np.ndarray] = {}
+    
+    def __getitem__(self, key):
+        value = self._skeleton[key]
+        if isinstance(value, dict):
+            if ColumnarResults.ARRAY_REF in value:
+                name = value[ColumnarResults.ARRAY_REF]
+                if name not in self._arrays:
+                    self._arrays[name] = self._archive[name]
+                return self._arrays[name]
+            return LazyResults(self._archive, value)
+        return value
+    
+    def __iter__(self):
+        return iter(self._skeleton)
+    
+    def __len__(self) -> int:
+        return len(self._skeleton)
+    
+    def to_dict(self, as_lists: bool = False) -> Dict:
+        """Materialize everything (arrays as lists with as_lists=True)"""
+        result = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, LazyResults):
+                value = value.to_dict(as_lists)
+            elif as_lists and isinstance(value, np.ndarray):
+                value = value.tolist()
+            result[key] = value
+        return result
+    
+    def close(self):
+        self._archive.close()
+    
+    def __enter__(self) -> 'LazyResults':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class ColumnarResults:
+    """Results as typed arrays in an .npz container plus a JSON skeleton"""
+    
+    FORMAT_VERSION = 1
+    METADATA_KEY = '__metadata__'
+    ARRAY_REF = '__array__'
+    
+    @staticmethod
+    def _split(value, arrays: Dict[str, np.ndarray]):
+        """Replace numeric series by array references, collecting the arrays"""
+        if isinstance(value, dict):
+            return {key: ColumnarResults._split(item, arrays) for key, item in value.items()}
+        if isinstance(value, (list, tuple, np.ndarray)) and len(value) > 0:
+            try:
+                array = np.asarray(value)
+            except ValueError:  # ragged
+                array = None
+            if array is not None and array.dtype.kind in 'biuf':
+                name = f'a{len(arrays)}'
+                arrays[name] = array
+                return {ColumnarResults.ARRAY_REF: name}
+            return [ColumnarResults._split(item, arrays) for item in value]
+        return value
+    
+    @staticmethod
+    def save(path, results: Dict, compress: bool = False) -> str:
+        """Write results; numeric series become typed arrays"""
+        arrays: Dict[str, np.ndarray] = {}
+        skeleton = ColumnarResults._split(results, arrays)
+        metadata = json.dumps({'format_version': ColumnarResults.FORMAT_VERSION,
+                               'results': skeleton}, default=_json_default)
+        arrays[ColumnarResults.METADATA_KEY] = np.frombuffer(metadata.encode('utf-8'), dtype=np.uint8)
+        
+        path = Path(path)
+        with open(path, 'wb') as f:
+            (np.savez_compressed if compress else np.savez)(f, **arrays)
+        return str(path)
+    
+    @staticmethod
+    def load(path) -> LazyResults:
+        """Open a results file lazily"""
+        archive = np.load(Path(path), allow_pickle=False)
+        metadata = json.loads(archive[ColumnarResults.METADATA_KEY].tobytes().decode('utf-8'))
+        if metadata.get('format_version') != ColumnarResults.FORMAT_VERSION:
+            archive.close()
+            raise ValueError(f"Unsupported results format: {metadata.get('format_version')}")
+        return LazyResults(archive, metadata['results'])
+
+class SweepProfiler:
+    """Per-test wall/CPU time, tracemalloc peak and reflection counts"""
+    
+    def __init__(self, trace_memory: bool = False):
+        """trace_memory: record tracemalloc peaks (slows every allocation)"""
+        self.trace_memory = trace_memory
+        self.records: Dict[str, Dict[str, Any]] = {}
+    
+    @contextmanager
+    def measure(self, name: str):
+        """Profile the enclosed block as `name`; yields the record being filled"""
+        import tracemalloc
+        
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+        
+        record: Dict[str, Any] = {'pid': os.getpid(), 'start_us': time.time() * 1e6}
+        reflections = ReflectionCounter.count
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall
+            record['cpu_seconds'] = time.process_time() - cpu
+            record['reflections'] = ReflectionCounter.count - reflections
+            if self.trace_memory:
+                record['peak_memory_bytes'] = max(tracemalloc.get_traced_memory()[1] - base_memory, 0)
+                if started_tracing:
+                    tracemalloc.stop()
+            self.records[name] = record
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Records without trace bookkeeping, for results metadata"""
+        return {name: {key: value for key, value in record.items() if key not in ('pid', 'start_us')}
+                for name, record in self.records.items()}
+    
+    def trace_events(self) -> Dict:
+        """Chrome trace-event JSON (complete events, one lane per process)"""
+        events = [{
+            'name': name,
+            'cat': 'test',
+            'ph': 'X',
+            'ts': record['start_us'],
+            'dur': record['wall_seconds'] * 1e6,
+            'pid': record['pid'],
+            'tid': record['pid'],
+            'args': {key: value for key, value in record.items()
+                     if key not in ('pid', 'start_us', 'wall_seconds')}
+        } for name, record in self.records.items()]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def write_trace(self, path) -> str:
+        with open(path, 'w') as f:
+            json.dump(self.trace_events(), f, default=_json_default)
+        return str(path)
+
+# Per-process simulator (initialised once per test battery pool worker)
+_worker_simulator: Optional['ComprehensiveSimulator'] = None
+_worker_trace_memory: bool = False
+
+def _init_battery_worker(simulator: 'ComprehensiveSimulator', trace_memory: bool = False):
+    global _worker_simulator, _worker_trace_memory
+    _worker_simulator = simulator
+    _worker_trace_memory = trace_memory
+
+def _run_battery_test(name: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run one test; returns (result or exception, profile record)
+    
+    record['cached'] is True for a result cache hit, False for a miss and
+    None without a cache, so pool workers can report their lookups back.
+    """
+    profiler = SweepProfiler(_worker_trace_memory)
+    cache = _worker_simulator.cache
+    hits = cache.hits if cache is not None else 0
+    with profiler.measure(name) as record:
+        try:
+            outcome = _worker_simulator.run_test(name)
+        except Exception as e:
+            outcome = e
+        record['cached'] = None if cache is None else cache.hits > hits
+    return outcome, profiler.records[name]
+
 class ComprehensiveSimulator:
     """Main simulator orchestrating all analyses"""
     
-    def __init__(self, initial_state: Optional[MotorState] = None):
+    # Test battery in result order
+    TEST_BATTERY = (
+        'test_implosion_impossibility',
+        'test_critical_threshold',
+        'test_symmetric_splitting',
+        'test_curvature_analysis',
+        'test_information_conservation',
+        'test_runaway_curvature',
+        'test_phase_identity',
+        'test_non_cloning_splitting'
+    )
+    
+    # Tests reading the shared basic-evolution trajectory (length = their 'steps')
+    SHARED_TRAJECTORY_TESTS = ('test_implosion_impossibility', 'test_runaway_curvature',
+                               'test_phase_identity')
+    
+    def __init__(self, initial_state: Optional[MotorState] = None,
+                 test_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+                 cache: Optional['ResultCache'] = None,
+                 memory_field: Optional[MemoryDensityField] = None):
+        """
+        test_parameters: per-test keyword overrides, e.g. {'test_phase_identity': {'steps': 400}}
+        cache: optional on-disk cache of test results
+        memory_field: density field for sampled states, e.g. MemoryDensityField(mode='grid')
+        """
         self.initial_state = initial_state or MotorState(0.1, 1.0, 0)
-        self.memory_field = MemoryDensityField()
+        self.test_parameters = test_parameters or {}
+        self.cache = cache
+        self.memory_field = memory_field if memory_field is not None else MemoryDensityField()
         self.equivalence_analyzer = EquivalenceClassAnalyzer()
         
+        # Evolution is deterministic: one (longest) trajectory per initial state
+        self._trajectory_cache: Dict[Tuple[float, float, int], TrajectoryBatch] = {}
+        self._memory_steps: Dict[Tuple[float, float, int], int] = {}
+        
         # Results storage
         self.simulation_results: Dict[str, Any] = {}
         self.trajectory_data: List[Dict] = []
     
-    def run_basic_evolution(self, steps: int = 1000) -> List[MotorState]:
+    def _state_key(self) -> Tuple[float, float, int]:
+        return (self.initial_state.delta_phi, self.initial_state.kappa, self.initial_state.theta)
+    
+    def shared_trajectory(self, steps: int) -> TrajectoryBatch:
+        """Basic-evolution trajectory of the initial state, computed once and sliced"""
+        key = self._state_key()
+        cached = self._trajectory_cache.get(key)
+        if cached is None or len(cached) <= steps:
+            cached = BatchEvolution.evolve(MotorStateBatch.from_states([self.initial_state]), steps)
+            self._trajectory_cache[key] = cached
+        return TrajectoryBatch(cached.delta_phi[:steps + 1], cached.kappa[:steps + 1],
+                               cached.theta[:steps + 1])
+    
+    def run_basic_evolution(self, steps: int = 1000) -> Trajectory:
         """Run basic motor evolution with introspection"""
-        trajectory = [self.initial_state]
-        state = self.initial_state
-        
-        for step in range(steps):
-            injection = IntrospectionEngine.get_injection(state)
-            state = ReflectionOperator.reflect(state, injection)
-            trajectory.append(state)
-            
-            # Add to memory field occasionally
-            if step % 10 == 0:
-                self.memory_field.add_coherent_state(state)
-        
-        return trajectory
+        trajectory = self.shared_trajectory(steps)
+        states = trajectory.member(0)
+        
+        # Add to memory field occasionally (every 10th step), each step once
+        key = self._state_key()
+        recorded = self._memory_steps.get(key, 0)
+        sampled = np.arange(1, steps + 1, 10)
+        sampled = sampled[sampled > recorded]
+        self.memory_field.add_coherent_states(MotorStateBatch(
+            trajectory.delta_phi[sampled, 0], trajectory.kappa[sampled, 0],
+            trajectory.theta[sampled, 0]))
+        self._memory_steps[key] = max(recorded, steps)
+        
+        return states
     
-    def test_implosion_impossibility(self) -> Dict:
+    def test_implosion_impossibility(self, steps: int = 500) -> Dict:
         """Test A: Single mirror cannot achieve implosion"""
         logger.info("Running Test A: Implosion Impossibility")
         
-        trajectory = self.run_basic_evolution(500)
+        trajectory = self.run_basic_evolution(steps)
         
         # Analyze divergence
-        delta_phi_values = [s.delta_phi for s in trajectory]
-        kappa_values = [s.kappa for s in trajectory]
+        delta_phi_values = trajectory.delta_phi.tolist()
+        kappa_values = trajectory.kappa.tolist()
         
         # Check for exponential growth
         growth_rate = np.mean(np.diff(np.log(np.abs(delta_phi_values[100:200]) + 1e-10)))
@@ -387,59 +1661,61 @@ class ComprehensiveSimulator:
             'final_kappa': trajectory[-1].kappa,
             'growth_rate': growth_rate,
             'exhibits_divergence': growth_rate > 0.01,
-            'delta_phi_series': delta_phi_values[:100],  # First 100 for plotting
-            'kappa_series': kappa_values[:100]
+            'delta_phi_series': delta_phi_values,  # Full series; viz data is downsampled
+            'kappa_series': kappa_values
         }
     
-    def test_critical_threshold(self) -> Dict:
+    def test_critical_threshold(self, alpha_range: Tuple[float, float] = (0.0, 0.5),
+                                alpha_steps: int = 100, evolution_steps: int = 80,
+                                tolerance: float = 1e-9) -> Dict:
         """Test B: Critical threshold analysis with dual mirror"""
         logger.info("Running Test B: Critical Threshold")
         
-        result = ImplosionAnalyzer.find_critical_threshold(self.initial_state)
+        result = ImplosionAnalyzer.find_critical_threshold(self.initial_state, tuple(alpha_range),
+                                                           alpha_steps, evolution_steps, tolerance)
         
         return {
             'test_name': 'critical_threshold',
             **result
         }
     
-    def test_symmetric_splitting(self) -> Dict:
+    def test_symmetric_splitting(self, near_zero_delta_phi: float = 0.001, steps: int = 100,
+                                 epsilon: float = 1e-6) -> Dict:
         """Test C: Symmetric splitting analysis"""
         logger.info("Running Test C: Symmetric Splitting")
         
         # Test with state near zero
-        near_zero_state = MotorState(0.001, 1.0, 0)
-        traj_plus, traj_minus = SplittingAnalyzer.analyze_bifurcation(near_zero_state)
+        near_zero_state = MotorState(near_zero_delta_phi, 1.0, 0)
+        traj_plus, traj_minus = SplittingAnalyzer.analyze_bifurcation(near_zero_state, steps, epsilon)
         
         # Compute divergence
-        divergences = []
-        for i in range(min(len(traj_plus), len(traj_minus))):
-            dist = MetricSpace.distance(traj_plus[i], traj_minus[i])
-            divergences.append(dist)
+        n = min(len(traj_plus), len(traj_minus))
+        divergences = MetricSpace.distance_batch(
+            traj_plus.delta_phi[:n], traj_plus.kappa[:n], traj_plus.theta[:n],
+            traj_minus.delta_phi[:n], traj_minus.kappa[:n], traj_minus.theta[:n]
+        ).tolist()
         
         return {
             'test_name': 'symmetric_splitting',
             'trajectory_length': len(traj_plus),
             'final_divergence': divergences[-1] if divergences else 0,
             'max_divergence': max(divergences) if divergences else 0,
-            'divergence_series': divergences[:100],
-            'plus_delta_phi': [s.delta_phi for s in traj_plus[:100]],
-            'minus_delta_phi': [s.delta_phi for s in traj_minus[:100]]
+            'divergence_series': divergences,
+            'plus_delta_phi': traj_plus.delta_phi.tolist(),
+            'minus_delta_phi': traj_minus.delta_phi.tolist()
         }
     
-    def test_curvature_analysis(self) -> Dict:
+    def test_curvature_analysis(self, alpha_range: Tuple[float, float] = (0.05, 0.30),
+                                alpha_steps: int = 10) -> Dict:
         """Test D: Curvature/stability analysis"""
         logger.info("Running Test D: Curvature Analysis")
         
         # Test multiple alpha values
-        alpha_values = np.linspace(0.05, 0.30, 10)
-        max_eigenvalues = []
+        alpha_values = np.linspace(alpha_range[0], alpha_range[1], alpha_steps)
         
-        for alpha in alpha_values:
-            # Create state with this alpha context
-            test_state = MotorState(0.01, 1.0, 0)
-            jacobian = CurvatureAnalyzer.compute_jacobian(test_state)
-            max_eval = CurvatureAnalyzer.max_eigenvalue(jacobian)
-            max_eigenvalues.append(max_eval)
+        # Create state with each alpha context
+        test_states = MotorStateBatch.from_states([MotorState(0.01, 1.0, 0) for _ in alpha_values])
+        max_eigenvalues = CurvatureAnalyzer.stability_map(test_states).tolist()
         
         return {
             'test_name': 'curvature_analysis',
@@ -449,28 +1725,19 @@ class ComprehensiveSimulator:
             'hyperbolicity_confirmed': all(ev > 1.0 for ev in max_eigenvalues)
         }
     
-    def test_information_conservation(self) -> Dict:
+    def test_information_conservation(self, steps: int = 100) -> Dict:
         """Test E: Information conservation"""
         logger.info("Running Test E: Information Conservation")
         
-        # Run two identical simulations
-        state_a = MotorState(self.initial_state.delta_phi, 
-                           self.initial_state.kappa, self.initial_state.theta)
-        state_b = MotorState(self.initial_state.delta_phi, 
-                           self.initial_state.kappa, self.initial_state.theta)
-        
-        distances = []
-        for _ in range(100):
-            # Evolve both identically
-            injection_a = IntrospectionEngine.get_injection(state_a)
-            injection_b = IntrospectionEngine.get_injection(state_b)
-            
-            state_a = ReflectionOperator.reflect(state_a, injection_a)
-            state_b = ReflectionOperator.reflect(state_b, injection_b)
-            
-            # Measure distance
-            dist = MetricSpace.distance(state_a, state_b)
-            distances.append(dist)
+        # Run two identical simulations in lockstep
+        pair = MotorStateBatch.from_states([self.initial_state, self.initial_state])
+        trajectories = BatchEvolution.evolve(pair, steps)
+        
+        # Measure distance after every step
+        distances = MetricSpace.distance_batch(
+            trajectories.delta_phi[1:, 0], trajectories.kappa[1:, 0], trajectories.theta[1:, 0],
+            trajectories.delta_phi[1:, 1], trajectories.kappa[1:, 1], trajectories.theta[1:, 1]
+        ).tolist()
         
         return {
             'test_name': 'information_conservation',
@@ -480,17 +1747,15 @@ class ComprehensiveSimulator:
             'deterministic_confirmed': all(d < 1e-15 for d in distances)
         }
     
-    def test_runaway_curvature(self) -> Dict:
+    def test_runaway_curvature(self, steps: int = 200) -> Dict:
         """Test G: Implosion as runaway curvature"""
         logger.info("Running Test G: Runaway Curvature")
         
-        trajectory = self.run_basic_evolution(200)
+        trajectory = self.run_basic_evolution(steps)
         
         # Analyze curvature proxy K = |ΔΦ| * κ
-        curvature_proxy = []
-        for state in trajectory:
-            K = abs(state.delta_phi) * state.kappa
-            curvature_proxy.append(K)
+        with np.errstate(over='ignore', invalid='ignore'):
+            curvature_proxy = (np.abs(trajectory.delta_phi) * trajectory.kappa).tolist()
         
         # Check for exponential growth
         if len(curvature_proxy) > 50:
@@ -500,25 +1765,21 @@ class ComprehensiveSimulator:
         
         return {
             'test_name': 'runaway_curvature',
-            'curvature_proxy_series': curvature_proxy[:100],
+            'curvature_proxy_series': curvature_proxy,
             'final_curvature': curvature_proxy[-1],
             'growth_rate': growth_rate,
             'exponential_growth': growth_rate > 0.1
         }
     
-    def test_phase_identity(self) -> Dict:
+    def test_phase_identity(self, steps: int = 200) -> Dict:
         """Test H: θ as identity, not time"""
         logger.info("Running Test H: Phase Identity")
         
-        trajectory = self.run_basic_evolution(200)
+        trajectory = self.run_basic_evolution(steps)
         
         # Analyze theta progression
-        theta_values = [s.theta for s in trajectory]
-        phase_transitions = []
-        
-        for i in range(1, len(theta_values)):
-            if theta_values[i] != theta_values[i-1]:
-                phase_transitions.append(i)
+        theta_values = trajectory.theta.tolist()
+        phase_transitions = (np.flatnonzero(np.diff(trajectory.theta)) + 1).tolist()
         
         # Check cyclical nature
         theta_set = set(theta_values)
@@ -526,47 +1787,83 @@ class ComprehensiveSimulator:
         
         return {
             'test_name': 'phase_identity', 
-            'theta_series': theta_values[:100],
+            'theta_series': theta_values,
             'phase_transitions': phase_transitions[:20],
             'unique_phases': list(theta_set),
             'covers_all_phases': covers_all_phases,
             'cyclic_behavior_confirmed': covers_all_phases
         }
     
-    def test_non_cloning_splitting(self) -> Dict:
+    def test_non_cloning_splitting(self, epsilon_delta_phi: float = 0.0001, steps: int = 50) -> Dict:
         """Test I: Splitting without duplication"""
         logger.info("Running Test I: Non-cloning Splitting")
         
         # Create splitting scenario
-        epsilon_state = MotorState(0.0001, 1.0, 0)
-        traj_a, traj_b = SplittingAnalyzer.analyze_bifurcation(epsilon_state, steps=50)
+        epsilon_state = MotorState(epsilon_delta_phi, 1.0, 0)
+        traj_a, traj_b = SplittingAnalyzer.analyze_bifurcation(epsilon_state, steps=steps)
         
         # Analyze independence
-        correlation_coeffs = []
-        for i in range(min(len(traj_a), len(traj_b))):
-            # Check if trajectories share any structural similarity
-            state_a, state_b = traj_a[i], traj_b[i]
-            
-            # Measure structural independence
-            kappa_diff = abs(state_a.kappa - state_b.kappa)
-            phase_diff = abs(state_a.theta - state_b.theta)
-            
-            correlation_coeffs.append(kappa_diff + phase_diff)
+        # Structural independence per step: |κₐ - κᵦ| + |θₐ - θᵦ|
+        n = min(len(traj_a), len(traj_b))
+        correlation_coeffs = (np.abs(traj_a.kappa[:n] - traj_b.kappa[:n]) +
+                              np.abs(traj_a.theta[:n] - traj_b.theta[:n])).tolist()
         
         return {
             'test_name': 'non_cloning_splitting',
             'trajectory_length': min(len(traj_a), len(traj_b)),
             'correlation_series': correlation_coeffs,
             'final_independence': correlation_coeffs[-1] if correlation_coeffs else 0,
-            'no_cloning_confirmed': len(set(s.theta for s in traj_a[-10:])) > 1,
+            'no_cloning_confirmed': len(np.unique(traj_a.theta[-10:])) > 1,
             'structural_independence': correlation_coeffs[-1] > 0.1 if correlation_coeffs else False
         }
     
-    def run_comprehensive_sweep(self) -> Dict:
-        """Run all tests and compile comprehensive results"""
+    def test_arguments(self, name: str) -> Dict[str, Any]:
+        """Effective keyword arguments of one test (defaults plus overrides)"""
+        parameters = inspect.signature(getattr(self, name)).parameters
+        arguments = {key: p.default for key, p in parameters.items()
+                     if p.default is not inspect.Parameter.empty}
+        arguments.update(self.test_parameters.get(name, {}))
+        return arguments
+    
+    def run_test(self, name: str) -> Dict:
+        """Run one battery test, served from the result cache when unchanged"""
+        arguments = self.test_arguments(name)
+        if self.cache is None:
+            return getattr(self, name)(**arguments)
+        
+        key = ResultCache.key(name, arguments, self.initial_state)
+        result = self.cache.get(key)
+        if result is None:
+            result = getattr(self, name)(**arguments)
+            self.cache.put(key, result)
+        else:
+            logger.info(f"Cached result for {name}")
+        return result
+    
+    def run_comprehensive_sweep(self, processes: Optional[int] = 1,
+                                trace_memory: Optional[bool] = None,
+                                trace_file: Optional[str] = None,
+                                progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Run all tests and compile comprehensive results
+        
+        Shared trajectories are evolved once up front. processes=None runs
+        the battery on all cores; processes=1 runs it in the calling process.
+        Results are merged in TEST_BATTERY order either way. Per-test
+        profiles go to metadata['profile'] and, with trace_file, to a
+        trace-event JSON file (chrome://tracing, Perfetto). Memory peaks
+        are traced only with trace_memory, which defaults to on when a
+        trace_file is requested.
+        
+        progress, if given, receives a 'start' event, one 'test' event per
+        finished test (in completion order) and a 'complete' event.
+        """
         logger.info("Starting comprehensive test sweep")
         
         start_time = time.time()
+        if trace_memory is None:
+            trace_memory = trace_file is not None
+        profiler = SweepProfiler(trace_memory)
         
         # Run all tests
         results = {
@@ -579,67 +1876,103 @@ class ComprehensiveSimulator:
             'test_results': {}
         }
         
-        # Execute test battery
-        test_methods = [
-            self.test_implosion_impossibility,
-            self.test_critical_threshold,
-            self.test_symmetric_splitting,
-            self.test_curvature_analysis,
-            self.test_information_conservation,
-            self.test_runaway_curvature,
-            self.test_phase_identity,
-            self.test_non_cloning_splitting
-        ]
+        if progress is not None:
+            progress({'event': 'start', 'tests': list(self.TEST_BATTERY),
+                      'initial_state': self.initial_state.to_dict()})
         
-        for i, test_method in enumerate(test_methods, 1):
-            try:
-                logger.info(f"Executing test {i}/{len(test_methods)}")
-                test_result = test_method()
-                results['test_results'][test_result['test_name']] = test_result
-            except Exception as e:
-                logger.error(f"Test {i} failed: {e}")
-                results['test_results'][f'test_{i}_error'] = str(e)
+        # Evolve (and record) the longest shared trajectory before dispatch
+        with profiler.measure('shared_trajectory'):
+            self.run_basic_evolution(max(self.test_arguments(name).get('steps', 0)
+                                         for name in self.SHARED_TRAJECTORY_TESTS))
+        
+        if processes is None:
+            processes = os.cpu_count() or 1
+        
+        # Execute test battery
+        outcomes: List[Any] = [None] * len(self.TEST_BATTERY)
+        if processes <= 1:
+            _init_battery_worker(self, trace_memory)
+            for i, name in enumerate(self.TEST_BATTERY):
+                outcomes[i] = _run_battery_test(name)
+                self._report_test(progress, i, *outcomes[i])
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(processes, len(self.TEST_BATTERY)),
+                                     initializer=_init_battery_worker,
+                                     initargs=(self, trace_memory)) as pool:
+                futures = {pool.submit(_run_battery_test, name): i
+                           for i, name in enumerate(self.TEST_BATTERY)}
+                for future in concurrent.futures.as_completed(futures):
+                    i = futures[future]
+                    outcomes[i] = future.result()
+                    self._count_cache_lookup(outcomes[i][1])
+                    self._report_test(progress, i, *outcomes[i])
+        
+        for i, (name, (outcome, record)) in enumerate(zip(self.TEST_BATTERY, outcomes), 1):
+            logger.info(f"Collected test {i}/{len(outcomes)}")
+            profiler.records[name] = record
+            if isinstance(outcome, Exception):
+                logger.error(f"Test {i} failed: {outcome}")
+                results['test_results'][f'test_{i}_error'] = str(outcome)
+            else:
+                results['test_results'][outcome['test_name']] = outcome
         
         # Add performance metrics
         end_time = time.time()
         results['metadata']['execution_time_seconds'] = end_time - start_time
+        results['metadata']['profile'] = profiler.summary()
+        if trace_file:
+            results['metadata']['trace_file'] = profiler.write_trace(trace_file)
         results['metadata']['tests_completed'] = len([r for r in results['test_results'].values() 
                                                     if not r.get('test_name', '').endswith('_error')])
         
         # Store comprehensive results
         self.simulation_results = results
         
+        if progress is not None:
+            progress({'event': 'complete',
+                      'execution_time_seconds': results['metadata']['execution_time_seconds'],
+                      'tests_completed': results['metadata']['tests_completed'],
+                      'validation': self.generate_validation_report()['framework_validation']})
+        
         logger.info("Comprehensive sweep completed")
         return results
     
-    def save_results(self, filename: Optional[str] = None) -> str:
-        """Save results to JSON file"""
+    def _count_cache_lookup(self, record: Dict[str, Any]):
+        """Add a pool worker's cache hit or miss to this process's counters"""
+        if self.cache is None or record.get('cached') is None:
+            return
+        if record['cached']:
+            self.cache.hits += 1
+        else:
+            self.cache.misses += 1
+    
+    def _report_test(self, progress: Optional[Callable[[Dict], None]], index: int,
+                     outcome: Any, record: Dict[str, Any]):
+        """Send a 'test' progress event for one finished battery test"""
+        if progress is None:
+            return
+        event = {'event': 'test', 'name': self.TEST_BATTERY[index], 'index': index,
+                 'total': len(self.TEST_BATTERY), 'profile': record}
+        if isinstance(outcome, Exception):
+            event.update(passed=False, error=str(outcome))
+        else:
+            validations = list(self.validations({outcome['test_name']: outcome}).values())
+            event.update(passed=bool(validations[index]), result=outcome)
+        progress(event)
+    
+    def save_results(self, filename: Optional[str] = None, compress: bool = False) -> str:
+        """Save results as columnar .npz (or JSON for a .json filename)"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"decision_reflective_simulation_{timestamp}.json"
+            filename = f"decision_reflective_simulation_{timestamp}.npz"
         
         filepath = Path(filename)
         
-        def convert_to_serializable(obj):
-            """Convert numpy types to native Python types"""
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, (np.integer, np.int32, np.int64)):
-                return int(obj)
-            elif isinstance(obj, (np.floating, np.float32, np.float64)):
-                return float(obj)
-            elif isinstance(obj, np.bool_):
-                return bool(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_to_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_serializable(item) for item in obj]
-            return obj
-        
-        serializable_results = convert_to_serializable(self.simulation_results)
-        
-        with open(filepath, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
+        if filepath.suffix == '.json':
+            with open(filepath, 'w') as f:
+                json.dump(self.simulation_results, f, indent=2, default=_json_default)
+        else:
+            ColumnarResults.save(filepath, self.simulation_results, compress)
         
         logger.info(f"Results saved to {filepath}")
         return str(filepath)
@@ -649,19 +1982,7 @@ class ComprehensiveSimulator:
         if not self.simulation_results:
             raise ValueError("No simulation results available. Run comprehensive_sweep first.")
         
-        results = self.simulation_results['test_results']
-        
-        # Validate key theoretical predictions
-        validations = {
-            'single_mirror_divergence': results.get('implosion_impossibility', {}).get('exhibits_divergence', False),
-            'critical_threshold_exists': 'critical_threshold' in results,
-            'symmetric_splitting_confirmed': results.get('symmetric_splitting', {}).get('final_divergence', 0) > 0,
-            'hyperbolicity_proven': results.get('curvature_analysis', {}).get('hyperbolicity_confirmed', False),
-            'information_conservation': results.get('information_conservation', {}).get('perfect_conservation', False),
-            'runaway_curvature': results.get('runaway_curvature', {}).get('exponential_growth', False),
-            'phase_identity_confirmed': results.get('phase_identity', {}).get('cyclic_behavior_confirmed', False),
-            'non_cloning_validated': results.get('non_cloning_splitting', {}).get('structural_independence', False)
-        }
+        validations = self.validations(self.simulation_results['test_results'])
         
         # Calculate validation score
         passed_tests = sum(1 for v in validations.values() if v)
@@ -683,9 +2004,492 @@ class ComprehensiveSimulator:
             },
             'peer_review_ready': validation_score > 0.8
         }
+    
+    @staticmethod
+    def validations(results: Dict) -> Dict[str, bool]:
+        """Key theoretical predictions (in TEST_BATTERY order) from test results"""
+        return {
+            'single_mirror_divergence': results.get('implosion_impossibility', {}).get('exhibits_divergence', False),
+            'critical_threshold_exists': 'critical_threshold' in results,
+            'symmetric_splitting_confirmed': results.get('symmetric_splitting', {}).get('final_divergence', 0) > 0,
+            'hyperbolicity_proven': results.get('curvature_analysis', {}).get('hyperbolicity_confirmed', False),
+            'information_conservation': results.get('information_conservation', {}).get('perfect_conservation', False),
+            'runaway_curvature': results.get('runaway_curvature', {}).get('exponential_growth', False),
+            'phase_identity_confirmed': results.get('phase_identity', {}).get('cyclic_behavior_confirmed', False),
+            'non_cloning_validated': results.get('non_cloning_splitting', {}).get('structural_independence', False)
+        }
+
+def _scalar_metrics(results: Dict, report: Dict) -> Dict[str, Any]:
+    """Flatten scalar test fields and validations into 'test.field' metrics"""
+    metrics = {}
+    for test_name, result in results['test_results'].items():
+        if not isinstance(result, dict):
+            metrics[f'{test_name}.passed'] = False
+            continue
+        for field, value in result.items():
+            if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating)):
+                metrics[f'{test_name}.{field}'] = value
+    for name, passed in report['framework_validation']['individual_validations'].items():
+        metrics[f'validation.{name}'] = bool(passed)
+    metrics['validation.validation_score'] = report['framework_validation']['validation_score']
+    return metrics
+
+@contextmanager
+def _logger_level(level: int):
+    """Temporarily set the simulator logger level"""
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+def _run_ensemble_member(state: Tuple[float, float, int]) -> Dict[str, Any]:
+    """Run the full battery for one initial state (quietly, unprofiled)"""
+    with _logger_level(logging.WARNING):
+        simulator = ComprehensiveSimulator(MotorState(*state))
+        results = simulator.run_comprehensive_sweep(processes=1, trace_memory=False)
+        return _scalar_metrics(results, simulator.generate_validation_report())
 
-def create_visualization_data(results: Dict) -> Dict:
-    """Create data structure optimized for web visualization"""
+class EnsembleValidator:
+    """Monte Carlo validation: the full battery over sampled initial states"""
+    
+    QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+    
+    def __init__(self, samples: int = 1000, seed: int = 0,
+                 delta_phi_range: Tuple[float, float] = (-1.0, 1.0),
+                 kappa_range: Tuple[float, float] = (0.0, 2.0),
+                 processes: Optional[int] = None, chunksize: int = 8):
+        self.samples = samples
+        self.seed = seed
+        self.delta_phi_range = delta_phi_range
+        self.kappa_range = kappa_range
+        self.processes = processes
+        self.chunksize = chunksize
+    
+    def sample_initial_states(self) -> MotorStateBatch:
+        """Uniformly sampled initial states (ΔΦ, κ ranges; all six phases)"""
+        rng = np.random.default_rng(self.seed)
+        return MotorStateBatch(rng.uniform(*self.delta_phi_range, self.samples),
+                               rng.uniform(*self.kappa_range, self.samples),
+                               rng.integers(0, 6, self.samples))
+    
+    def _member_metrics(self, batch: MotorStateBatch) -> Iterator[Dict[str, Any]]:
+        """Per-member metrics in sample order"""
+        states = zip(batch.delta_phi.tolist(), batch.kappa.tolist(), batch.theta.tolist())
+        processes = self.processes if self.processes is not None else (os.cpu_count() or 1)
+        if processes <= 1:
+            yield from map(_run_ensemble_member, states)
+            return
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+            yield from pool.map(_run_ensemble_member, states, chunksize=self.chunksize)
+    
+    def _aggregate(self, columns: Dict[str, np.ndarray], completed: int) -> Dict[str, Any]:
+        """Distribution summary of the first `completed` members"""
+        metrics = {}
+        for name, column in columns.items():
+            values = column[:completed]
+            if column.dtype == bool:
+                metrics[name] = {'pass_rate': float(values.mean()) if completed else 0.0}
+                continue
+            finite = values[np.isfinite(values)]
+            summary = {'non_finite': int(len(values) - len(finite))}
+            if len(finite):
+                summary.update({
+                    'mean': float(finite.mean()),
+                    'std': float(finite.std()),
+                    'min': float(finite.min()),
+                    'max': float(finite.max()),
+                    'quantiles': dict(zip((f'q{int(q * 100):02d}' for q in self.QUANTILES),
+                                          np.quantile(finite, self.QUANTILES).tolist()))
+                })
+            metrics[name] = summary
+        return {'completed': completed, 'total': self.samples, 'metrics': metrics}
+    
+    def iter_aggregates(self, report_every: int = 100) -> Iterator[Dict[str, Any]]:
+        """Run the ensemble, yielding partial aggregates every `report_every` members"""
+        batch = self.sample_initial_states()
+        columns: Dict[str, np.ndarray] = {}
+        completed = 0
+        
+        for metrics in self._member_metrics(batch):
+            for name, value in metrics.items():
+                if name not in columns:
+                    is_flag = isinstance(value, (bool, np.bool_))
+                    columns[name] = (np.zeros(self.samples, dtype=bool) if is_flag
+                                     else np.full(self.samples, np.nan))
+                columns[name][completed] = value
+            completed += 1
+            if completed % report_every == 0 and completed < self.samples:
+                yield self._aggregate(columns, completed)
+        
+        yield self._aggregate(columns, completed)
+    
+    def run(self, progress: Optional[Callable[[Dict], None]] = None,
+            report_every: int = 100) -> Dict[str, Any]:
+        """Run the ensemble and return the final aggregate"""
+        aggregate = {}
+        for aggregate in self.iter_aggregates(report_every):
+            if progress is not None:
+                progress(aggregate)
+            logger.info(f"Ensemble progress: {aggregate['completed']}/{aggregate['total']}")
+        return {
+            'metadata': {
+                'timestamp': datetime.now().isoformat(),
+                'samples': self.samples,
+                'seed': self.seed,
+                'delta_phi_range': list(self.delta_phi_range),
+                'kappa_range': list(self.kappa_range)
+            },
+            **aggregate
+        }
+
+@lru_cache(maxsize=None)
+def source_digest() -> str:
+    """SHA-256 of this simulator's source (code version of stored results)"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+class ResultCache:
+    """Content-addressed on-disk cache of test results with size-bounded LRU eviction"""
+    
+    def __init__(self, directory='.simulator_cache', max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(test_name: str, parameters: Dict[str, Any], initial_state: MotorState) -> str:
+        """SHA-256 of (test name, parameters, initial state, simulator source digest)"""
+        identity = json.dumps({
+            'test': test_name,
+            'parameters': parameters,
+            'initial_state': initial_state.to_dict(),
+            'source': source_digest()
+        }, sort_keys=True, default=_json_default)
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.npz'
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached result or None; a hit refreshes the entry's LRU position"""
+        path = self._path(key)
+        try:
+            with ColumnarResults.load(path) as cached:
+                result = cached.to_dict(as_lists=True)
+            os.utime(path)
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+    
+    def put(self, key: str, result: Dict):
+        """Store a result atomically, then evict least recently used entries"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        import tempfile
+        
+        handle, temporary = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(handle)
+        try:
+            ColumnarResults.save(temporary, result)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        self.evict()
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        entries = []
+        for path in self.directory.glob('*/*.npz'):
+            try:
+                info = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+    
+    def clear(self):
+        for path in self.directory.glob('*/*.npz'):
+            path.unlink()
+
+class ResultsStore:
+    """SQLite store of simulator runs with indexed scalar metrics and blob series"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            created TEXT NOT NULL,
+            code_version TEXT NOT NULL,
+            delta_phi REAL NOT NULL,
+            kappa REAL NOT NULL,
+            theta INTEGER NOT NULL,
+            metadata TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS metrics (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            test_name TEXT NOT NULL,
+            name TEXT NOT NULL,
+            value REAL,
+            PRIMARY KEY (run_id, test_name, name)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS series (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            test_name TEXT NOT NULL,
+            name TEXT NOT NULL,
+            dtype TEXT NOT NULL,
+            shape TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (run_id, test_name, name)
+        );
+        CREATE INDEX IF NOT EXISTS metrics_by_value ON metrics (test_name, name, value);
+        CREATE INDEX IF NOT EXISTS runs_by_version ON runs (code_version);
+        CREATE INDEX IF NOT EXISTS runs_by_state ON runs (delta_phi, kappa, theta);
+    """
+    
+    OPERATORS = ('=', '!=', '<', '<=', '>', '>=')
+    
+    def __init__(self, path='decision_reflective_runs.sqlite'):
+        import sqlite3
+        
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('PRAGMA foreign_keys=ON')
+        self.connection.executescript(self.SCHEMA)
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self) -> 'ResultsStore':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @staticmethod
+    def _rows(run_id: str, results: Dict, report: Optional[Dict]):
+        """Run, metric and series rows for one results dict"""
+        metadata = results.get('metadata', {})
+        state = metadata.get('initial_state', {})
+        run = (run_id, metadata.get('timestamp') or datetime.now().isoformat(), source_digest(),
+               float(state.get('delta_phi', np.nan)), float(state.get('kappa', np.nan)),
+               int(state.get('theta', 0)), json.dumps(metadata, default=_json_default))
+        
+        if report is None:
+            report = {'framework_validation': {'individual_validations': {}, 'validation_score': None}}
+        metrics = []
+        for key, value in _scalar_metrics(results, report).items():
+            test_name, name = key.split('.', 1)
+            metrics.append((run_id, test_name, name, None if value is None else float(value)))
+        
+        series = []
+        for test_name, result in results.get('test_results', {}).items():
+            if not isinstance(result, dict):
+                continue
+            for name, value in result.items():
+                if not isinstance(value, (list, tuple, np.ndarray)) or len(value) == 0:
+                    continue
+                try:
+                    array = np.asarray(value)
+                except ValueError:  # ragged
+                    continue
+                if array.dtype.kind in 'biuf':
+                    array = np.ascontiguousarray(array)
+                    series.append((run_id, test_name, name, array.dtype.str,
+                                   json.dumps(array.shape), array.tobytes()))
+        return run, metrics, series
+    
+    def add_runs(self, runs) -> List[str]:
+        """Bulk-insert (results, report) pairs in one transaction"""
+        import uuid
+        
+        run_rows, metric_rows, series_rows, run_ids = [], [], [], []
+        for results, report in runs:
+            run_id = uuid.uuid4().hex
+            run, metrics, series = self._rows(run_id, results, report)
+            run_rows.append(run)
+            metric_rows.extend(metrics)
+            series_rows.extend(series)
+            run_ids.append(run_id)
+        
+        with self.connection:
+            self.connection.executemany('INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)', run_rows)
+            self.connection.executemany('INSERT INTO metrics VALUES (?, ?, ?, ?)', metric_rows)
+            self.connection.executemany('INSERT INTO series VALUES (?, ?, ?, ?, ?, ?)', series_rows)
+        return run_ids
+    
+    def add_run(self, results: Dict, report: Optional[Dict] = None) -> str:
+        """Insert one run (results of run_comprehensive_sweep plus optional report)"""
+        return self.add_runs([(results, report)])[0]
+    
+    def find_runs(self, test_name: str, metric: str, operator: str = '=', value: Any = True,
+                  code_version: Optional[str] = None) -> List[str]:
+        """
+        Run ids whose metric satisfies the comparison, e.g.
+        find_runs('curvature_analysis', 'hyperbolicity_confirmed', '=', False)
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Operator must be one of {self.OPERATORS}")
+        query = (f'SELECT m.run_id FROM metrics m JOIN runs r ON r.run_id = m.run_id '
+                 f'WHERE m.test_name = ? AND m.name = ? AND m.value {operator} ?')
+        params = [test_name, metric, float(value)]
+        if code_version is not None:
+            query += ' AND r.code_version = ?'
+            params.append(code_version)
+        return [row[0] for row in self.connection.execute(query + ' ORDER BY r.created', params)]
+    
+    def runs(self, code_version: Optional[str] = None) -> List[Dict]:
+        """Run id, creation time, code version and initial state of stored runs"""
+        query = 'SELECT run_id, created, code_version, delta_phi, kappa, theta FROM runs'
+        params = []
+        if code_version is not None:
+            query += ' WHERE code_version = ?'
+            params.append(code_version)
+        return [{'run_id': run_id, 'created': created, 'code_version': version,
+                 'initial_state': {'delta_phi': delta_phi, 'kappa': kappa, 'theta': theta}}
+                for run_id, created, version, delta_phi, kappa, theta
+                in self.connection.execute(query + ' ORDER BY created', params)]
+    
+    def metrics(self, run_id: str) -> Dict[str, Dict[str, float]]:
+        """Scalar metrics of one run grouped by test"""
+        grouped: Dict[str, Dict[str, float]] = {}
+        for test_name, name, value in self.connection.execute(
+                'SELECT test_name, name, value FROM metrics WHERE run_id = ?', (run_id,)):
+            grouped.setdefault(test_name, {})[name] = value
+        return grouped
+    
+    def metric_values(self, test_name: str, metric: str) -> Tuple[List[str], np.ndarray]:
+        """One metric across all runs"""
+        rows = self.connection.execute(
+            'SELECT run_id, value FROM metrics WHERE test_name = ? AND name = ?',
+            (test_name, metric)).fetchall()
+        return [row[0] for row in rows], np.array([row[1] for row in rows], dtype=np.float64)
+    
+    def series(self, run_id: str, test_name: str, name: str) -> np.ndarray:
+        """One stored series as an array"""
+        row = self.connection.execute(
+            'SELECT dtype, shape, data FROM series WHERE run_id = ? AND test_name = ? AND name = ?',
+            (run_id, test_name, name)).fetchone()
+        if row is None:
+            raise KeyError(f"No series {test_name}.{name} for run {run_id}")
+        dtype, shape, data = row
+        return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(json.loads(shape))
+
+def lttb_indices(values, budget: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection of `budget` indices (ends kept)
+    
+    Areas are computed on y divided by its largest finite magnitude, which
+    leaves the selection unchanged but keeps huge series from overflowing.
+    NaN points are never selected; infinite points (and any area that is
+    still not finite) count as maximal so extremes are kept.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if budget >= n:
+        return np.arange(n)
+    if budget < 3:
+        return np.linspace(0, n - 1, budget).round().astype(np.int64)
+    
+    magnitude = np.abs(y[np.isfinite(y)])
+    if len(magnitude) and magnitude.max() > 0:
+        y = y / magnitude.max()
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, budget - 1).astype(np.int64)
+    edges = np.append(edges, n)   # the last "next bucket" is the final point
+    selected = np.empty(budget, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    
+    with np.errstate(over='ignore', invalid='ignore'):
+        for bucket in range(budget - 2):
+            lo, hi = edges[bucket], edges[bucket + 1]
+            next_y = y[hi:edges[bucket + 2]]
+            finite = np.isfinite(next_y)
+            avg_x = x[hi:edges[bucket + 2]].mean()
+            avg_y = next_y[finite].mean() if finite.any() else y[anchor]
+            area = np.abs((x[anchor] - avg_x) * (y[lo:hi] - y[anchor]) -
+                          (x[anchor] - x[lo:hi]) * (avg_y - y[anchor]))
+            area = np.where(np.isfinite(area), area, np.inf)
+            area = np.where(np.isnan(y[lo:hi]), -np.inf, area)
+            anchor = lo + int(np.argmax(area))
+            selected[bucket + 1] = anchor
+    
+    return selected
+
+def minmax_indices(values, budget: int) -> np.ndarray:
+    """
+    Min/max decimation: the extremes of budget // 2 equal buckets (ends kept)
+    
+    NaN points are skipped; ±inf points are kept as bucket extremes.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if budget >= n:
+        return np.arange(n)
+    buckets = max(budget // 2, 1)
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    selected = {0, n - 1}
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        present = np.flatnonzero(~np.isnan(y[lo:hi]))
+        if not len(present):
+            selected.add(int(lo))
+            continue
+        window = y[lo + present]
+        selected.add(int(lo + present[np.argmin(window)]))
+        selected.add(int(lo + present[np.argmax(window)]))
+    indices = np.array(sorted(selected), dtype=np.int64)
+    if len(indices) > budget:   # ends may exceed the budget by up to two points
+        indices = indices[np.linspace(0, len(indices) - 1, budget).round().astype(np.int64)]
+    return indices
+
+DOWNSAMPLERS = {'lttb': lttb_indices, 'minmax': minmax_indices}
+
+def downsample_series(values, budget: int = 100, method: str = 'lttb') -> Dict:
+    """Shape-preserving downsampling to at most `budget` points"""
+    values = np.asarray(values)
+    indices = DOWNSAMPLERS[method](values, budget)
+    return {'index': indices.tolist(), 'values': values[indices].tolist()}
+
+def multiresolution_series(values, budget: int = 100, levels: int = 1,
+                           method: str = 'lttb') -> Dict:
+    """
+    Downsampled series plus zoom levels with budget·2ˡ points each
+    (capped at the series length), so the payload size is independent
+    of trajectory length.
+    """
+    values = np.asarray(values)
+    payload = {'length': len(values), 'method': method, **downsample_series(values, budget, method)}
+    if levels > 1:
+        payload['levels'] = [downsample_series(values, budget * 2 ** level, method)
+                             for level in range(1, levels)]
+    return payload
+
+def create_visualization_data(results: Dict, budget: int = 100, levels: int = 1,
+                              method: str = 'lttb') -> Dict:
+    """
+    Create data structure optimized for web visualization
+    
+    Series are downsampled to `budget` points (LTTB or min/max), with
+    optional higher-resolution zoom levels.
+    """
+    def series(values) -> Dict:
+        return multiresolution_series(values, budget, levels, method)
+    
     viz_data = {
         'validation_summary': results.get('framework_validation', {}),
         'time_series': {},
@@ -699,78 +2503,305 @@ def create_visualization_data(results: Dict) -> Dict:
     # Extract time series for visualization
     if 'implosion_impossibility' in test_results:
         viz_data['time_series']['divergence'] = {
-            'delta_phi': test_results['implosion_impossibility']['delta_phi_series'],
-            'kappa': test_results['implosion_impossibility']['kappa_series']
+            'delta_phi': series(test_results['implosion_impossibility']['delta_phi_series']),
+            'kappa': series(test_results['implosion_impossibility']['kappa_series'])
         }
     
+    if 'runaway_curvature' in test_results:
+        viz_data['time_series']['curvature_proxy'] = series(
+            test_results['runaway_curvature']['curvature_proxy_series'])
+    
     if 'symmetric_splitting' in test_results:
         viz_data['bifurcation_data'] = {
-            'divergence': test_results['symmetric_splitting']['divergence_series'],
-            'plus_branch': test_results['symmetric_splitting']['plus_delta_phi'],
-            'minus_branch': test_results['symmetric_splitting']['minus_delta_phi']
+            'divergence': series(test_results['symmetric_splitting']['divergence_series']),
+            'plus_branch': series(test_results['symmetric_splitting']['plus_delta_phi']),
+            'minus_branch': series(test_results['symmetric_splitting']['minus_delta_phi'])
         }
     
     if 'critical_threshold' in test_results:
         viz_data['critical_analysis'] = {
-            'alpha_values': test_results['critical_threshold']['alpha_values'],
-            'kappa_final': test_results['critical_threshold']['final_kappa_values'],
+            'alpha_values': series(test_results['critical_threshold']['alpha_values']),
+            'kappa_final': series(test_results['critical_threshold']['final_kappa_values']),
             'critical_alpha': test_results['critical_threshold']['critical_alpha']
         }
     
     if 'phase_identity' in test_results:
-        viz_data['phase_diagrams']['theta_evolution'] = test_results['phase_identity']['theta_series']
+        viz_data['phase_diagrams']['theta_evolution'] = series(
+            test_results['phase_identity']['theta_series'])
     
     return viz_data
 
-def main():
+def stream_event(event: Dict, budget: int = 100, method: str = 'lttb') -> Dict:
+    """
+    Browser form of a sweep progress event: test results are reduced to
+    scalar metrics plus downsampled visualization series
+    """
+    if event.get('event') != 'test' or 'result' not in event:
+        return event
+    result = event['result']
+    viz = create_visualization_data({'test_results': {result['test_name']: result}}, budget,
+                                    method=method)
+    event = {key: value for key, value in event.items() if key != 'result'}
+    event['metrics'] = {field: value for field, value in result.items()
+                        if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating))}
+    event['visualization'] = {section: data for section, data in viz.items()
+                              if data and section != 'validation_summary'}
+    return event
+
+def _encode_event(event: Dict) -> str:
+    """Compact JSON with non-finite floats as null (JSON.parse rejects NaN)"""
+    text = json.dumps(event, default=_json_default, separators=(',', ':'))
+    if 'NaN' in text or 'Infinity' in text:
+        text = json.dumps(json.loads(text, parse_constant=lambda _: None), separators=(',', ':'))
+    return text
+
+class ProgressBroadcaster:
+    """
+    Fans progress events out to streaming clients without blocking the publisher
+    
+    Each client has its own bounded queue of pending events. A pending
+    event is replaced by a newer one with the same key (event type and
+    name), so a slow client skips intermediate states instead of stalling
+    the simulator; beyond max_pending the oldest pending event is dropped.
+    Clients connecting mid-run first receive the latest event per key.
+    """
+    
+    def __init__(self, max_pending: int = 64):
+        import threading
+        
+        self.max_pending = max_pending
+        self.dropped = 0
+        self.closed = False
+        self._condition = threading.Condition()
+        self._clients: List['OrderedDict[str, Dict]'] = []
+        self._latest: 'OrderedDict[str, Dict]' = OrderedDict()
+    
+    @staticmethod
+    def _key(event: Dict) -> str:
+        return f"{event.get('event', 'progress')}:{event.get('name', '')}"
+    
+    def _enqueue(self, pending: 'OrderedDict[str, Dict]', key: str, event: Dict):
+        pending.pop(key, None)
+        pending[key] = event
+        if len(pending) > self.max_pending:
+            pending.popitem(last=False)
+            self.dropped += 1
+    
+    def publish(self, event: Dict):
+        """Queue an event for every client (never blocks on clients)"""
+        key = self._key(event)
+        with self._condition:
+            if event.get('event') == 'start':
+                self._latest.clear()
+            self._latest.pop(key, None)
+            self._latest[key] = event
+            for pending in self._clients:
+                self._enqueue(pending, key, event)
+            self._condition.notify_all()
+    
+    def close(self):
+        """End all client streams once their pending events are sent"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+    
+    def events(self, heartbeat: float = 15.0) -> Iterator[Optional[Dict]]:
+        """Stream events for one client; yields None after `heartbeat` idle seconds"""
+        with self._condition:
+            pending = OrderedDict(self._latest)
+            self._clients.append(pending)
+        try:
+            while True:
+                with self._condition:
+                    if not pending and not self.closed:
+                        self._condition.wait(heartbeat)
+                    if not pending and self.closed:
+                        return
+                    batch = list(pending.values())
+                    pending.clear()
+                if not batch:
+                    yield None
+                yield from batch
+        finally:
+            with self._condition:
+                self._clients.remove(pending)
+
+class ProgressServer:
+    """
+    Localhost HTTP server for live sweep progress
+    
+    GET /               the HTML visualization
+    GET /events         server-sent events (EventSource)
+    GET /events.ndjson  newline-delimited JSON
+    """
+    
+    CONTENT_TYPES = {'/events': 'text/event-stream', '/events.ndjson': 'application/x-ndjson'}
+    
+    def __init__(self, broadcaster: Optional[ProgressBroadcaster] = None,
+                 host: str = '127.0.0.1', port: int = 8765,
+                 html_path=Path(__file__).with_name('decision_reflective_visualization.html')):
+        # Server-only dependencies load with the first server
+        import ipaddress
+        import socket
+        from http.server import ThreadingHTTPServer
+        
+        if not ipaddress.ip_address(socket.gethostbyname(host)).is_loopback:
+            raise ValueError(f"Progress server only binds to loopback addresses, not {host!r}")
+        self.broadcaster = broadcaster or ProgressBroadcaster()
+        self.html_path = Path(html_path)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+    
+    def _handler(self):
+        from http.server import BaseHTTPRequestHandler
+        from urllib.parse import urlsplit
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug("Progress server: " + format, *args)
+            
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                if path in ('/', '/index.html'):
+                    self._send_html()
+                elif path in server.CONTENT_TYPES:
+                    self._stream(path)
+                else:
+                    self.send_error(404)
+            
+            def _send_html(self):
+                try:
+                    body = server.html_path.read_bytes()
+                except OSError:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def _stream(self, path: str):
+                self.send_response(200)
+                self.send_header('Content-Type', server.CONTENT_TYPES[path])
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                sse = path == '/events'
+                events = server.broadcaster.events()
+                try:
+                    for event in events:
+                        if event is None:
+                            chunk = ': keepalive\n\n' if sse else '\n'
+                        elif sse:
+                            chunk = f"event: {event.get('event', 'progress')}\ndata: {_encode_event(event)}\n\n"
+                        else:
+                            chunk = _encode_event(event) + '\n'
+                        self.wfile.write(chunk.encode('utf-8'))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    events.close()
+        
+        return Handler
+    
+    def start(self) -> 'ProgressServer':
+        import threading
+        
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Streaming progress at {self.url}")
+        return self
+    
+    def stop(self):
+        self.broadcaster.close()
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+    
+    def __enter__(self) -> 'ProgressServer':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    def progress(self, budget: int = 100) -> Callable[[Dict], None]:
+        """Progress callback for run_comprehensive_sweep"""
+        return lambda event: self.broadcaster.publish(stream_event(event, budget))
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Decision-Reflective System Simulator")
+    parser.add_argument('--serve', action='store_true',
+                        help="stream live progress to the HTML visualization on localhost")
+    parser.add_argument('--port', type=int, default=8765, help="progress server port")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="profile the sweep (including tracemalloc peaks) into a trace-event file")
+    parser.add_argument('--cache', nargs='?', const='.simulator_cache', metavar='DIR',
+                        help="reuse results of unchanged tests from DIR (default .simulator_cache)")
+    parser.add_argument('--store', metavar='PATH',
+                        help="also record the run in a SQLite results store at PATH")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
     print("Decision-Reflective System Simulator")
     print("="*50)
     
     # Initialize simulator
     initial_state = MotorState(0.1, 1.0, 0)
-    simulator = ComprehensiveSimulator(initial_state)
+    cache = ResultCache(args.cache) if args.cache else None
+    simulator = ComprehensiveSimulator(initial_state, cache=cache)
+    
+    server = ProgressServer(port=args.port).start() if args.serve else None
+    if server is not None:
+        print(f"Live progress: {server.url}")
     
     # Run comprehensive analysis
     print("Running comprehensive test sweep...")
-    results = simulator.run_comprehensive_sweep()
+    results = simulator.run_comprehensive_sweep(trace_file=args.trace,
+                                                progress=server.progress() if server else None)
+    
+    if cache is not None:
+        print(f"Result cache: {cache.hits} hits, {cache.misses} misses ({cache.directory})")
     
     # Generate validation report
     validation_report = simulator.generate_validation_report()
     
     # Save results
     results_file = simulator.save_results()
+    run_id = None
+    if args.store:
+        with ResultsStore(args.store) as store:
+            run_id = store.add_run(results, validation_report)
     
     # Save validation report
     validation_file = f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    def convert_to_serializable(obj):
-        """Convert numpy types to native Python types"""
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, (np.integer, np.int32, np.int64)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float32, np.float64)):
-            return float(obj)
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, dict):
-            return {k: convert_to_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_to_serializable(item) for item in obj]
-        return obj
-    
     with open(validation_file, 'w') as f:
-        json.dump(convert_to_serializable(validation_report), f, indent=2)
+        json.dump(validation_report, f, indent=2, default=_json_default)
     
     # Create visualization data
-    viz_data = create_visualization_data(validation_report)
+    viz_data = create_visualization_data({**results, **validation_report})
     viz_file = f"visualization_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     with open(viz_file, 'w') as f:
-        json.dump(convert_to_serializable(viz_data), f, indent=2)
+        json.dump(viz_data, f, indent=2, default=_json_default)
     
     # Print summary
     print(f"\nSimulation completed!")
     print(f"Results saved to: {results_file}")
+    if run_id is not None:
+        print(f"Results store: {args.store} (run {run_id})")
     print(f"Validation report: {validation_file}")
     print(f"Visualization data: {viz_file}")
     
@@ -779,6 +2810,16 @@ def main():
     print(f"Tests Passed: {validation['passed_tests']}/{validation['total_tests']}")
     print(f"Peer Review Ready: {'Yes' if validation_report['peer_review_ready'] else 'No'}")
     
+    if server is not None:
+        print(f"\nServing {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+    
     return results_file, validation_file, viz_file
 
 if __name__ == "__main__":